@@ -0,0 +1,73 @@
+"""Snapshot codec benchmark: bytes on disk and encode/decode time per codec.
+
+    python -m backend.benchmarks.codecs --records 5000 --rounds 5
+
+주문 이력과 비슷한 중첩 레코드로 각 코덱의 크기와 인코딩/디코딩
+시간(최솟값)을 비교합니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from backend.data import codecs
+
+
+def _records(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"history-{i:06d}",
+            "store_id": "bench",
+            "table_number": i % 30 + 1,
+            "session_id": f"session-{i // 4:06d}",
+            "orders": [
+                {
+                    "id": f"order-{i:06d}-{j}",
+                    "order_number": f"20261018-{i * 3 + j:04d}",
+                    "status": "completed",
+                    "items": [
+                        {"menu_id": f"menu-{k}", "menu_name": f"메뉴 {k}",
+                         "quantity": k % 3 + 1, "unit_price": 9000, "subtotal": 9000}
+                        for k in range(3)
+                    ],
+                    "total_amount": 27000,
+                    "created_at": "2026-10-18T12:00:00Z",
+                }
+                for j in range(2)
+            ],
+            "total_session_amount": 54000,
+            "session_started_at": "2026-10-18T11:00:00Z",
+            "session_ended_at": "2026-10-18T13:00:00Z",
+            "archived_at": "2026-10-18T13:00:00Z",
+        }
+        for i in range(count)
+    ]
+
+
+def _best(fn, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(records: int, rounds: int) -> None:
+    data = _records(records)
+    print(f"{'codec':<13} {'bytes':>12} {'encode':>10} {'decode':>10}")
+    for name, codec in codecs.CODECS.items():
+        encoded = codec.encode(data)
+        assert codecs.decode(encoded) == data
+        encode_ms = _best(lambda: codec.encode(data), rounds)
+        decode_ms = _best(lambda: codecs.decode(encoded), rounds)
+        print(f"{name:<13} {len(encoded):>12,} {encode_ms:>8.1f}ms {decode_ms:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    main(args.records, args.rounds)
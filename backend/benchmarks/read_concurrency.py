@@ -0,0 +1,145 @@
+"""Concurrent read latency benchmark: exclusive lock vs reader/writer lock.
+
+    python -m backend.benchmarks.read_concurrency --readers 40 --records 2000 \
+        [--cache] [--io-latency-ms 5]
+
+같은 엔티티 파일을 동시에 읽어, 읽기가 배타 잠금을 잡던 이전 방식과
+공유 읽기 잠금의 지연 시간을 비교합니다. concurrent는 잠금 구간 안에
+동시에 있었던 읽기 수의 최댓값으로, exclusive는 항상 1이어야 합니다.
+
+측정 결과 (readers=40, records=2000, rounds=5, 로컬 디스크):
+
+    옵션                 exclusive                     rwlock
+    (없음)               p50=148.6ms wall=1500.9ms     p50=209.9ms wall=1648.1ms
+    --cache              p50= 11.7ms wall= 112.9ms     p50= 11.4ms wall= 102.7ms
+    --io-latency-ms 5    p50=268.8ms wall=2635.9ms     p50=166.8ms wall=1549.5ms
+
+로컬 디스크에서는 읽기 비용 대부분이 GIL을 잡는 디코딩이라 공유 잠금으로
+병렬화되지 않고, 동시에 디코딩하는 만큼 개별 지연이 늘어 오히려 약간
+느립니다. 캐시 적중 시에는 잠금 구간에 대기가 없어 두 방식이 같습니다.
+공유 잠금의 이득은 파일 읽기가 실제로 대기하는 경우(느린/네트워크 디스크)에
+한정되며, 이때 대기 시간이 겹쳐 wall이 약 40% 줄어듭니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from backend.data import datastore as datastore_module
+from backend.data.datastore import DataStore
+
+
+class CountingDataStore(DataStore):
+    """잠금 구간 안의 동시 보유자 수를 기록."""
+
+    force_exclusive = False
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.holders = 0
+        self.max_holders = 0
+
+    @asynccontextmanager
+    async def _locked(
+        self, entity: str, store_id: str, exclusive: bool = True,
+    ) -> AsyncIterator[None]:
+        async with super()._locked(entity, store_id, exclusive or self.force_exclusive):
+            self.holders += 1
+            self.max_holders = max(self.max_holders, self.holders)
+            try:
+                yield
+            finally:
+                self.holders -= 1
+
+
+class ExclusiveReadDataStore(CountingDataStore):
+    """읽기도 배타 잠금을 잡는 이전 동작."""
+
+    force_exclusive = True
+
+
+def _records(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"menu-{i:05d}",
+            "store_id": "bench",
+            "name": f"메뉴 {i}",
+            "price": 1000 + i,
+            "category": f"cat-{i % 8}",
+            "description": "벤치마크용 메뉴 설명" * 3,
+            "is_available": True,
+            "sort_order": i,
+        }
+        for i in range(count)
+    ]
+
+
+async def _measure(ds: DataStore, readers: int, rounds: int) -> list[float]:
+    latencies: list[float] = []
+
+    async def one_read() -> None:
+        start = time.perf_counter()
+        await ds.read("menus", "bench")
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    for _ in range(rounds):
+        await asyncio.gather(*(one_read() for _ in range(readers)))
+    return latencies
+
+
+def _report(label: str, latencies: list[float], elapsed: float, concurrent: int) -> None:
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:<10} reads={len(latencies):<5} "
+        f"p50={statistics.median(latencies):7.2f}ms "
+        f"p95={p95:7.2f}ms max={latencies[-1]:7.2f}ms "
+        f"wall={elapsed * 1000:8.1f}ms concurrent={concurrent}"
+    )
+
+
+def _with_latency(read: Callable, latency: float) -> Callable:
+    def slow_read(*args: object) -> list[dict]:
+        time.sleep(latency)  # I/O 스레드에서 GIL 없이 대기 (느린 디스크)
+        return read(*args)
+    return slow_read
+
+
+async def main(
+    readers: int, records: int, rounds: int, cache: bool, io_latency_ms: float,
+) -> None:
+    if io_latency_ms:
+        datastore_module._read_snapshot = _with_latency(
+            datastore_module._read_snapshot, io_latency_ms / 1000,
+        )
+    with tempfile.TemporaryDirectory() as tmp:
+        data = _records(records)
+        for label, cls in (("exclusive", ExclusiveReadDataStore), ("rwlock", CountingDataStore)):
+            ds = cls(
+                base_path=tmp, lock_timeout=60.0, cache_enabled=cache,
+                io_inline_threshold=0 if io_latency_ms else 64 * 1024,
+            )
+            await ds.write("menus", "bench", data)
+            start = time.perf_counter()
+            latencies = await _measure(ds, readers, rounds)
+            _report(label, latencies, time.perf_counter() - start, ds.max_holders)
+            await ds.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=40)
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--cache", action="store_true", help="resident cache 사용")
+    parser.add_argument(
+        "--io-latency-ms", type=float, default=0.0, help="파일 읽기마다 추가할 I/O 대기(ms)",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.readers, args.records, args.rounds, args.cache, args.io_latency_ms))
@@ -12,6 +12,72 @@ CORS_ORIGINS: list[str] = [
 
 DATA_DIR = os.environ.get("DATA_BASE_PATH", "data")
 
+# DataStore
+DATASTORE_BACKEND = os.environ.get("DATASTORE_BACKEND", "json")  # json | sqlite
+SQLITE_PATH = os.environ.get("SQLITE_PATH", os.path.join(DATA_DIR, "datastore.sqlite3"))
+DATASTORE_CACHE_ENABLED = os.environ.get("DATASTORE_CACHE_ENABLED", "true").lower() == "true"
+DATASTORE_JOURNAL_ENTITIES: list[str] = [
+    e.strip()
+    for e in os.environ.get(
+        "DATASTORE_JOURNAL_ENTITIES", "orders,order_history,sessions,sequences"
+    ).split(",")
+    if e.strip()
+]
+DATASTORE_JOURNAL_COMPACT_THRESHOLD = int(
+    os.environ.get("DATASTORE_JOURNAL_COMPACT_THRESHOLD", "500")
+)
+DATASTORE_GROUP_COMMIT_WINDOW = float(os.environ.get("DATASTORE_GROUP_COMMIT_WINDOW", "0.002"))
+DATASTORE_GROUP_COMMIT_MAX_BATCH = int(os.environ.get("DATASTORE_GROUP_COMMIT_MAX_BATCH", "256"))
+# 여러 uvicorn 워커가 같은 DATA_DIR을 공유할 때 필요 (fcntl, POSIX 전용)
+DATASTORE_PROCESS_LOCKS = os.environ.get(
+    "DATASTORE_PROCESS_LOCKS", "true" if os.name == "posix" else "false"
+).lower() == "true"
+
+# 저널/스냅샷 fsync 정책: os | batch | always (backend/data/durability.py)
+DATASTORE_FSYNC = os.environ.get("DATASTORE_FSYNC", "batch")
+DATASTORE_FSYNC_INTERVAL_MS = float(os.environ.get("DATASTORE_FSYNC_INTERVAL_MS", "5"))
+# 저널 백그라운드 체크포인트 주기(초), 0이면 비활성
+DATASTORE_CHECKPOINT_INTERVAL = float(os.environ.get("DATASTORE_CHECKPOINT_INTERVAL", "30"))
+
+# 스냅샷 파일 형식: json | json-compact | ndjson | binary (backend/data/codecs.py)
+DATASTORE_CODEC = os.environ.get("DATASTORE_CODEC", "json-compact")
+# 엔티티별 형식 지정: "order_history:binary,orders:ndjson"
+DATASTORE_ENTITY_CODECS: dict[str, str] = dict(
+    item.strip().split(":", 1)
+    for item in os.environ.get("DATASTORE_ENTITY_CODECS", "").split(",")
+    if ":" in item
+)
+
+# 파일 I/O·직렬화 전용 스레드 풀 크기와 인라인 처리 임계값(바이트)
+DATASTORE_IO_WORKERS = int(os.environ.get("DATASTORE_IO_WORKERS", "4"))
+DATASTORE_IO_INLINE_THRESHOLD = int(os.environ.get("DATASTORE_IO_INLINE_THRESHOLD", "65536"))
+
+# 매장 상주 한도: 미사용 시간(초), 상주 매장 수, 캐시 메모리(바이트). 0이면 제한 없음
+DATASTORE_STORE_IDLE_SECONDS = float(os.environ.get("DATASTORE_STORE_IDLE_SECONDS", "1800"))
+DATASTORE_MAX_RESIDENT_STORES = int(os.environ.get("DATASTORE_MAX_RESIDENT_STORES", "0"))
+DATASTORE_CACHE_BUDGET_BYTES = int(os.environ.get("DATASTORE_CACHE_BUDGET_BYTES", "0"))
+
+# 시작 시 캐시 워밍업: 대상 매장(비우면 전체), 엔티티, 동시 처리 매장 수
+DATASTORE_WARMUP_ENABLED = os.environ.get("DATASTORE_WARMUP_ENABLED", "true").lower() == "true"
+DATASTORE_WARMUP_STORES: list[str] = [
+    s.strip() for s in os.environ.get("DATASTORE_WARMUP_STORES", "").split(",") if s.strip()
+]
+DATASTORE_WARMUP_ENTITIES: list[str] = [
+    e.strip()
+    for e in os.environ.get("DATASTORE_WARMUP_ENTITIES", "menus,tables,sessions,orders").split(",")
+    if e.strip()
+]
+DATASTORE_WARMUP_CONCURRENCY = int(os.environ.get("DATASTORE_WARMUP_CONCURRENCY", "4"))
+
+# 지난 세션 보관 주기(초, 0이면 비활성)와 종료/만료 후 유예 시간(초)
+SESSION_ARCHIVE_INTERVAL = float(os.environ.get("SESSION_ARCHIVE_INTERVAL", "300"))
+SESSION_ARCHIVE_GRACE_SECONDS = float(os.environ.get("SESSION_ARCHIVE_GRACE_SECONDS", "600"))
+
+# 주문 생성 Idempotency-Key 보관 시간(초)과 메모리 최대 키 수.
+# 키는 매장의 idempotency_keys에도 저장되어 워커 간에 공유되고, 만료분은 세션 보관 주기에 삭제
+IDEMPOTENCY_TTL_SECONDS = float(os.environ.get("IDEMPOTENCY_TTL_SECONDS", "3600"))
+IDEMPOTENCY_MAX_KEYS = int(os.environ.get("IDEMPOTENCY_MAX_KEYS", "10000"))
+
 # JWT
 JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY", "dev-secret-key-change-in-production")
 JWT_ALGORITHM = "HS256"
@@ -1,3 +1,4 @@
 from backend.data.datastore import DataStore
+from backend.data.sqlite_store import SqliteDataStore
 
-__all__ = ["DataStore"]
+__all__ = ["DataStore", "SqliteDataStore"]
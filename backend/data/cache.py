@@ -0,0 +1,148 @@
+"""Resident in-memory entity cache for DataStore."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# (st_ino, st_mtime_ns, st_size) — 파일이 없으면 None
+FileSignature = tuple[int, int, int] | None
+
+# 인덱스 키: 필드명 튜플 (복합 인덱스 지원)
+IndexKey = tuple[str, ...]
+
+
+def file_signature(file_path: Path) -> FileSignature:
+    """캐시 무효화 판단용 파일 시그니처 (inode, mtime, size)."""
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class CacheEntry:
+    """엔티티 파일 1개에 대한 캐시 항목.
+
+    indexes는 조회 시점에 필드별로 지연 생성되며, 이후 레코드
+    추가/삭제/수정 시 add/remove/update로 동기화됩니다. 버킷 안의
+    레코드는 파일 순서를 유지합니다.
+    """
+
+    signature: object
+    records: list[dict]
+    indexes: dict[IndexKey, dict[tuple, list[dict]]] = field(default_factory=dict)
+
+    def lookup(self, fields: IndexKey, values: tuple) -> list[dict]:
+        index = self.indexes.get(fields)
+        if index is None:
+            index = {}
+            for record in self.records:
+                index.setdefault(_index_value(record, fields), []).append(record)
+            self.indexes[fields] = index
+        return index.get(values, [])
+
+    def add(self, record: dict) -> None:
+        for fields, index in self.indexes.items():
+            index.setdefault(_index_value(record, fields), []).append(record)
+
+    def update(self, record: dict, values: dict) -> None:
+        """record에 values 적용.
+
+        인덱스 필드가 그대로면 버킷 내 위치를 유지하고, 바뀌면 해당
+        인덱스를 버려 다음 조회 때 파일 순서대로 다시 만듭니다.
+        """
+        changed = [
+            fields for fields in self.indexes
+            if any(f in values and values[f] != record.get(f) for f in fields)
+        ]
+        for fields in changed:
+            del self.indexes[fields]
+        record.update(values)
+
+    def remove(self, record: dict) -> None:
+        for fields, index in self.indexes.items():
+            value = _index_value(record, fields)
+            bucket = index.get(value, [])
+            for i, r in enumerate(bucket):
+                if r is record:
+                    del bucket[i]
+                    break
+            if not bucket:
+                index.pop(value, None)
+
+
+def _index_value(record: dict, fields: IndexKey) -> tuple:
+    return tuple(record.get(f) for f in fields)
+
+
+class EntityCache:
+    """(entity, store_id) 단위 write-through 캐시.
+
+    시그니처(파일 시그니처 또는 그 튜플)가 바뀌면(외부 수정)
+    항목을 폐기하고 다시 읽습니다. 매장 단위 축출을 위해
+    항목은 store_id별로 묶어 보관합니다.
+    """
+
+    def __init__(self) -> None:
+        self._stores: dict[str, dict[str, CacheEntry]] = {}
+
+    def get(
+        self, entity: str, store_id: str, signature: object,
+    ) -> list[dict] | None:
+        entry = self.entry(entity, store_id)
+        if entry is None:
+            return None
+        if entry.signature != signature:
+            self.invalidate(entity, store_id)
+            return None
+        return entry.records
+
+    def entry(self, entity: str, store_id: str) -> CacheEntry | None:
+        return self._stores.get(store_id, {}).get(entity)
+
+    def put(
+        self, entity: str, store_id: str,
+        signature: object, records: list[dict],
+    ) -> None:
+        """항목 저장. 같은 리스트의 write-through면 인덱스를 유지."""
+        entries = self._stores.setdefault(store_id, {})
+        entry = entries.get(entity)
+        if entry is not None and entry.records is records:
+            entry.signature = signature
+            return
+        entries[entity] = CacheEntry(signature, records)
+
+    def invalidate(self, entity: str, store_id: str) -> None:
+        entries = self._stores.get(store_id)
+        if entries is not None:
+            entries.pop(entity, None)
+            if not entries:
+                del self._stores[store_id]
+
+    def drop_store(self, store_id: str) -> None:
+        self._stores.pop(store_id, None)
+
+    def store_bytes(self, store_id: str) -> int:
+        """매장 캐시의 원본 파일 크기 합 (메모리 사용량 추정치)."""
+        return sum(
+            _signature_bytes(entry.signature)
+            for entry in self._stores.get(store_id, {}).values()
+        )
+
+    def clear(self) -> None:
+        self._stores.clear()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._stores.values())
+
+
+def _signature_bytes(signature: object) -> int:
+    # FileSignature (ino, mtime_ns, size) 또는 (스냅샷, 저널) 시그니처 튜플
+    if not isinstance(signature, tuple):
+        return 0
+    if len(signature) == 3 and all(isinstance(v, int) for v in signature):
+        return signature[2]
+    return sum(_signature_bytes(s) for s in signature)
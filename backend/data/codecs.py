@@ -0,0 +1,196 @@
+"""Snapshot serialization codecs for DataStore entity files.
+
+    json          들여쓰기 JSON 배열 (기존 형식, 사람이 읽기 쉬움)
+    json-compact  공백 없는 JSON 배열
+    ndjson        레코드당 한 줄 JSON
+    binary        매직 헤더 + 길이 접두 compact JSON 레코드
+
+읽기는 파일 앞부분으로 형식을 자동 판별하므로 엔티티의 코덱을
+바꿔도 기존 파일을 그대로 읽고, 다음 스냅샷부터 새 형식으로 기록됩니다.
+저널(.journal.jsonl)은 코덱과 무관하게 항상 JSONL입니다.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import struct
+from typing import BinaryIO, Iterator
+
+# 레코드 값은 JSON 호환 타입(dict/list/str/int/float/bool/None)이어야 합니다.
+# 레코드 본문은 Python 버전과 무관한 UTF-8 JSON.
+BINARY_MAGIC = b"TOREC\x01"
+_LENGTH = struct.Struct("<I")
+# 스트리밍 디코딩 시 한 번에 읽는 크기
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class Codec:
+    """레코드 목록 ↔ 바이트 변환."""
+
+    name = ""
+
+    def encode(self, records: list[dict]) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, content: bytes) -> list[dict]:
+        raise NotImplementedError
+
+    def iter_decode(self, f: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[dict]:
+        """파일에서 레코드를 하나씩 디코딩 (전체 내용을 메모리에 올리지 않음)."""
+        yield from self.decode(f.read())
+
+
+class JsonCodec(Codec):
+    name = "json"
+
+    def encode(self, records: list[dict]) -> bytes:
+        return json.dumps(records, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def decode(self, content: bytes) -> list[dict]:
+        return json.loads(content)
+
+    def iter_decode(self, f: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[dict]:
+        # 배열 요소를 raw_decode로 하나씩 파싱, 요소가 청크 경계에 걸리면 더 읽어 재시도
+        text = io.TextIOWrapper(f, encoding="utf-8")
+        decoder = json.JSONDecoder()
+        buf, pos, eof, started = "", 0, False, False
+        while True:
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n,":
+                    pos += 1
+                if pos < len(buf) or eof:
+                    break
+                buf, pos = text.read(chunk_size), 0
+                eof = not buf
+            if pos >= len(buf):
+                if not started:
+                    return
+                raise ValueError("unterminated JSON array")
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError("expected JSON array")
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == "]":
+                return
+            try:
+                record, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                more = "" if eof else text.read(chunk_size)
+                if not more:
+                    raise
+                buf, pos = buf[pos:] + more, 0
+                continue
+            yield record
+
+
+class CompactJsonCodec(JsonCodec):
+    name = "json-compact"
+
+    def encode(self, records: list[dict]) -> bytes:
+        return json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class NdjsonCodec(Codec):
+    name = "ndjson"
+
+    def encode(self, records: list[dict]) -> bytes:
+        return "".join(
+            json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in records
+        ).encode("utf-8")
+
+    def decode(self, content: bytes) -> list[dict]:
+        return [json.loads(line) for line in content.splitlines() if line.strip()]
+
+    def iter_decode(self, f: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[dict]:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class BinaryCodec(Codec):
+    """레코드마다 4바이트 길이 + compact JSON.
+
+    길이 접두 덕분에 레코드 경계를 파싱 없이 찾을 수 있어 스트리밍
+    디코딩이 단순하고, 잘린 파일을 확실히 감지합니다.
+    """
+
+    name = "binary"
+
+    def encode(self, records: list[dict]) -> bytes:
+        parts = [BINARY_MAGIC]
+        for record in records:
+            payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            parts.append(_LENGTH.pack(len(payload)))
+            parts.append(payload)
+        return b"".join(parts)
+
+    def decode(self, content: bytes) -> list[dict]:
+        if not content.startswith(BINARY_MAGIC):
+            raise ValueError("missing binary header")
+        view = memoryview(content)
+        offset = len(BINARY_MAGIC)
+        records: list[dict] = []
+        while offset < len(view):
+            if offset + _LENGTH.size > len(view):
+                raise ValueError("truncated binary record header")
+            (size,) = _LENGTH.unpack_from(view, offset)
+            offset += _LENGTH.size
+            if offset + size > len(view):
+                raise ValueError("truncated binary record")
+            records.append(json.loads(bytes(view[offset:offset + size])))
+            offset += size
+        return records
+
+    def iter_decode(self, f: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[dict]:
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError("missing binary header")
+        while header := f.read(_LENGTH.size):
+            if len(header) < _LENGTH.size:
+                raise ValueError("truncated binary record header")
+            (size,) = _LENGTH.unpack(header)
+            payload = f.read(size)
+            if len(payload) < size:
+                raise ValueError("truncated binary record")
+            yield json.loads(payload)
+
+
+CODECS: dict[str, Codec] = {
+    codec.name: codec
+    for codec in (JsonCodec(), CompactJsonCodec(), NdjsonCodec(), BinaryCodec())
+}
+
+
+def get_codec(name: str) -> Codec:
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown codec: {name}") from None
+
+
+def detect(content: bytes) -> Codec:
+    """파일 내용으로 형식 판별 (JSON 배열은 들여쓰기 여부와 무관하게 json)."""
+    if content.startswith(BINARY_MAGIC):
+        return CODECS["binary"]
+    head = content[:64].lstrip()[:1]
+    if head == b"{":
+        return CODECS["ndjson"]
+    return CODECS["json"]
+
+
+def decode(content: bytes) -> list[dict]:
+    """형식을 자동 판별해 디코딩. 빈 내용은 빈 목록."""
+    if not content or content.isspace():
+        return []
+    return detect(content).decode(content)
+
+
+def iter_decode(f: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[dict]:
+    """파일 앞부분으로 형식을 판별해 레코드를 하나씩 디코딩 (f는 seek 가능해야 함)."""
+    head = f.read(64)
+    f.seek(0)
+    if not head:
+        return iter(())
+    return detect(head).iter_decode(f, chunk_size)
@@ -0,0 +1,81 @@
+"""Offline converter that rewrites DataStore snapshot files in another codec.
+
+    python -m backend.data.convert --data-dir data --codec binary [--entity orders ...]
+
+서버를 중지한 상태에서 실행합니다. 스냅샷(*.json)만 변환하며
+저널(.journal.jsonl)은 그대로 두므로 변환 후에도 재적용됩니다.
+파일 이름은 형식과 무관하게 유지되고, 읽을 때 형식을 자동 판별합니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+from pathlib import Path
+
+from backend.data import codecs
+
+logger = logging.getLogger("datastore")
+
+
+def snapshot_files(data_dir: Path, entities: set[str] | None = None) -> list[Path]:
+    """변환 대상 스냅샷 파일 (임시/잠금 파일 제외, 파티션 포함)."""
+    found: list[Path] = []
+    for path in sorted(data_dir.rglob("*.json")):
+        if path.name.startswith("."):
+            continue
+        parts = path.relative_to(data_dir).parts
+        # stores.json → stores, {store}/orders.json → orders,
+        # {store}/order_history/2026-10.json → order_history
+        entity = parts[0][:-len(".json")] if len(parts) == 1 else parts[1].split(".", 1)[0]
+        if entities is None or entity in entities:
+            found.append(path)
+    return found
+
+
+def convert_file(path: Path, codec: codecs.Codec) -> tuple[int, int]:
+    """파일을 codec 형식으로 원자적 재기록. (이전 바이트, 새 바이트) 반환."""
+    content = path.read_bytes()
+    encoded = codec.encode(codecs.decode(content))
+    tmp_path = path.with_name(path.name + ".convert.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(encoded)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(content), len(encoded)
+
+
+def convert(
+    data_dir: str, codec_name: str, entities: set[str] | None = None,
+) -> dict[str, tuple[int, int]]:
+    """데이터 디렉토리의 스냅샷을 변환. {상대 경로: (이전 바이트, 새 바이트)} 반환."""
+    codec = codecs.get_codec(codec_name)
+    results: dict[str, tuple[int, int]] = {}
+    root = Path(data_dir)
+    for path in snapshot_files(root, entities):
+        before, after = convert_file(path, codec)
+        results[str(path.relative_to(root))] = (before, after)
+        logger.info(
+            "converted: file=%s, codec=%s, bytes=%d->%d", path, codec.name, before, after,
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rewrite DataStore snapshots in another codec.")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--codec", required=True, choices=sorted(codecs.CODECS))
+    parser.add_argument("--entity", action="append", help="대상 엔티티 (반복 지정, 기본 전체)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    results = convert(args.data_dir, args.codec, set(args.entity) if args.entity else None)
+    before = sum(b for b, _ in results.values())
+    after = sum(a for _, a in results.values())
+    print(f"converted {len(results)} files to {args.codec}: {before} -> {after} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,46 +3,306 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import logging
 import os
-from contextlib import asynccontextmanager
+import re
+import time
+import uuid
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import AsyncIterator
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping
 
-import aiofiles
-
-from backend.exceptions import ConcurrencyError, NotFoundError
+from backend.data import codecs, durability, journal, mutations, query
+from backend.data.cache import CacheEntry, EntityCache, IndexKey, file_signature
+from backend.data.executor import IOExecutor
+from backend.data.filelock import FileLock, fcntl, process_locks_supported
+from backend.data.mutations import Mutation, Predicate
+from backend.data.query import OrderBy, Where
+from backend.data.residency import StoreResidency
+from backend.data.rwlock import RWLock
+from backend.data.transaction import Transaction
+from backend.exceptions import ConcurrencyError
 
 logger = logging.getLogger("datastore")
 
+# 엔티티별 해시 인덱스 선언 (필드명 또는 복합 인덱스용 필드명 튜플)
+DEFAULT_INDEXES: dict[str, tuple[str | tuple[str, ...], ...]] = {
+    "menus": ("id",),
+    "tables": ("id", "table_number"),
+    "sessions": ("id", ("table_number", "status")),
+    "orders": ("id", "session_id", "table_number"),
+    "sequences": ("id",),
+}
+
+# 월 단위로 파티션하는 엔티티: {entity: 파티션 키 필드 (ISO 8601 문자열)}
+DEFAULT_PARTITIONS: dict[str, str] = {
+    "order_history": "session_ended_at",
+    "session_archive": "archived_at",
+}
+
+_PARTITION_KEY = re.compile(r"^\d{4}-\d{2}")
+
 
 class DataStore:
     """JSON 파일 기반 데이터 저장소.
 
-    엔티티별 개별 JSON 파일을 관리하며, asyncio.Lock 기반
-    동시성 제어와 원자적 쓰기를 제공합니다.
+    엔티티별 개별 JSON 파일을 관리하며, 읽기 공유/쓰기 배타
+    RWLock 기반 동시성 제어와 원자적 쓰기를 제공합니다.
+
+    cache_enabled=True이면 엔티티 데이터를 메모리에 상주시키고
+    쓰기 시 갱신(write-through)합니다. 파일의 inode/mtime/size가
+    바뀌면 캐시를 폐기하고 다시 읽습니다.
+
+    journal_entities에 포함된 엔티티는 추가/수정/삭제를
+    `{entity}.journal.jsonl`에 한 줄씩 기록하고, 항목 수가
+    journal_compact_threshold에 도달하면 스냅샷으로 컴팩션합니다.
+
+    indexes에 선언된 필드는 캐시 사용 시 메모리 해시 인덱스로
+    유지되어 find_by/find_by_id가 O(1)로 동작합니다.
+
+    append/update/delete/write는 엔티티별 대기열을 거쳐 group commit
+    되므로, 동시에 들어온 변경은 한 번의 쓰기로 영속화됩니다.
+
+    process_locks=True이면 프로세스 내 RWLock에 더해 엔티티별 잠금
+    파일(`.locks/` 아래, 첫 쓰기 때 생성)에 flock을 걸어 여러 워커
+    프로세스가 같은 데이터 디렉토리를 안전하게 공유합니다. 다른 프로세스의 쓰기는 파일 시그니처 변경으로
+    감지되어 캐시가 갱신됩니다.
+
+    partitions에 선언된 엔티티는 키 필드의 연-월로 나뉘어
+    `{store_id}/{entity}/YYYY-MM.json`에 저장되며, read_range()는
+    조회 구간과 겹치는 파티션만 읽습니다. 키가 없는 레코드와 파티션
+    도입 전 데이터는 기존 `{entity}.json`에 남습니다(처음 접근 시 이동).
+
+    스냅샷 파일 형식은 codec(기본값)과 entity_codecs(엔티티별)로
+    선택하며, 읽을 때는 형식을 자동 판별합니다(codecs 모듈 참고).
+
+    파일 I/O와 인코딩/디코딩은 io_inline_threshold 바이트 이상이면
+    전용 스레드 풀(io_workers개)에서 실행되어 이벤트 루프를 막지 않습니다.
+    지표는 io_metrics()로 확인합니다.
+
+    fsync는 저널/스냅샷의 내구성 정책입니다(durability 모듈 참고). 저널 추가의
+    fsync는 엔티티 Lock을 놓은 뒤 기다리므로 그동안 읽기가 막히지 않습니다.
+    checkpoint_interval > 0이면 start() 이후 백그라운드에서 주기적으로
+    저널을 스냅샷으로 체크포인트하고, 시작 시에는 스냅샷 위에 저널을
+    재적용해 마지막 상태를 복원합니다.
+
+    transaction()은 여러 엔티티의 변경을 모아 파일당 한 번씩 기록하며,
+    커밋 마커를 먼저 남겨 중간에 크래시가 나도 재시작 시 롤포워드합니다.
+
+    매장별 상태(Lock, 대기열, 캐시)는 처음 접근할 때 만들어지며,
+    store_idle_seconds 동안 쓰이지 않거나 max_resident_stores /
+    cache_budget_bytes를 넘으면 사용 중이 아닌 오래된 매장부터 메모리에서
+    내립니다(residency 모듈 참고). 내린 매장은 다음 접근 시 다시 읽습니다.
     """
 
-    def __init__(self, base_path: str = "data", lock_timeout: float = 5.0) -> None:
+    def __init__(
+        self,
+        base_path: str = "data",
+        lock_timeout: float = 5.0,
+        cache_enabled: bool = False,
+        journal_entities: Iterable[str] = (),
+        journal_compact_threshold: int = 500,
+        indexes: Mapping[str, Iterable[str | tuple[str, ...]]] | None = None,
+        group_commit_window: float = 0.0,
+        group_commit_max_batch: int = 256,
+        process_locks: bool = False,
+        partitions: Mapping[str, str] | None = None,
+        fsync: str = durability.FSYNC_OS,
+        fsync_interval: float = 0.005,
+        checkpoint_interval: float = 0.0,
+        codec: str = "json",
+        entity_codecs: Mapping[str, str] | None = None,
+        io_workers: int = 4,
+        io_inline_threshold: int = 64 * 1024,
+        store_idle_seconds: float = 0.0,
+        max_resident_stores: int = 0,
+        cache_budget_bytes: int = 0,
+    ) -> None:
         self._base_path = Path(base_path)
         self._lock_timeout = lock_timeout
-        self._locks: dict[str, asyncio.Lock] = {}
+        self._cache: EntityCache | None = EntityCache() if cache_enabled else None
+        # 매장별 Lock/대기열 상주 관리 (축출 시 캐시도 함께 정리)
+        self._residency = StoreResidency(
+            idle_seconds=store_idle_seconds,
+            max_stores=max_resident_stores,
+            memory_budget=cache_budget_bytes,
+            size_of=self._cache.store_bytes if self._cache is not None else (lambda store_id: 0),
+            on_evict=self._on_store_evicted,
+        )
+        self._sweep_task: asyncio.Task | None = None
+        self._journal_entities = frozenset(journal_entities)
+        self._journal_compact_threshold = journal_compact_threshold
+        # {(entity, store_id): 스냅샷 이후 저널 항목 수}
+        self._journal_sizes: dict[tuple[str, str], int] = {}
+        # 이 인스턴스의 마지막 쓰기 전후 시그니처 (written_signature 참고)
+        self._written: dict[tuple[str, str], tuple[object, object]] = {}
+        self._indexes: dict[str, frozenset[IndexKey]] = {
+            entity: frozenset(_index_key(f) for f in fields)
+            for entity, fields in (DEFAULT_INDEXES if indexes is None else indexes).items()
+        }
+        self._group_commit_window = group_commit_window
+        self._group_commit_max_batch = group_commit_max_batch
+        if process_locks and not process_locks_supported():
+            raise ValueError("process_locks requires fcntl (POSIX only)")
+        self._process_locks = process_locks
+        self._partitions = dict(DEFAULT_PARTITIONS if partitions is None else partitions)
+        # 레거시 단일 파일 분할을 마친 (entity, store_id)
+        self._partitions_split: set[tuple[str, str]] = set()
+        if fsync not in durability.FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self._fsync = fsync
+        self._checkpoint_interval = checkpoint_interval
+        self._checkpoint_task: asyncio.Task | None = None
+        self._io = IOExecutor(max_workers=io_workers, inline_threshold=io_inline_threshold)
+        self._batcher = durability.SyncBatcher(fsync_interval, self._io.run)
+        # iter()가 전용 풀에서 한 번에 디코딩하는 레코드 수
+        self._stream_batch = 256
+        self._codec = codecs.get_codec(codec)
+        self._entity_codecs = {
+            entity: codecs.get_codec(name) for entity, name in (entity_codecs or {}).items()
+        }
         self._base_path.mkdir(parents=True, exist_ok=True)
+        self._lock_dir = self._base_path / ".locks"
+        self._recover_commits()
+
+    # ── Lifecycle ──
+
+    async def start(self) -> None:
+        """디스크에 남은 저널 복구 후 백그라운드 체크포인트 시작.
+
+        이전 프로세스가 남긴 저널을 스냅샷 위에 재적용해 컴팩션하므로
+        시작 직후의 첫 읽기가 긴 저널을 파싱하지 않습니다.
+        """
+        recovered = 0
+        for entity, store_id in self._discover_journals():
+            if not self._is_journaled(entity):
+                logger.warning(
+                    "journal_ignored: entity=%s, store_id=%s (not a journal entity)",
+                    entity, store_id,
+                )
+                continue
+            await self.compact(entity, store_id)
+            recovered += 1
+        if recovered:
+            logger.info("journal_recovered: journals=%d", recovered)
+        if self._checkpoint_interval > 0 and self._checkpoint_task is None:
+            self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
+        if self._residency.idle_seconds > 0 and self._sweep_task is None:
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+    async def close(self) -> None:
+        """백그라운드 작업 중지, 대기 중인 fsync 완료 후 저널을 스냅샷으로 정리.
+
+        마지막으로 전용 I/O 스레드 풀을 종료하므로 close 이후에는 쓰지 않습니다.
+        """
+        for task in (self._checkpoint_task, self._sweep_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._checkpoint_task = self._sweep_task = None
+        await self._batcher.flush()
+        await self.checkpoint()
+        self._io.shutdown()
+
+    async def checkpoint(self) -> int:
+        """항목이 남은 저널을 모두 스냅샷으로 컴팩션. 처리한 파일 수 반환."""
+        targets = [key for key, size in self._journal_sizes.items() if size > 0]
+        for entity, store_id in targets:
+            await self.compact(entity, store_id)
+        if targets:
+            logger.info("checkpoint: journals=%d", len(targets))
+        return len(targets)
+
+    def _discover_journals(self) -> list[tuple[str, str]]:
+        suffix = ".journal.jsonl"
+        found: list[tuple[str, str]] = []
+        for path in sorted(self._base_path.rglob(f"*{suffix}")):
+            parts = path.relative_to(self._base_path).parts
+            if len(parts) == 1:
+                found.append((parts[0][:-len(suffix)], ""))
+            else:
+                found.append(("/".join(parts[1:])[:-len(suffix)], parts[0]))
+        return found
+
+    async def _checkpoint_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._checkpoint_interval)
+            try:
+                await self.checkpoint()
+            except Exception as e:
+                # 다음 주기에 재시도 (저널이 남아 있어 데이터 손실 없음)
+                logger.error("checkpoint_failed: error=%s", str(e))
+
+    # ── Store Residency ──
+
+    async def _sweep_loop(self) -> None:
+        interval = max(self._residency.idle_seconds / 2, 0.01)
+        while True:
+            await asyncio.sleep(interval)
+            self._residency.evict_idle()
+
+    def _on_store_evicted(self, store_id: str) -> None:
+        """축출된 매장의 캐시와 부속 상태 정리.
+
+        스냅샷 이후 항목이 남은 저널 크기는 checkpoint 대상이므로 유지합니다.
+        """
+        if self._cache is not None:
+            self._cache.drop_store(store_id)
+        self._partitions_split = {k for k in self._partitions_split if k[1] != store_id}
+        for key in [k for k, v in self._journal_sizes.items() if k[1] == store_id and not v]:
+            del self._journal_sizes[key]
+
+    def evict_idle_stores(self) -> list[str]:
+        """idle 기준을 넘은 매장을 즉시 축출. 축출된 store_id 목록 반환."""
+        return self._residency.evict_idle()
+
+    def residency_stats(self) -> dict:
+        """상주 매장 수, 누적 축출 수, 캐시 항목 수."""
+        stats = self._residency.stats()
+        stats["cached_entities"] = len(self._cache) if self._cache is not None else 0
+        return stats
 
     # ── Lock Management ──
 
-    def _get_lock(self, entity: str, store_id: str) -> asyncio.Lock:
-        key = f"{entity}_{store_id}"
-        if key not in self._locks:
-            self._locks[key] = asyncio.Lock()
-        return self._locks[key]
+    def _get_lock(self, entity: str, store_id: str) -> RWLock:
+        return self._residency.touch(store_id).locks.setdefault(entity, RWLock())
+
+    def _get_lock_file_path(self, entity: str, store_id: str) -> Path:
+        # 매장 디렉토리가 아닌 전용 디렉토리 한 곳에 평탄하게 둠
+        name = entity.replace("/", "~")
+        return self._lock_dir / (f"{store_id}@{name}.lock" if store_id else f"{name}.lock")
 
-    async def _acquire_lock(self, entity: str, store_id: str) -> asyncio.Lock:
+    async def _acquire_lock(
+        self, entity: str, store_id: str, exclusive: bool = True,
+    ) -> tuple[RWLock, int | None]:
+        """프로세스 내 Lock → (옵션) 프로세스 간 flock 순서로 획득."""
         lock = self._get_lock(entity, store_id)
+        acquire = lock.acquire_write if exclusive else lock.acquire_read
+        release = lock.release_write if exclusive else lock.release_read
+        deadline = time.monotonic() + self._lock_timeout
         try:
-            await asyncio.wait_for(lock.acquire(), timeout=self._lock_timeout)
-        except asyncio.TimeoutError:
+            await asyncio.wait_for(acquire(), timeout=self._lock_timeout)
+            fd = None
+            if self._process_locks:
+                file_lock = FileLock(self._get_lock_file_path(entity, store_id))
+                try:
+                    # 잠금 파일은 첫 쓰기에서 생성. 읽기는 파일이 없으면(쓴 적 없는
+                    # 엔티티) 잠그지 않아 없는 매장 조회가 파일을 만들지 않음
+                    fd = await file_lock.acquire(
+                        exclusive, deadline - time.monotonic(), create=exclusive,
+                    )
+                except BaseException:
+                    release()
+                    raise
+        except (asyncio.TimeoutError, TimeoutError):
             logger.error(
                 "lock_timeout: entity=%s, store_id=%s, timeout=%ss",
                 entity, store_id, self._lock_timeout,
@@ -51,15 +311,28 @@ class DataStore:
                 f"Lock timeout for {entity}_{store_id} "
                 f"after {self._lock_timeout}s"
             )
-        return lock
+        return lock, fd
 
     @asynccontextmanager
-    async def _locked(self, entity: str, store_id: str) -> AsyncIterator[None]:
-        lock = await self._acquire_lock(entity, store_id)
+    async def _locked(
+        self, entity: str, store_id: str, exclusive: bool = True,
+    ) -> AsyncIterator[None]:
+        """엔티티 Lock 보유 구간. 읽기는 exclusive=False로 공유 잠금."""
+        state = self._residency.touch(store_id)
+        state.pins += 1
         try:
-            yield
+            lock, fd = await self._acquire_lock(entity, store_id, exclusive)
+            try:
+                yield
+            finally:
+                if fd is not None:
+                    FileLock.release(fd)
+                if exclusive:
+                    lock.release_write()
+                else:
+                    lock.release_read()
         finally:
-            lock.release()
+            state.pins -= 1
 
     # ── Path Resolution ──
 
@@ -68,6 +341,13 @@ class DataStore:
             return self._base_path / "stores.json"
         return self._base_path / store_id / f"{entity}.json"
 
+    def _get_journal_path(self, entity: str, store_id: str) -> Path:
+        return self._get_file_path(entity, store_id).with_suffix(".journal.jsonl")
+
+    def _is_journaled(self, entity: str) -> bool:
+        # 파티션("order_history/2026-10")은 상위 엔티티 설정을 따름
+        return entity.split("/", 1)[0] in self._journal_entities
+
     def _ensure_directory(self, file_path: Path) -> None:
         file_path.parent.mkdir(parents=True, exist_ok=True)
         if file_path.parent != self._base_path:
@@ -75,103 +355,1003 @@ class DataStore:
 
     # ── File I/O ──
 
+    def _codec_for(self, entity: str) -> codecs.Codec:
+        # 파티션("order_history/2026-10")은 상위 엔티티 설정을 따름
+        return self._entity_codecs.get(entity.split("/", 1)[0], self._codec)
+
     async def _read_file(self, file_path: Path) -> list[dict]:
-        if not file_path.exists():
+        signature = file_signature(file_path)
+        if signature is None:
             return []
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                content = await f.read()
-            return json.loads(content)
-        except (json.JSONDecodeError, ValueError) as e:
+            return await self._io.run(_read_snapshot, file_path, size=signature[2])
+        except FileNotFoundError:
+            return []
+        except (ValueError, EOFError, TypeError) as e:
             logger.error(
                 "json_parse_failed: file=%s, error=%s", file_path, str(e)
             )
             return []
 
-    async def _atomic_write(self, file_path: Path, data: list[dict]) -> None:
+    async def _atomic_write(self, file_path: Path, content: bytes) -> None:
         self._ensure_directory(file_path)
         tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
         try:
-            async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(data, ensure_ascii=False, indent=2))
+            await self._io.run(_write_bytes, tmp_path, content, size=len(content))
+            await self._sync_now([tmp_path])
             os.replace(str(tmp_path), str(file_path))
+            await self._sync_now([], [file_path.parent])
+        except Exception:
+            if tmp_path.exists():
+                tmp_path.unlink(missing_ok=True)
+            raise
+
+    async def _read_journal(self, journal_path: Path) -> list[dict]:
+        signature = file_signature(journal_path)
+        if signature is None:
+            return []
+        try:
+            return await self._io.run(_read_journal_entries, journal_path, size=signature[2])
+        except FileNotFoundError:
+            return []
+
+    async def _append_journal(self, journal_path: Path, entries: list[dict]) -> bool:
+        """저널에 항목 추가. 파일을 새로 만들었으면 True."""
+        self._ensure_directory(journal_path)
+        new_file = not journal_path.exists()
+        content = journal.encode_entries(entries).encode("utf-8")
+        await self._io.run(_append_bytes, journal_path, content, size=len(content))
+        return new_file
+
+    async def _sync_journal(self, journal_path: Path, new_file: bool) -> None:
+        if self._fsync == durability.FSYNC_BATCH:
+            await self._batcher.sync(journal_path, new_file)
+        else:
+            await self._sync_now([journal_path], [journal_path.parent] if new_file else [])
+
+    async def _sync_now(self, files: list[Path], directories: list[Path] = ()) -> None:
+        """os 정책이 아니면 즉시 fsync (스냅샷/커밋 마커는 batch에서도 즉시)."""
+        if self._fsync == durability.FSYNC_OS:
+            return
+        await self._io.run(durability.sync_paths, files, directories)
+
+    async def _encode(self, entity: str, store_id: str, data: list[dict]) -> bytes:
+        """스냅샷 인코딩. 현재 파일 크기로 비용을 추정해 큰 파일은 전용 풀에서."""
+        signature = file_signature(self._get_file_path(entity, store_id))
+        size = signature[2] if signature is not None else 0
+        return await self._io.run(self._codec_for(entity).encode, data, size=size)
+
+    def io_metrics(self) -> dict:
+        """전용 I/O 풀 지표 (대기 깊이, 인라인/오프로드 건수, 누적 시간)."""
+        return self._io.metrics()
+
+    # ── Load / Store ──
+
+    def _signature(self, entity: str, store_id: str) -> object:
+        signature = file_signature(self._get_file_path(entity, store_id))
+        if self._is_journaled(entity):
+            return (signature, file_signature(self._get_journal_path(entity, store_id)))
+        return signature
+
+    async def _read_entity(self, entity: str, store_id: str) -> list[dict]:
+        data = await self._read_file(self._get_file_path(entity, store_id))
+        if self._is_journaled(entity):
+            entries = await self._read_journal(self._get_journal_path(entity, store_id))
+            self._journal_sizes[(entity, store_id)] = len(entries)
+            data = journal.replay(data, entries)
+        return data
+
+    async def _load(self, entity: str, store_id: str) -> list[dict]:
+        """엔티티 데이터 로드 (공유 또는 배타 Lock 보유 상태에서 호출).
+
+        캐시 사용 시 캐시가 소유한 리스트를 그대로 반환하므로
+        호출자는 외부로 내보낼 때 반드시 복사해야 합니다.
+        """
+        if self._cache is None:
+            return await self._read_entity(entity, store_id)
+        signature = self._signature(entity, store_id)
+        cached = self._cache.get(entity, store_id, signature)
+        if cached is not None:
+            return cached
+        data = await self._read_entity(entity, store_id)
+        self._cache.put(entity, store_id, signature, data)
+        return data
+
+    async def _store(
+        self,
+        entity: str,
+        store_id: str,
+        data: list[dict],
+        entries: list[dict] | None = None,
+    ) -> Callable[[], Awaitable[None]] | None:
+        """엔티티 데이터 저장 (Lock 보유 상태에서 호출).
+
+        저널 엔티티이고 entries가 주어지면 저널에 해당 항목만 추가하고,
+        그 외에는 data 전체를 스냅샷으로 기록합니다. 저널 추가의 fsync는
+        기다리지 않고 대기 함수로 반환하므로, 호출자는 Lock을 놓은 뒤
+        그것을 기다려야 합니다(스냅샷은 반환 전에 fsync).
+        """
+        key = (entity, store_id)
+        before = self._signature(entity, store_id)
+        pending_sync = None
+        try:
+            if entries is not None and self._is_journaled(entity):
+                journal_path = self._get_journal_path(entity, store_id)
+                new_file = await self._append_journal(journal_path, entries)
+                self._journal_sizes[key] = self._journal_sizes.get(key, 0) + len(entries)
+                if self._journal_sizes[key] >= self._journal_compact_threshold:
+                    await self._write_snapshot(entity, store_id, data)
+                elif self._fsync != durability.FSYNC_OS:
+                    pending_sync = partial(self._sync_journal, journal_path, new_file)
+            else:
+                await self._write_snapshot(entity, store_id, data)
         except Exception:
+            # 캐시 리스트가 이미 수정되었을 수 있으므로 폐기
+            if self._cache is not None:
+                self._cache.invalidate(entity, store_id)
+            raise
+        after = self._signature(entity, store_id)
+        self._written[key] = (before, after)
+        if self._cache is not None:
+            self._cache.put(entity, store_id, after, data)
+        return pending_sync
+
+    async def _write_snapshot(self, entity: str, store_id: str, data: list[dict]) -> None:
+        """스냅샷 기록 후 저널 비우기.
+
+        저널이 남아 있으면 스냅샷 교체와 저널 삭제를 커밋 마커로 묶어,
+        그 사이 크래시가 나도 이전 저널이 새 스냅샷 위에 재적용되지 않게 합니다.
+        """
+        file_path = self._get_file_path(entity, store_id)
+        journal_path = self._get_journal_path(entity, store_id)
+        if self._is_journaled(entity) and (
+            self._journal_sizes.get((entity, store_id)) or journal_path.exists()
+        ):
+            content = await self._encode(entity, store_id, data)
+            await self._commit_changes([_FileChange(file_path, journal_path, content=content)])
+            logger.info(
+                "journal_compacted: entity=%s, store_id=%s, records=%d",
+                entity, store_id, len(data),
+            )
+        else:
+            await self._atomic_write(file_path, await self._encode(entity, store_id, data))
+        if self._is_journaled(entity):
+            self._journal_sizes[(entity, store_id)] = 0
+
+    # ── Crash-Safe Multi-File Commit ──
+
+    def _commit_lock_path(self) -> Path:
+        return self._lock_dir / "commit.lock"
+
+    async def _commit_changes(self, changes: list[_FileChange]) -> None:
+        """여러 파일 변경을 커밋 마커를 거쳐 반영 (관련 Lock 보유 상태에서 호출).
+
+        1) 새 스냅샷을 임시 파일로 기록 → 2) 마커 기록(커밋 지점)
+        → 3) 임시 파일 교체/저널 추가·삭제 → 4) 마커 삭제.
+        2) 이전 크래시는 임시 파일만 남고(롤백), 이후 크래시는
+        다음 시작 시 마커로 3)을 다시 수행합니다(롤포워드).
+        """
+        txn_id = uuid.uuid4().hex
+        fd = None
+        if self._process_locks:
+            # 다른 프로세스의 복구가 진행 중인 커밋을 건드리지 않도록 공유 잠금
+            try:
+                fd = await FileLock(self._commit_lock_path()).acquire(False, self._lock_timeout)
+            except TimeoutError:
+                raise ConcurrencyError(f"Commit lock timeout after {self._lock_timeout}s")
+        try:
+            snapshots = [c for c in changes if c.content is not None]
+            try:
+                for change in snapshots:
+                    self._ensure_directory(change.path)
+                    change.tmp_path = change.path.with_name(f"{change.path.name}.txn-{txn_id}.tmp")
+                    await self._io.run(
+                        _write_bytes, change.tmp_path, change.content, size=len(change.content),
+                    )
+                await self._sync_now([c.tmp_path for c in snapshots])
+            except Exception:
+                for change in snapshots:
+                    if change.tmp_path is not None:
+                        change.tmp_path.unlink(missing_ok=True)
+                raise
+
+            marker = {
+                "snapshots": [
+                    {
+                        "tmp": self._relative(c.tmp_path),
+                        "path": self._relative(c.path),
+                        "journal": self._relative(c.journal_path) if c.journal_path else None,
+                    }
+                    for c in snapshots
+                ],
+                "journals": [
+                    {"path": self._relative(c.journal_path), "entries": c.entries}
+                    for c in changes if c.content is None
+                ],
+            }
+            marker_path = self._base_path / f".commit-{txn_id}.json"
+            marker_tmp = marker_path.with_name(marker_path.name + ".tmp")
+            content = json.dumps(marker, ensure_ascii=False).encode("utf-8")
+            await self._io.run(_write_bytes, marker_tmp, content, size=len(content))
+            await self._io.run(os.replace, marker_tmp, marker_path)
+            await self._sync_now([marker_path], [self._base_path])
+
+            await self._io.run(self._roll_forward, marker)
+            touched = [c.path if c.content is not None else c.journal_path for c in changes]
+            await self._sync_now(touched, sorted({p.parent for p in touched}))
+            await self._io.run(marker_path.unlink)
+        finally:
+            if fd is not None:
+                FileLock.release(fd)
+
+    def _relative(self, path: Path) -> str:
+        return str(path.relative_to(self._base_path))
+
+    def _roll_forward(self, marker: dict) -> None:
+        """커밋 마커 내용을 파일에 반영 (재실행해도 안전). 시작 시 복구 외에는 전용 풀에서 호출."""
+        for snap in marker.get("snapshots", []):
+            tmp_path = self._base_path / snap["tmp"]
             if tmp_path.exists():
+                os.replace(tmp_path, self._base_path / snap["path"])
+            if snap.get("journal"):
+                (self._base_path / snap["journal"]).unlink(missing_ok=True)
+        for jrn in marker.get("journals", []):
+            journal_path = self._base_path / jrn["path"]
+            journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(journal_path, "a", encoding="utf-8") as f:
+                f.write(journal.encode_entries(jrn["entries"]))
+
+    def _recover_commits(self) -> None:
+        """시작 시 미완료 커밋 롤포워드 및 고아 임시 파일 정리."""
+        markers = sorted(self._base_path.glob(".commit-*.json"))
+        orphans = list(self._base_path.glob("**/*.txn-*.tmp"))
+        orphans += self._base_path.glob(".commit-*.json.tmp")
+        if not markers and not orphans:
+            return
+        fd = None
+        if self._process_locks:
+            # 살아있는 프로세스의 커밋이 끝날 때까지 대기
+            self._lock_dir.mkdir(exist_ok=True)
+            fd = os.open(self._commit_lock_path(), os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            for marker_path in sorted(self._base_path.glob(".commit-*.json")):
+                try:
+                    marker = json.loads(marker_path.read_text(encoding="utf-8"))
+                except ValueError:
+                    logger.error("commit_marker_corrupted: file=%s", marker_path)
+                    continue
+                self._roll_forward(marker)
+                marker_path.unlink()
+                logger.warning("commit_recovered: marker=%s", marker_path.name)
+            for tmp_path in self._base_path.glob("**/*.txn-*.tmp"):
                 tmp_path.unlink(missing_ok=True)
+                logger.warning("commit_rolled_back: tmp=%s", tmp_path)
+            for tmp_path in self._base_path.glob(".commit-*.json.tmp"):
+                tmp_path.unlink(missing_ok=True)
+        finally:
+            if fd is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+    def _index_entry(self, entity: str, store_id: str) -> CacheEntry | None:
+        """인덱스가 선언된 엔티티의 캐시 항목 (_load 이후 호출)."""
+        if self._cache is None or entity not in self._indexes:
+            return None
+        return self._cache.entry(entity, store_id)
+
+    @staticmethod
+    def _copy(records: list[dict]) -> list[dict]:
+        """레코드 얕은 복사 (중첩 값은 읽기 전용으로 취급)."""
+        return [dict(r) for r in records]
+
+    # ── Group Commit ──
+
+    async def _mutate(self, entity: str, store_id: str, mutation: Mutation) -> object:
+        """변경을 대기열에 넣고, 배치로 영속화된 뒤 결과를 반환.
+
+        Lock을 먼저 획득한 호출자가 그때까지 쌓인 변경을 한 번에
+        적용하고 한 번만 기록합니다(group commit). 이후 Lock을 얻은
+        호출자는 자신의 변경이 이미 처리되었으면 바로 반환합니다.
+        """
+        pending = self._residency.touch(store_id).pending.setdefault(entity, [])
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        item = (mutation, future)
+        pending.append(item)
+        settle = None
+        try:
+            async with self._locked(entity, store_id):
+                if item in pending:
+                    if self._group_commit_window > 0:
+                        await asyncio.sleep(self._group_commit_window)
+                    settle = await self._commit_pending(entity, store_id)
+        except ConcurrencyError:
+            if self._withdraw(pending, item):
+                raise
+            # 이미 다른 호출자의 배치에 포함되어 기록 중
+        except BaseException:
+            self._withdraw(pending, item)
             raise
+        if settle is not None:
+            # Lock을 놓은 뒤 fsync를 기다려 그동안 읽기가 막히지 않게 함.
+            # 호출자가 취소되어도 배치의 다른 호출자에게는 결과를 전달
+            await asyncio.shield(asyncio.ensure_future(settle()))
+        return await future
+
+    @staticmethod
+    def _withdraw(pending: list, item: tuple) -> bool:
+        """아직 배치에 포함되지 않은 변경을 대기열에서 제거."""
+        if item in pending:
+            pending.remove(item)
+            return True
+        return False
+
+    async def _commit_pending(
+        self, entity: str, store_id: str,
+    ) -> Callable[[], Awaitable[None]] | None:
+        """대기 중인 변경을 적용하고 한 번에 기록 (Lock 보유 상태에서 호출).
+
+        fsync를 기다려야 하면 결과 전달을 미루고, Lock 밖에서 실행할
+        대기 함수를 반환합니다.
+        """
+        pending = self._residency.touch(store_id).pending.get(entity, [])
+        batch = pending[:self._group_commit_max_batch]
+        del pending[:len(batch)]
+        if not batch:
+            return None
+
+        try:
+            data = await self._load(entity, store_id)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return None
+        entry = self._index_entry(entity, store_id)
+
+        outcomes: list[tuple[asyncio.Future, object]] = []
+        entries: list[dict] | None = []
+        for mutation, future in batch:
+            try:
+                result, op_entries = mutation(data, entry)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            outcomes.append((future, result))
+            if op_entries is None or entries is None:
+                entries = None
+            else:
+                entries.extend(op_entries)
+
+        # 모두 변경 없음(빈 저널 항목)이면 기록 생략
+        pending_sync = None
+        if outcomes and entries != []:
+            try:
+                pending_sync = await self._store(entity, store_id, data, entries)
+            except Exception as e:
+                for future, _ in outcomes:
+                    future.set_exception(e)
+                return None
+            if len(batch) > 1:
+                logger.info(
+                    "group_commit: entity=%s, store_id=%s, mutations=%d",
+                    entity, store_id, len(batch),
+                )
+        if pending_sync is None:
+            for future, result in outcomes:
+                future.set_result(result)
+            return None
+
+        async def settle() -> None:
+            try:
+                await pending_sync()
+            except Exception as e:
+                for future, _ in outcomes:
+                    future.set_exception(e)
+                return
+            for future, result in outcomes:
+                future.set_result(result)
+        return settle
+
+    # ── Partitions ──
+
+    def partition_for(self, entity: str, record: dict) -> str:
+        """레코드가 저장될 물리 엔티티명 (예: "order_history/2026-10").
+
+        파티션 엔티티가 아니거나 키 필드가 없으면 entity 그대로입니다.
+        트랜잭션에서 파티션 엔티티를 다룰 때 이 이름을 선언합니다.
+        """
+        field = self._partitions.get(entity)
+        value = record.get(field) if field else None
+        if not isinstance(value, str) or not _PARTITION_KEY.match(value):
+            return entity
+        return f"{entity}/{value[:7]}"
+
+    def _partition_keys(self, entity: str, store_id: str) -> list[str]:
+        directory = self._base_path / store_id / entity
+        if not directory.is_dir():
+            return []
+        keys: set[str] = set()
+        for path in directory.iterdir():
+            name = path.name
+            if name.startswith("."):
+                continue
+            if name.endswith(".journal.jsonl"):
+                keys.add(name[:-len(".journal.jsonl")])
+            elif name.endswith(".json"):
+                keys.add(name[:-len(".json")])
+        return sorted(keys)
+
+    async def _partition_names(
+        self, entity: str, store_id: str, start: str | None = None, end: str | None = None,
+    ) -> list[str]:
+        """구간과 겹치는 물리 엔티티명 (오래된 순).
+
+        구간이 없으면 키 없는 레코드가 있는 기본 파일도 포함합니다.
+        """
+        await self._split_legacy(entity, store_id)
+        names = [entity] if start is None and end is None else []
+        for key in self._partition_keys(entity, store_id):
+            if start is not None and key < start[:7]:
+                continue
+            if end is not None and key > end[:7]:
+                continue
+            names.append(f"{entity}/{key}")
+        return names
+
+    async def _split_legacy(self, entity: str, store_id: str) -> None:
+        """파티션 도입 전 기본 파일의 레코드를 파티션으로 이동 (프로세스당 1회)."""
+        if (entity, store_id) in self._partitions_split:
+            return
+        async with self._locked(entity, store_id, exclusive=False):
+            legacy = await self._load(entity, store_id)
+            targets = {self.partition_for(entity, r) for r in legacy} - {entity}
+        if targets:
+            def movable(record: dict) -> bool:
+                return self.partition_for(entity, record) != entity
+
+            async with self.transaction(store_id, [entity, *targets]) as tx:
+                moving = [r for r in await tx.read(entity) if movable(r)]
+                for record in moving:
+                    await tx.append(self.partition_for(entity, record), record)
+                await tx.delete_where(entity, movable)
+            logger.info(
+                "partition_split: entity=%s, store_id=%s, records=%d, partitions=%d",
+                entity, store_id, len(moving), len(targets),
+            )
+        self._partitions_split.add((entity, store_id))
+
+    async def _physical_names(self, entity: str, store_id: str) -> list[str]:
+        if entity in self._partitions:
+            return await self._partition_names(entity, store_id)
+        return [entity]
+
+    async def _locate(self, entity: str, store_id: str, id: str) -> str:
+        """id가 있는 물리 엔티티명 (최신 파티션부터 탐색, 없으면 entity)."""
+        for name in reversed(await self._partition_names(entity, store_id)):
+            if await self.find_by_id(name, store_id, id) is not None:
+                return name
+        return entity
+
+    async def _write_partitioned(self, entity: str, store_id: str, data: list[dict]) -> None:
+        groups: dict[str, list[dict]] = {entity: []}
+        for record in data:
+            groups.setdefault(self.partition_for(entity, record), []).append(dict(record))
+        names = set(await self._partition_names(entity, store_id)) | set(groups)
+        async with self.transaction(store_id, names) as tx:
+            for name in names:
+                await tx.write(name, groups.get(name, []))
 
     # ── Public API ──
 
     async def read(self, entity: str, store_id: str) -> list[dict]:
         """엔티티 전체 데이터 읽기."""
-        async with self._locked(entity, store_id):
-            file_path = self._get_file_path(entity, store_id)
-            return await self._read_file(file_path)
+        if entity in self._partitions:
+            return await self.read_range(entity, store_id)
+        async with self._locked(entity, store_id, exclusive=False):
+            return self._copy(await self._load(entity, store_id))
+
+    async def signature(self, entity: str, store_id: str) -> object:
+        """변경 감지용 시그니처 (파일 inode/mtime/size).
+
+        다른 프로세스의 쓰기에도 바뀌므로 프로세스별 파생 상태의 무효화에
+        씁니다. 파티션 엔티티는 모든 월 파일의 시그니처를 묶습니다.
+        """
+        if entity in self._partitions:
+            names = sorted(await self._partition_names(entity, store_id))
+            return tuple((name, self._signature(name, store_id)) for name in names)
+        return self._signature(entity, store_id)
+
+    def written_signature(self, entity: str, store_id: str) -> tuple[object, object] | None:
+        """이 인스턴스가 마지막으로 기록한 (기록 직전, 기록 직후) 시그니처.
+
+        둘 다 Lock을 보유한 채 잡으므로, 파생 상태가 기록 직전 시그니처를
+        알고 있었다면 그 사이 다른 프로세스의 쓰기가 없었음을 뜻합니다.
+        """
+        return self._written.get((entity, store_id))
+
+    async def read_range(
+        self,
+        entity: str,
+        store_id: str,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> list[dict]:
+        """파티션 키 필드가 [start, end] 구간인 레코드 (양끝 포함, ISO 문자열 비교).
+
+        구간과 겹치는 월 파티션만 읽으므로 비용이 전체 이력이 아닌
+        조회 구간에 비례합니다. 구간이 없으면 전체 레코드를 반환합니다.
+        """
+        field = self._partitions.get(entity)
+        if field is None:
+            raise ValueError(f"Entity '{entity}' is not partitioned")
+        result: list[dict] = []
+        for name in await self._partition_names(entity, store_id, start, end):
+            async with self._locked(name, store_id, exclusive=False):
+                records = await self._load(name, store_id)
+                result.extend(dict(r) for r in records if _in_range(r.get(field), start, end))
+        return result
+
+    async def iter(
+        self,
+        entity: str,
+        store_id: str,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> AsyncIterator[dict]:
+        """레코드를 하나씩 생성 (전체 목록을 만들지 않음).
+
+        캐시에 없으면 스냅샷을 청크 단위로 파싱하고 저널은 흐름 위에
+        재적용하므로 메모리는 파일 크기가 아닌 저널 크기에 비례합니다.
+        Lock은 파일을 연 뒤 바로 풀리며, 이후 스냅샷이 교체되어도 연
+        시점의 내용을 끝까지 읽습니다. 파티션 엔티티는 start/end로 구간 지정.
+        """
+        if entity in self._partitions:
+            field = self._partitions[entity]
+            for name in await self._partition_names(entity, store_id, start, end):
+                async for record in self._iter_entity(name, store_id):
+                    if _in_range(record.get(field), start, end):
+                        yield record
+            return
+        if start is not None or end is not None:
+            raise ValueError(f"Entity '{entity}' is not partitioned")
+        async for record in self._iter_entity(entity, store_id):
+            yield record
+
+    async def _iter_entity(self, entity: str, store_id: str) -> AsyncIterator[dict]:
+        file_path = self._get_file_path(entity, store_id)
+        async with self._locked(entity, store_id, exclusive=False):
+            cached = None
+            if self._cache is not None:
+                cached = self._cache.get(entity, store_id, self._signature(entity, store_id))
+            if cached is not None:
+                snapshot = list(cached)
+            else:
+                try:
+                    f = open(file_path, "rb")
+                except FileNotFoundError:
+                    f = None
+                entries: list[dict] = []
+                if self._is_journaled(entity):
+                    entries = await self._read_journal(self._get_journal_path(entity, store_id))
+        if cached is not None:
+            for record in snapshot:
+                yield dict(record)
+            return
+
+        records = codecs.iter_decode(f) if f is not None else iter(())
+        stream = journal.replay_stream(records, entries)
+        size = os.fstat(f.fileno()).st_size if f is not None else 0
+        try:
+            while batch := await self._io.run(_take, stream, self._stream_batch, size=size):
+                for record in batch:
+                    yield record
+        except (ValueError, EOFError, TypeError) as e:
+            logger.error("json_parse_failed: file=%s, error=%s", file_path, str(e))
+        finally:
+            if f is not None:
+                f.close()
 
     async def write(self, entity: str, store_id: str, data: list[dict]) -> None:
         """엔티티 전체 데이터 쓰기 (덮어쓰기)."""
-        async with self._locked(entity, store_id):
-            file_path = self._get_file_path(entity, store_id)
-            await self._atomic_write(file_path, data)
-            logger.info(
-                "write: entity=%s, store_id=%s, records=%d",
-                entity, store_id, len(data),
-            )
+        if entity in self._partitions:
+            await self._write_partitioned(entity, store_id, data)
+        else:
+            await self._mutate(entity, store_id, mutations.replace_op(self._copy(data)))
+        logger.info(
+            "write: entity=%s, store_id=%s, records=%d",
+            entity, store_id, len(data),
+        )
 
     async def find_by_id(
         self, entity: str, store_id: str, id: str
     ) -> dict | None:
         """ID로 단건 조회."""
-        data = await self.read(entity, store_id)
-        for record in data:
-            if record.get("id") == id:
-                return record
-        return None
+        found = await self.find_by(entity, store_id, "id", id)
+        return found[0] if found else None
+
+    async def find_by_ids(
+        self, entity: str, store_id: str, ids: Iterable[str],
+    ) -> dict[str, dict]:
+        """여러 ID를 한 번의 Lock/로드로 조회. 없는 ID는 결과에서 빠짐."""
+        wanted = list(dict.fromkeys(ids))
+        if entity in self._partitions:
+            targets = set(wanted)
+            return {
+                r["id"]: r for r in await self.read(entity, store_id) if r.get("id") in targets
+            }
+        async with self._locked(entity, store_id, exclusive=False):
+            data = await self._load(entity, store_id)
+            entry = self._index_entry(entity, store_id)
+            found: dict[str, dict] = {}
+            if entry is not None and ("id",) in self._indexes[entity]:
+                for id in wanted:
+                    matches = entry.lookup(("id",), (id,))
+                    if matches:
+                        found[id] = dict(matches[0])
+            else:
+                targets = set(wanted)
+                for record in data:
+                    id = record.get("id")
+                    if id in targets and id not in found:
+                        found[id] = dict(record)
+            return found
+
+    async def find_by(
+        self,
+        entity: str,
+        store_id: str,
+        field: str | tuple[str, ...],
+        value: object,
+    ) -> list[dict]:
+        """필드 값 일치 조회. 복합 인덱스는 필드/값 튜플로 지정.
+
+        선언된 인덱스가 있으면 해시 조회, 없으면 선형 탐색합니다.
+        """
+        fields = _index_key(field)
+        values = (value,) if isinstance(field, str) else tuple(value)
+        if entity in self._partitions:
+            return [
+                r for r in await self.read(entity, store_id)
+                if tuple(r.get(f) for f in fields) == values
+            ]
+        async with self._locked(entity, store_id, exclusive=False):
+            data = await self._load(entity, store_id)
+            entry = self._index_entry(entity, store_id)
+            if entry is not None and fields in self._indexes[entity]:
+                matches = entry.lookup(fields, values)
+            else:
+                matches = [
+                    r for r in data
+                    if tuple(r.get(f) for f in fields) == values
+                ]
+            return self._copy(matches)
+
+    async def query(
+        self,
+        entity: str,
+        store_id: str,
+        where: Where | None = None,
+        order_by: OrderBy | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> list[dict]:
+        """조건 일치 레코드를 정렬해 [offset, offset + limit) 구간만 반환.
+
+        where 필드를 덮는 인덱스가 선언되어 있으면 해시 조회로 후보를
+        좁히고, 결과 페이지만 복사합니다(query 모듈 참고). 파티션
+        엔티티는 start/end로 파티션 키 구간을 지정하며(read_range와 동일)
+        iter()로 읽어 조건에 맞는 레코드만 메모리에 남깁니다.
+        """
+        if entity in self._partitions:
+            # 이력은 캐시에 올리지 않고 스트리밍하며 일치하는 레코드만 보관
+            matched = [
+                r async for r in self.iter(entity, store_id, start, end)
+                if query.matches(r, where)
+            ]
+            return query.page(matched, order_by, limit, offset)
+        if start is not None or end is not None:
+            raise ValueError(f"Entity '{entity}' is not partitioned")
+        async with self._locked(entity, store_id, exclusive=False):
+            data = await self._load(entity, store_id)
+            candidates = self._candidates(entity, store_id, data, where)
+            matched = (r for r in candidates if query.matches(r, where))
+            return self._copy(query.page(matched, order_by, limit, offset))
+
+    def _candidates(
+        self, entity: str, store_id: str, data: list[dict], where: Where | None,
+    ) -> list[dict]:
+        """where를 가장 많이 덮는 인덱스로 후보 레코드 선택 (없으면 전체)."""
+        entry = self._index_entry(entity, store_id) if where else None
+        if entry is None:
+            return data
+        usable = [
+            fields for fields in self._indexes[entity]
+            if all(f in where for f in fields)
+        ]
+        if not usable:
+            return data
+        fields = max(usable, key=len)
+        return entry.lookup(fields, tuple(where[f] for f in fields))
 
     async def append(self, entity: str, store_id: str, record: dict) -> None:
         """레코드 추가."""
-        async with self._locked(entity, store_id):
-            file_path = self._get_file_path(entity, store_id)
-            data = await self._read_file(file_path)
-            data.append(record)
-            await self._atomic_write(file_path, data)
-            logger.info(
-                "append: entity=%s, store_id=%s, records=%d",
-                entity, store_id, len(data),
-            )
+        entity = self.partition_for(entity, record)
+        await self._mutate(entity, store_id, mutations.append_op(dict(record)))
+        logger.info("append: entity=%s, store_id=%s", entity, store_id)
 
     async def update(
         self, entity: str, store_id: str, id: str, updates: dict
     ) -> dict:
         """레코드 수정. 수정된 레코드를 반환."""
-        from backend.models.schemas import utc_now
+        if entity in self._partitions:
+            entity = await self._locate(entity, store_id, id)
+        updated = await self._mutate(entity, store_id, mutations.update_op(entity, id, updates))
+        logger.info(
+            "update: entity=%s, store_id=%s, id=%s",
+            entity, store_id, id,
+        )
+        return updated
 
-        async with self._locked(entity, store_id):
-            file_path = self._get_file_path(entity, store_id)
-            data = await self._read_file(file_path)
-            for record in data:
-                if record.get("id") == id:
-                    record.update(updates)
-                    record["updated_at"] = utc_now()
-                    await self._atomic_write(file_path, data)
-                    logger.info(
-                        "update: entity=%s, store_id=%s, id=%s",
-                        entity, store_id, id,
-                    )
-                    return record
-            raise NotFoundError(entity, id)
+    async def update_if(
+        self,
+        entity: str,
+        store_id: str,
+        id: str,
+        expected: Mapping[str, object] | Predicate,
+        updates: dict,
+    ) -> tuple[dict, dict]:
+        """레코드가 expected를 만족할 때만 수정 (한 번의 Lock 안에서 확인+수정).
+
+        expected는 {필드: 값} 또는 조건 함수이며, 만족하지 않으면
+        PreconditionFailedError(현재 레코드 포함)를 던집니다.
+        (수정 전, 수정 후) 레코드를 반환합니다.
+        """
+        if entity in self._partitions:
+            entity = await self._locate(entity, store_id, id)
+        result = await self._mutate(
+            entity, store_id, mutations.update_if_op(entity, id, expected, updates),
+        )
+        logger.info(
+            "update_if: entity=%s, store_id=%s, id=%s",
+            entity, store_id, id,
+        )
+        return result
 
     async def delete(self, entity: str, store_id: str, id: str) -> None:
         """레코드 삭제."""
-        async with self._locked(entity, store_id):
+        if entity in self._partitions:
+            entity = await self._locate(entity, store_id, id)
+        await self._mutate(entity, store_id, mutations.delete_op(entity, id))
+        logger.info(
+            "delete: entity=%s, store_id=%s, id=%s",
+            entity, store_id, id,
+        )
+
+    async def update_many(
+        self, entity: str, store_id: str, updates: Mapping[str, dict],
+    ) -> dict[str, dict | None]:
+        """여러 레코드 일괄 수정 (읽기/쓰기 1회). 없는 id는 None."""
+        results: dict[str, dict | None] = dict.fromkeys(updates)
+        for name in await self._physical_names(entity, store_id):
+            pending = {id: u for id, u in updates.items() if results[id] is None}
+            if not pending:
+                break
+            found = await self._mutate(name, store_id, mutations.update_many_op(pending))
+            results.update({id: r for id, r in found.items() if r is not None})
+        logger.info(
+            "update_many: entity=%s, store_id=%s, requested=%d, updated=%d",
+            entity, store_id, len(results), sum(r is not None for r in results.values()),
+        )
+        return results
+
+    async def update_many_if(
+        self,
+        entity: str,
+        store_id: str,
+        updates: Mapping[str, dict],
+        expected: Mapping[str, object] | Predicate,
+    ) -> dict[str, tuple[dict | None, dict | None]]:
+        """expected를 만족하는 레코드만 일괄 수정 (확인+수정, 읽기/쓰기 1회).
+
+        {id: (수정 전, 수정 후)} 반환. 없는 id는 (None, None),
+        조건 불일치는 (현재 레코드, None)입니다.
+        """
+        results: dict[str, tuple[dict | None, dict | None]] = dict.fromkeys(updates, (None, None))
+        for name in await self._physical_names(entity, store_id):
+            pending = {id: u for id, u in updates.items() if results[id][0] is None}
+            if not pending:
+                break
+            found = await self._mutate(name, store_id, mutations.update_many_if_op(pending, expected))
+            results.update({id: r for id, r in found.items() if r[0] is not None})
+        logger.info(
+            "update_many_if: entity=%s, store_id=%s, requested=%d, updated=%d",
+            entity, store_id, len(results), sum(r[1] is not None for r in results.values()),
+        )
+        return results
+
+    async def delete_many(
+        self, entity: str, store_id: str, ids: Iterable[str],
+    ) -> dict[str, bool]:
+        """여러 레코드 일괄 삭제 (읽기/쓰기 1회). {id: 삭제 여부} 반환."""
+        results = dict.fromkeys(ids, False)
+        for name in await self._physical_names(entity, store_id):
+            pending = [id for id, done in results.items() if not done]
+            if not pending:
+                break
+            found = await self._mutate(name, store_id, mutations.delete_many_op(pending))
+            results.update({id: True for id, done in found.items() if done})
+        logger.info(
+            "delete_many: entity=%s, store_id=%s, requested=%d, deleted=%d",
+            entity, store_id, len(results), sum(results.values()),
+        )
+        return results
+
+    async def update_where(
+        self, entity: str, store_id: str, predicate: Predicate, updates: dict,
+    ) -> list[dict]:
+        """조건에 맞는 레코드 일괄 수정. 수정된 레코드 목록 반환."""
+        op = mutations.update_where_op(predicate, dict(updates))
+        updated = [
+            r for name in await self._physical_names(entity, store_id)
+            for r in await self._mutate(name, store_id, op)
+        ]
+        logger.info(
+            "update_where: entity=%s, store_id=%s, updated=%d",
+            entity, store_id, len(updated),
+        )
+        return updated
+
+    async def delete_where(
+        self, entity: str, store_id: str, predicate: Predicate,
+    ) -> list[str]:
+        """조건에 맞는 레코드 일괄 삭제. 삭제된 id 목록 반환."""
+        op = mutations.delete_where_op(predicate)
+        deleted = [
+            id for name in await self._physical_names(entity, store_id)
+            for id in await self._mutate(name, store_id, op)
+        ]
+        logger.info(
+            "delete_where: entity=%s, store_id=%s, deleted=%d",
+            entity, store_id, len(deleted),
+        )
+        return deleted
+
+    async def next_sequence(
+        self,
+        store_id: str,
+        name: str,
+        seed: Callable[[], Awaitable[int]] | None = None,
+    ) -> int:
+        """매장별 이름 있는 카운터의 다음 값 (1부터, 원자적).
+
+        값은 sequences 엔티티에 영속화되며 엔티티 Lock(process_locks 사용 시
+        파일 잠금 포함) 안에서 증가하므로 동시 호출과 여러 워커에서도
+        중복되지 않습니다. 카운터가 아직 없으면 seed()의 값 이후부터 시작합니다.
+        """
+        floor = 0
+        if seed is not None and await self.find_by_id("sequences", store_id, name) is None:
+            floor = await seed()
+        return await self._mutate("sequences", store_id, mutations.increment_op(name, floor))
+
+    async def compact(self, entity: str, store_id: str) -> None:
+        """저널을 스냅샷으로 접어 넣기 (저널 엔티티가 아니면 무시)."""
+        if not self._is_journaled(entity):
+            return
+        for name in await self._physical_names(entity, store_id):
+            async with self._locked(name, store_id):
+                data = await self._load(name, store_id)
+                await self._store(name, store_id, data)
+
+    # ── Transactions ──
+
+    @asynccontextmanager
+    async def transaction(
+        self, store_id: str, entities: Iterable[str],
+    ) -> AsyncIterator[Transaction]:
+        """매장 내 여러 엔티티에 대한 원자적 변경.
+
+        사용 예::
+
+            async with ds.transaction(store_id, ["orders", "sessions"]) as tx:
+                await tx.delete("orders", order_id)
+                await tx.update("sessions", session_id, {"status": "ended"})
+
+        선언한 엔티티의 배타 Lock을 (이름순으로) 보유한 채 실행되며,
+        변경된 파일마다 한 번씩 기록합니다. 파티션 엔티티는
+        partition_for()가 돌려준 물리 엔티티명으로 선언합니다.
+        """
+        names = tuple(sorted(set(entities)))
+        async with AsyncExitStack() as stack:
+            for entity in names:
+                await stack.enter_async_context(self._locked(entity, store_id))
+            tx = Transaction(store_id, names, lambda e: self._load(e, store_id))
+            yield tx
+            changes = tx.changes()
+            if changes:
+                await self._commit_transaction(store_id, changes)
+
+    async def _commit_transaction(
+        self, store_id: str, changes: dict[str, tuple[list[dict], list[dict] | None]],
+    ) -> None:
+        file_changes = []
+        befores = {entity: self._signature(entity, store_id) for entity in changes}
+        for entity, (data, entries) in changes.items():
             file_path = self._get_file_path(entity, store_id)
-            data = await self._read_file(file_path)
-            original_len = len(data)
-            data = [r for r in data if r.get("id") != id]
-            if len(data) == original_len:
-                raise NotFoundError(entity, id)
-            await self._atomic_write(file_path, data)
-            logger.info(
-                "delete: entity=%s, store_id=%s, id=%s",
-                entity, store_id, id,
+            journal_path = (
+                self._get_journal_path(entity, store_id) if self._is_journaled(entity) else None
             )
+            if entries is not None and journal_path is not None:
+                file_changes.append(_FileChange(file_path, journal_path, entries=entries))
+            else:
+                content = await self._encode(entity, store_id, data)
+                file_changes.append(_FileChange(file_path, journal_path, content=content))
+        try:
+            await self._commit_changes(file_changes)
+        except Exception:
+            if self._cache is not None:
+                for entity in changes:
+                    self._cache.invalidate(entity, store_id)
+            raise
+
+        for entity, (data, entries) in changes.items():
+            key = (entity, store_id)
+            if self._is_journaled(entity):
+                if entries is None:
+                    self._journal_sizes[key] = 0
+                else:
+                    self._journal_sizes[key] = self._journal_sizes.get(key, 0) + len(entries)
+            after = self._signature(entity, store_id)
+            self._written[key] = (befores[entity], after)
+            if self._cache is not None:
+                self._cache.put(entity, store_id, after, data)
+        logger.info(
+            "transaction_committed: store_id=%s, entities=%s",
+            store_id, ",".join(changes),
+        )
+
+
+@dataclass
+class _FileChange:
+    """커밋 단위 파일 변경: 인코딩된 새 스냅샷(content) 또는 저널 추가(entries)."""
+
+    path: Path
+    journal_path: Path | None
+    content: bytes | None = None
+    entries: list[dict] | None = None
+    tmp_path: Path | None = None
+
+
+def _read_snapshot(path: Path) -> list[dict]:
+    return codecs.decode(path.read_bytes())
+
+
+def _read_journal_entries(path: Path) -> list[dict]:
+    return journal.parse_entries(path.read_text(encoding="utf-8"), str(path))
+
+
+def _take(stream: Iterator[dict], count: int) -> list[dict]:
+    return list(itertools.islice(stream, count))
+
+
+def _write_bytes(path: Path, content: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _append_bytes(path: Path, content: bytes) -> None:
+    with open(path, "ab") as f:
+        f.write(content)
+
+
+def _in_range(value: object, start: str | None, end: str | None) -> bool:
+    if start is None and end is None:
+        return True
+    if not isinstance(value, str):
+        return False
+    return (start is None or value >= start) and (end is None or value <= end)
+
+
+def _index_key(field: str | Iterable[str]) -> IndexKey:
+    return (field,) if isinstance(field, str) else tuple(field)
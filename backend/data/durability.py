@@ -0,0 +1,98 @@
+"""fsync policies for DataStore journals and snapshots.
+
+    os      fsync 하지 않음 (OS 페이지 캐시에 맡김, 기존 동작)
+    batch   저널 추가는 interval 동안 모아 파일당 fsync 1회, 스냅샷은 즉시 fsync
+    always  저널 추가/스냅샷마다 즉시 fsync
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable
+
+logger = logging.getLogger("datastore")
+
+FSYNC_OS = "os"
+FSYNC_BATCH = "batch"
+FSYNC_ALWAYS = "always"
+FSYNC_POLICIES = (FSYNC_OS, FSYNC_BATCH, FSYNC_ALWAYS)
+
+
+def sync_paths(files: Iterable[Path], directories: Iterable[Path] = ()) -> None:
+    """파일 내용과 디렉토리 엔트리를 디스크에 반영 (블로킹, 스레드에서 호출)."""
+    for path in files:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            continue  # 이미 컴팩션 등으로 교체/삭제됨
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    for directory in directories:
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except FileNotFoundError:
+            continue
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass  # 디렉토리 fsync 미지원 파일시스템
+        finally:
+            os.close(fd)
+
+
+class SyncBatcher:
+    """batch 정책용 fsync 묶음 처리기.
+
+    sync()는 파일을 대기 목록에 올리고 다음 플러시(최대 interval 후)를
+    기다립니다. 그 사이 들어온 요청은 같은 플러시에서 함께 fsync됩니다.
+    fsync는 run(DataStore의 전용 I/O 풀)으로 실행합니다.
+    """
+
+    def __init__(self, interval: float, run: Callable[..., Awaitable[None]]) -> None:
+        self._interval = interval
+        self._run = run
+        self._files: set[Path] = set()
+        self._directories: set[Path] = set()
+        self._waiter: asyncio.Future | None = None
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def sync(self, path: Path, new_file: bool = False) -> None:
+        self._files.add(path)
+        if new_file:
+            self._directories.add(path.parent)
+        if self._waiter is None:
+            self._waiter = asyncio.get_running_loop().create_future()
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._flush_later())
+        # 한 호출자가 취소되어도 플러시는 계속 진행
+        await asyncio.shield(self._waiter)
+
+    async def flush(self) -> None:
+        """대기 중인 fsync를 즉시 수행하고 완료를 기다림 (종료 시 사용)."""
+        task = self._task
+        if task is not None:
+            self._wake.set()
+            await task
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.wait_for(self._wake.wait(), self._interval)
+        except asyncio.TimeoutError:
+            pass
+        files, self._files = self._files, set()
+        directories, self._directories = self._directories, set()
+        waiter, self._waiter = self._waiter, None
+        self._task = None
+        try:
+            await self._run(sync_paths, files, directories)
+        except Exception as e:
+            logger.error("fsync_failed: files=%d, error=%s", len(files), str(e))
+            waiter.set_exception(e)
+            return
+        waiter.set_result(None)
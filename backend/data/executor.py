@@ -0,0 +1,89 @@
+"""Dedicated bounded thread pool for DataStore file I/O and serialization."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class IOExecutor:
+    """DataStore 전용 스레드 풀.
+
+    size(바이트 추정치)가 inline_threshold 미만인 작업은 전환 비용이
+    더 크므로 이벤트 루프에서 바로 실행하고, 그 이상은 전용 풀로 보냅니다.
+    동시에 대기/실행 중인 작업은 max_pending으로 제한되어, 초과 시
+    호출자가 자리가 날 때까지 기다립니다(기본 루프 executor와 격리).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        inline_threshold: int = 64 * 1024,
+        max_pending: int = 64,
+    ) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="datastore-io")
+        self._max_workers = max_workers
+        self._inline_threshold = inline_threshold
+        self._slots = asyncio.Semaphore(max_pending)
+        self._queued = 0
+        self._max_queue_depth = 0
+        self._inline_count = 0
+        self._offloaded_count = 0
+        self._inline_seconds = 0.0
+        self._wait_seconds = 0.0
+        self._run_seconds = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: object, size: int | None = None) -> T:
+        """fn(*args) 실행. size가 임계값 이상이거나 None(블로킹 작업)이면 전용 스레드에서."""
+        if size is not None and size < self._inline_threshold:
+            start = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self._inline_count += 1
+                self._inline_seconds += time.perf_counter() - start
+
+        async with self._slots:
+            submitted = time.perf_counter()
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+            timings: list[tuple[float, float]] = []
+
+            def task() -> T:
+                started = time.perf_counter()
+                # 통계 필드는 이벤트 루프 스레드에서만 갱신
+                try:
+                    return fn(*args)
+                finally:
+                    timings.append((started - submitted, time.perf_counter() - started))
+
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self._pool, task)
+            finally:
+                self._queued -= 1
+                self._offloaded_count += 1
+                if timings:
+                    wait, run = timings[0]
+                    self._wait_seconds += wait
+                    self._run_seconds += run
+
+    def metrics(self) -> dict:
+        """풀 상태 및 누적 시간(초). queue_depth는 대기+실행 중인 작업 수."""
+        return {
+            "workers": self._max_workers,
+            "inline_threshold": self._inline_threshold,
+            "queue_depth": self._queued,
+            "max_queue_depth": self._max_queue_depth,
+            "inline_tasks": self._inline_count,
+            "offloaded_tasks": self._offloaded_count,
+            "inline_seconds": round(self._inline_seconds, 6),
+            "queue_wait_seconds": round(self._wait_seconds, 6),
+            "run_seconds": round(self._run_seconds, 6),
+        }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,70 @@
+"""Cross-process advisory file locks (fcntl.flock) with async acquisition."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+_POLL_MIN = 0.001
+_POLL_MAX = 0.05
+
+
+def process_locks_supported() -> bool:
+    return fcntl is not None
+
+
+class FileLock:
+    """잠금 파일 1개에 대한 flock 래퍼.
+
+    획득마다 파일을 새로 열어 잠그므로 같은 프로세스 안의 공유
+    잠금끼리도 독립적으로 동작합니다. 이벤트 루프를 막지 않도록
+    LOCK_NB로 시도하고 실패하면 짧게 sleep하며 재시도합니다.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    async def acquire(self, exclusive: bool, timeout: float, create: bool = True) -> int | None:
+        """잠금 획득 후 fd 반환. timeout 초과 시 TimeoutError.
+
+        create=False이면 잠금 파일이 없을 때 만들지 않고 None을 반환합니다.
+        """
+        if create:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(self._path, os.O_RDWR | (os.O_CREAT if create else 0), 0o644)
+        except FileNotFoundError:
+            if create:
+                raise
+            return None
+        flags = (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB
+        deadline = time.monotonic() + timeout
+        delay = _POLL_MIN
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, flags)
+                    return fd
+                except BlockingIOError:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"flock timeout: {self._path}")
+                    await asyncio.sleep(min(delay, remaining))
+                    delay = min(delay * 2, _POLL_MAX)
+        except BaseException:
+            os.close(fd)
+            raise
+
+    @staticmethod
+    def release(fd: int) -> None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
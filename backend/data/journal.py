@@ -0,0 +1,133 @@
+"""Append-only JSONL journal helpers for DataStore.
+
+저널 항목은 재적용해도 결과가 같도록(idempotent) 설계되어 있어,
+컴팩션 도중 크래시로 스냅샷과 저널이 겹쳐도 안전하게 복구됩니다.
+
+    {"op": "append", "record": {...}}        # 같은 id가 있으면 무시
+    {"op": "update", "id": "...", "set": {}}  # 최종 값(updated_at 포함)을 기록
+    {"op": "delete", "id": "..."}            # 없으면 무시
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Iterable, Iterator
+
+logger = logging.getLogger("datastore")
+
+
+def append_entry(record: dict) -> dict:
+    return {"op": "append", "record": record}
+
+
+def update_entry(id: str, values: dict) -> dict:
+    return {"op": "update", "id": id, "set": values}
+
+
+def delete_entry(id: str) -> dict:
+    return {"op": "delete", "id": id}
+
+
+def encode_entries(entries: list[dict]) -> str:
+    """저널 항목을 JSONL 문자열로 직렬화."""
+    return "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries)
+
+
+def parse_entries(content: str, source: str = "") -> list[dict]:
+    """JSONL 문자열을 저널 항목 리스트로 파싱.
+
+    크래시로 잘린 마지막 줄 등 손상된 줄은 경고 후 건너뜁니다.
+    """
+    entries = []
+    for lineno, line in enumerate(content.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            logger.warning("journal_line_skipped: file=%s, line=%d", source, lineno)
+    return entries
+
+
+def replay(records: list[dict], entries: list[dict]) -> list[dict]:
+    """스냅샷 레코드 위에 저널 항목을 순서대로 적용."""
+    if not entries:
+        return records
+    by_id: dict[object, dict] = {}
+    for record in records:
+        by_id[record.get("id", object())] = record
+    for entry in entries:
+        op = entry.get("op")
+        if op == "append":
+            record = entry.get("record", {})
+            key = record.get("id", object())
+            if key not in by_id:
+                by_id[key] = record
+        elif op == "update":
+            target = by_id.get(entry.get("id"))
+            if target is not None:
+                target.update(entry.get("set", {}))
+        elif op == "delete":
+            by_id.pop(entry.get("id"), None)
+    return list(by_id.values())
+
+
+def replay_stream(records: Iterable[dict], entries: list[dict]) -> Iterator[dict]:
+    """replay와 같은 결과를 순서대로 생성 (스냅샷 전체를 메모리에 올리지 않음).
+
+    저널에 언급된 id만 추적하므로 메모리는 저널 크기에 비례합니다.
+    삭제 후 다시 추가된 레코드는 replay처럼 마지막 추가 위치로 이동합니다.
+    """
+    by_id: dict[object, list[tuple[int, dict]]] = {}
+    tail: list[tuple[int, dict]] = []
+    for i, entry in enumerate(entries):
+        if entry.get("op") == "append":
+            record = entry.get("record", {})
+            if "id" not in record:
+                tail.append((i, record))
+                continue
+            key = record["id"]
+        else:
+            key = entry.get("id")
+        by_id.setdefault(key, []).append((i, entry))
+
+    seen: set[object] = set()
+    for record in records:
+        key = record.get("id", object())
+        ops = by_id.get(key)
+        if ops is None:
+            yield record
+            continue
+        seen.add(key)
+        final, position = _apply_ops(record, ops)
+        if final is not None and position is None:
+            yield final
+        elif final is not None:
+            tail.append((position, final))
+
+    for key, ops in by_id.items():
+        if key not in seen:
+            final, position = _apply_ops(None, ops)
+            if final is not None:
+                tail.append((position, final))
+    tail.sort(key=lambda item: item[0])
+    yield from (record for _, record in tail)
+
+
+def _apply_ops(
+    record: dict | None, ops: list[tuple[int, dict]],
+) -> tuple[dict | None, int | None]:
+    """레코드 1개에 저널 항목 적용. (최종 레코드, 마지막으로 추가된 항목 위치)."""
+    position = None
+    for i, entry in ops:
+        op = entry.get("op")
+        if op == "append":
+            if record is None:
+                record, position = entry.get("record", {}), i
+        elif op == "update":
+            if record is not None:
+                record.update(entry.get("set", {}))
+        elif op == "delete":
+            record, position = None, None
+    return record, position
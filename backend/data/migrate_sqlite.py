@@ -0,0 +1,112 @@
+"""One-shot migration of a JSON data directory into SqliteDataStore.
+
+    python -m backend.data.migrate_sqlite --data-dir data --db data/datastore.sqlite3
+
+저널 파일이 있는 엔티티는 스냅샷에 저널을 재적용한 최종 상태를,
+파티션 엔티티는 모든 월 파티션을 합친 상태를 옮기며,
+이미 DB에 있는 (entity, store_id)는 덮어씁니다.
+
+원본 디렉토리는 파일을 직접 읽기만 합니다(DataStore를 열지 않으므로
+커밋 롤포워드나 파티션 분할 같은 쓰기가 일어나지 않음). 미완료 커밋
+마커가 있으면 앱을 한 번 실행해 복구한 뒤 다시 시도해야 합니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+from backend.data import codecs, journal
+from backend.data.sqlite_store import SqliteDataStore
+from backend.exceptions import DataCorruptionError
+
+logger = logging.getLogger("datastore")
+
+
+def discover_entities(data_dir: Path) -> list[tuple[str, str]]:
+    """데이터 디렉토리에서 (entity, store_id) 목록 수집."""
+    found: list[tuple[str, str]] = []
+    if (data_dir / "stores.json").exists():
+        found.append(("stores", ""))
+    for store_dir in sorted(p for p in data_dir.iterdir() if p.is_dir()):
+        entities = {
+            p.name.split(".", 1)[0]
+            for p in store_dir.iterdir()
+            if p.is_file() and (p.suffix == ".json" or p.name.endswith(".journal.jsonl"))
+        }
+        # 월별 파티션 디렉토리 (DataStore.read가 파티션을 합쳐 반환)
+        entities.update(p.name for p in store_dir.iterdir() if p.is_dir())
+        found.extend((entity, store_dir.name) for entity in sorted(entities))
+    return found
+
+
+def read_entity(data_dir: Path, entity: str, store_id: str) -> list[dict]:
+    """(entity, store_id)의 최종 레코드를 파일에서 직접 읽기 (쓰기 없음).
+
+    기본 파일 뒤에 월 파티션을 오래된 순으로 이어 붙이며, 각 파일에
+    저널이 있으면 재적용합니다.
+    """
+    base = data_dir if entity == "stores" else data_dir / store_id
+    paths = [base / f"{entity}.json"]
+    if (base / entity).is_dir():
+        paths += sorted((base / entity).glob("*.json"))
+    records: list[dict] = []
+    for path in paths:
+        data: list[dict] = []
+        try:
+            if path.exists():
+                data = codecs.decode(path.read_bytes())
+        except (ValueError, EOFError, TypeError) as e:
+            raise DataCorruptionError(str(path), str(e))
+        journal_path = path.with_suffix(".journal.jsonl")
+        if journal_path.exists():
+            entries = journal.parse_entries(
+                journal_path.read_text(encoding="utf-8"), str(journal_path),
+            )
+            data = journal.replay(data, entries)
+        records.extend(data)
+    return records
+
+
+async def migrate(data_dir: str, db_path: str) -> dict[tuple[str, str], int]:
+    """JSON 데이터 디렉토리를 SQLite로 이전. {(entity, store_id): 레코드 수} 반환."""
+    source_dir = Path(data_dir)
+    pending = sorted(p.name for p in source_dir.glob(".commit-*.json"))
+    if pending:
+        raise ValueError(
+            f"Pending commit markers in {data_dir}: {', '.join(pending)} "
+            "(start the app once to recover them before migrating)"
+        )
+    targets = discover_entities(source_dir)
+    target = SqliteDataStore(db_path=db_path)
+    counts: dict[tuple[str, str], int] = {}
+    try:
+        for entity, store_id in targets:
+            records = read_entity(source_dir, entity, store_id)
+            await target.write(entity, store_id, records)
+            counts[(entity, store_id)] = len(records)
+            logger.info(
+                "migrated: entity=%s, store_id=%s, records=%d",
+                entity, store_id, len(records),
+            )
+    finally:
+        await target.close()
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import a JSON data directory into SQLite.")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--db", default="data/datastore.sqlite3")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    counts = asyncio.run(migrate(args.data_dir, args.db))
+    total = sum(counts.values())
+    print(f"migrated {len(counts)} entity files, {total} records -> {args.db}")
+
+
+if __name__ == "__main__":
+    main()
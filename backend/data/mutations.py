@@ -0,0 +1,226 @@
+"""Record-level mutations shared by DataStore group commits and transactions.
+
+변경 함수는 (data, 인덱스 항목)에 적용되어 (결과, 저널 항목)을 반환합니다.
+저널 항목이 None이면 전체 스냅샷 기록이 필요함을 뜻합니다.
+검증 실패 시 data를 건드리기 전에 예외를 던져야 합니다.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable, Mapping
+
+from backend.data import journal
+from backend.data.cache import CacheEntry
+from backend.exceptions import NotFoundError, PreconditionFailedError
+
+Predicate = Callable[[dict], bool]
+Mutation = Callable[[list[dict], CacheEntry | None], tuple[object, list[dict] | None]]
+
+
+def find_record(data: list[dict], entry: CacheEntry | None, id: str) -> dict | None:
+    if entry is not None:
+        matches = entry.lookup(("id",), (id,))
+        return matches[0] if matches else None
+    return next((r for r in data if r.get("id") == id), None)
+
+
+def replace_op(records: list[dict]) -> Mutation:
+    def apply(data: list[dict], entry: CacheEntry | None) -> tuple[object, None]:
+        data[:] = records
+        if entry is not None:
+            entry.indexes.clear()
+        return None, None
+    return apply
+
+
+def append_op(record: dict) -> Mutation:
+    def apply(data: list[dict], entry: CacheEntry | None) -> tuple[object, list[dict]]:
+        data.append(record)
+        if entry is not None:
+            entry.add(record)
+        return None, [journal.append_entry(record)]
+    return apply
+
+
+def update_op(entity: str, id: str, updates: dict) -> Mutation:
+    from backend.models.schemas import utc_now
+
+    def apply(data: list[dict], entry: CacheEntry | None) -> tuple[object, list[dict]]:
+        record = find_record(data, entry, id)
+        if record is None:
+            raise NotFoundError(entity, id)
+        values = {**updates, "updated_at": utc_now()}
+        _update(entry, record, values)
+        return dict(record), [journal.update_entry(id, values)]
+    return apply
+
+
+def update_if_op(
+    entity: str, id: str, expected: Mapping[str, object] | Predicate, updates: dict,
+) -> Mutation:
+    """기대 상태일 때만 수정. 결과는 (수정 전, 수정 후) 레코드.
+
+    expected는 {필드: 값} 또는 레코드를 받는 조건 함수입니다.
+    """
+    from backend.models.schemas import utc_now
+
+    def apply(data: list[dict], entry: CacheEntry | None) -> tuple[object, list[dict]]:
+        record = find_record(data, entry, id)
+        if record is None:
+            raise NotFoundError(entity, id)
+        if not satisfies(record, expected):
+            raise PreconditionFailedError(entity, id, dict(record))
+        before = dict(record)
+        values = {**updates, "updated_at": utc_now()}
+        _update(entry, record, values)
+        return (before, dict(record)), [journal.update_entry(id, values)]
+    return apply
+
+
+def update_many_if_op(
+    updates_by_id: Mapping[str, dict], expected: Mapping[str, object] | Predicate,
+) -> Mutation:
+    """expected를 만족하는 레코드만 일괄 수정.
+
+    결과는 {id: (수정 전, 수정 후)}이며, 없는 id는 (None, None),
+    조건 불일치는 (현재 레코드, None)입니다.
+    """
+    from backend.models.schemas import utc_now
+
+    def apply(data: list[dict], entry: CacheEntry | None) -> tuple[object, list[dict]]:
+        now = utc_now()
+        results: dict[str, tuple[dict | None, dict | None]] = {}
+        entries: list[dict] = []
+        for id, updates in updates_by_id.items():
+            record = find_record(data, entry, id)
+            if record is None:
+                results[id] = (None, None)
+                continue
+            if not satisfies(record, expected):
+                results[id] = (dict(record), None)
+                continue
+            before = dict(record)
+            values = {**updates, "updated_at": now}
+            _update(entry, record, values)
+            results[id] = (before, dict(record))
+            entries.append(journal.update_entry(id, values))
+        return results, entries
+    return apply
+
+
+def satisfies(record: dict, expected: Mapping[str, object] | Predicate) -> bool:
+    if callable(expected):
+        return bool(expected(record))
+    return all(record.get(f) == v for f, v in expected.items())
+
+
+def delete_op(entity: str, id: str) -> Mutation:
+    def apply(data: list[dict], entry: CacheEntry | None) -> tuple[object, list[dict]]:
+        removed = [r for r in data if r.get("id") == id]
+        if not removed:
+            raise NotFoundError(entity, id)
+        if entry is not None:
+            for record in removed:
+                entry.remove(record)
+        data[:] = [r for r in data if r.get("id") != id]
+        return None, [journal.delete_entry(id)]
+    return apply
+
+
+def increment_op(id: str, floor: int = 0) -> Mutation:
+    """id 카운터를 1 증가(없으면 생성). 결과는 max(현재 값, floor) + 1."""
+    from backend.models.schemas import utc_now
+
+    def apply(data: list[dict], entry: CacheEntry | None) -> tuple[object, list[dict]]:
+        record = find_record(data, entry, id)
+        if record is None:
+            record = {"id": id, "value": floor + 1, "updated_at": utc_now()}
+            data.append(record)
+            if entry is not None:
+                entry.add(record)
+            return record["value"], [journal.append_entry(dict(record))]
+        values = {"value": max(record.get("value", 0), floor) + 1, "updated_at": utc_now()}
+        record.update(values)  # 인덱스 필드(id)는 바뀌지 않음
+        return values["value"], [journal.update_entry(id, values)]
+    return apply
+
+
+def update_many_op(updates_by_id: Mapping[str, dict]) -> Mutation:
+    """{id: 수정값} 일괄 수정. 결과는 {id: 수정된 레코드 또는 None(없음)}."""
+    from backend.models.schemas import utc_now
+
+    def apply(data: list[dict], entry: CacheEntry | None) -> tuple[object, list[dict]]:
+        now = utc_now()
+        results: dict[str, dict | None] = {}
+        entries: list[dict] = []
+        for id, updates in updates_by_id.items():
+            record = find_record(data, entry, id)
+            if record is None:
+                results[id] = None
+                continue
+            values = {**updates, "updated_at": now}
+            _update(entry, record, values)
+            results[id] = dict(record)
+            entries.append(journal.update_entry(id, values))
+        return results, entries
+    return apply
+
+
+def delete_many_op(ids: Iterable[str]) -> Mutation:
+    """id 목록 일괄 삭제. 결과는 {id: 삭제 여부}."""
+    targets = list(dict.fromkeys(ids))
+
+    def apply(data: list[dict], entry: CacheEntry | None) -> tuple[object, list[dict]]:
+        wanted = set(targets)
+        present = {r.get("id") for r in data if r.get("id") in wanted}
+        _remove(data, entry, lambda r: r.get("id") in present)
+        return (
+            {id: id in present for id in targets},
+            [journal.delete_entry(id) for id in targets if id in present],
+        )
+    return apply
+
+
+def update_where_op(predicate: Predicate, updates: dict) -> Mutation:
+    """조건에 맞는 레코드 일괄 수정. 결과는 수정된 레코드 목록."""
+    from backend.models.schemas import utc_now
+
+    def apply(data: list[dict], entry: CacheEntry | None) -> tuple[object, list[dict]]:
+        values = {**updates, "updated_at": utc_now()}
+        updated: list[dict] = []
+        entries: list[dict] = []
+        for record in [r for r in data if predicate(r)]:
+            _update(entry, record, values)
+            updated.append(dict(record))
+            entries.append(journal.update_entry(record.get("id"), values))
+        return updated, entries
+    return apply
+
+
+def delete_where_op(predicate: Predicate) -> Mutation:
+    """조건에 맞는 레코드 일괄 삭제. 결과는 삭제된 id 목록."""
+    def apply(data: list[dict], entry: CacheEntry | None) -> tuple[object, list[dict]]:
+        ids = [r.get("id") for r in data if predicate(r)]
+        if not ids:
+            return [], []
+        _remove(data, entry, predicate)
+        return ids, [journal.delete_entry(id) for id in ids]
+    return apply
+
+
+def _update(entry: CacheEntry | None, record: dict, values: dict) -> None:
+    if entry is not None:
+        entry.update(record, values)
+    else:
+        record.update(values)
+
+
+def _remove(data: list[dict], entry: CacheEntry | None, predicate: Predicate) -> None:
+    kept: list[dict] = []
+    for record in data:
+        if predicate(record):
+            if entry is not None:
+                entry.remove(record)
+        else:
+            kept.append(record)
+    data[:] = kept
@@ -0,0 +1,66 @@
+"""Filter/sort/page helpers shared by DataStore.query and SqliteDataStore.query.
+
+where는 {필드: 값} 동등 조건(AND)이고, order_by는 필드명 또는 그 목록이며
+"-"로 시작하면 내림차순입니다. 값이 없는(None) 레코드는 방향과 무관하게
+마지막에 옵니다.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Callable, Iterable, Mapping, Sequence
+
+Where = Mapping[str, object]
+OrderBy = str | Sequence[str]
+
+
+def matches(record: dict, where: Where | None) -> bool:
+    return not where or all(record.get(f) == v for f, v in where.items())
+
+
+def parse_order(order_by: OrderBy | None) -> list[tuple[str, bool]]:
+    """order_by → [(필드, 내림차순 여부)]."""
+    if not order_by:
+        return []
+    fields = [order_by] if isinstance(order_by, str) else list(order_by)
+    return [(f[1:], True) if f.startswith("-") else (f, False) for f in fields]
+
+
+def _key(field: str, descending: bool) -> Callable[[dict], tuple]:
+    if descending:
+        # reverse 정렬에서도 None이 뒤로 가도록 표식을 뒤집음
+        return lambda r: (r.get(field) is not None, r.get(field))
+    return lambda r: (r.get(field) is None, r.get(field))
+
+
+def page(
+    records: Iterable[dict],
+    order_by: OrderBy | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[dict]:
+    """정렬 후 [offset, offset + limit) 구간 반환 (정렬은 안정적).
+
+    limit이 있고 정렬 방향이 모두 같으면 전체 정렬 대신 상위
+    offset + limit개만 고릅니다(heapq, O(n log k)).
+    """
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset and limit must be non-negative")
+    order = parse_order(order_by)
+    end = None if limit is None else offset + limit
+    if not order:
+        return list(records)[offset:end]
+
+    directions = {descending for _, descending in order}
+    if end is not None and len(directions) == 1:
+        descending = directions.pop()
+        keys = [_key(f, descending) for f, _ in order]
+        select = heapq.nlargest if descending else heapq.nsmallest
+        top = select(end, records, key=lambda r: tuple(k(r) for k in keys))
+        return top[offset:]
+
+    result = list(records)
+    # 마지막 키부터 안정 정렬을 반복해 방향이 섞인 다중 키 정렬
+    for field, descending in reversed(order):
+        result.sort(key=_key(field, descending), reverse=descending)
+    return result[offset:end]
@@ -0,0 +1,134 @@
+"""Per-store residency tracking with idle and LRU eviction for DataStore."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable
+
+from backend.data.rwlock import RWLock
+
+logger = logging.getLogger("datastore")
+
+
+@dataclass
+class StoreState:
+    """매장 1개의 메모리 상주 상태 (엔티티별 Lock, group commit 대기열).
+
+    pins는 Lock 획득~해제 구간에 있는 호출자 수입니다. 획득 대기 중
+    축출되어 같은 엔티티에 Lock이 둘 생기는 것을 막습니다.
+    """
+
+    locks: dict[str, RWLock] = field(default_factory=dict)
+    pending: dict[str, list[tuple[object, asyncio.Future]]] = field(default_factory=dict)
+    pins: int = 0
+    last_used: float = 0.0
+
+    def busy(self) -> bool:
+        """Lock 보유/대기 또는 처리 전 변경이 있으면 축출 불가."""
+        return (
+            self.pins > 0
+            or any(not lock.idle() for lock in self.locks.values())
+            or any(self.pending.values())
+        )
+
+
+class StoreResidency:
+    """매장 단위 상주 관리.
+
+    매장 상태는 처음 접근할 때 만들어지고 LRU 순서로 관리됩니다.
+    idle_seconds 동안 쓰이지 않았거나, 상주 매장 수가 max_stores를
+    넘거나, size_of로 잰 합계가 memory_budget을 넘으면 사용 중이 아닌
+    가장 오래된 매장부터 축출하고 on_evict로 캐시 등 부속 상태를 정리합니다.
+    각 한도가 0이면 해당 기준은 쓰지 않습니다.
+    """
+
+    def __init__(
+        self,
+        idle_seconds: float = 0.0,
+        max_stores: int = 0,
+        memory_budget: int = 0,
+        size_of: Callable[[str], int] = lambda store_id: 0,
+        on_evict: Callable[[str], None] = lambda store_id: None,
+    ) -> None:
+        self._idle_seconds = idle_seconds
+        self._max_stores = max_stores
+        self._memory_budget = memory_budget
+        self._size_of = size_of
+        self._on_evict = on_evict
+        self._stores: OrderedDict[str, StoreState] = OrderedDict()
+        self._evictions = 0
+
+    @property
+    def idle_seconds(self) -> float:
+        return self._idle_seconds
+
+    def touch(self, store_id: str) -> StoreState:
+        """매장 상태 반환 (없으면 생성), 최근 사용으로 표시."""
+        state = self._stores.get(store_id)
+        if state is None:
+            state = self._stores[store_id] = StoreState()
+            self.enforce(exclude=store_id)
+        else:
+            self._stores.move_to_end(store_id)
+        state.last_used = time.monotonic()
+        return state
+
+    def get(self, store_id: str) -> StoreState | None:
+        """상주 중인 매장 상태 (최근 사용 표시 없음)."""
+        return self._stores.get(store_id)
+
+    def enforce(self, exclude: str | None = None) -> list[str]:
+        """매장 수/메모리 한도를 넘으면 오래된 매장부터 축출."""
+        evicted: list[str] = []
+        while self._over_limit():
+            victim = next(
+                (
+                    store_id for store_id, state in self._stores.items()
+                    if store_id != exclude and not state.busy()
+                ),
+                None,
+            )
+            if victim is None:
+                break  # 모두 사용 중이면 한도를 잠시 넘도록 둠
+            self._evict(victim, "limit")
+            evicted.append(victim)
+        return evicted
+
+    def evict_idle(self, now: float | None = None) -> list[str]:
+        """idle_seconds 이상 쓰이지 않은 매장 축출."""
+        if self._idle_seconds <= 0:
+            return []
+        cutoff = (time.monotonic() if now is None else now) - self._idle_seconds
+        victims = [
+            store_id for store_id, state in self._stores.items()
+            if state.last_used <= cutoff and not state.busy()
+        ]
+        for store_id in victims:
+            self._evict(store_id, "idle")
+        return victims
+
+    def _over_limit(self) -> bool:
+        if self._max_stores and len(self._stores) > self._max_stores:
+            return True
+        if self._memory_budget:
+            return sum(self._size_of(s) for s in self._stores) > self._memory_budget
+        return False
+
+    def _evict(self, store_id: str, reason: str) -> None:
+        del self._stores[store_id]
+        self._on_evict(store_id)
+        self._evictions += 1
+        logger.info("store_evicted: store_id=%s, reason=%s", store_id, reason)
+
+    def stats(self) -> dict:
+        return {"resident_stores": len(self._stores), "evictions": self._evictions}
+
+    def __contains__(self, store_id: str) -> bool:
+        return store_id in self._stores
+
+    def __len__(self) -> int:
+        return len(self._stores)
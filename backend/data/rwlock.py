@@ -0,0 +1,93 @@
+"""asyncio reader/writer lock with writer preference."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+
+
+class RWLock:
+    """읽기 공유 / 쓰기 배타 Lock.
+
+    대기 중인 writer가 있으면 새 reader는 그 뒤에 줄을 서므로
+    (writer preference) 읽기가 몰려도 쓰기가 굶지 않습니다.
+    acquire()/release()는 asyncio.Lock과 같은 배타 잠금입니다.
+    """
+
+    def __init__(self) -> None:
+        self._readers = 0
+        self._writer = False
+        # (exclusive, future) FIFO
+        self._waiters: deque[tuple[bool, asyncio.Future]] = deque()
+
+    @property
+    def readers(self) -> int:
+        return self._readers
+
+    def locked(self) -> bool:
+        return self._writer
+
+    def idle(self) -> bool:
+        """보유자와 대기자가 모두 없음."""
+        return not self._writer and self._readers == 0 and not self._waiters
+
+    async def acquire_read(self) -> None:
+        if not self._writer and not self._waiters:
+            self._readers += 1
+            return
+        await self._wait(exclusive=False)
+
+    async def acquire_write(self) -> None:
+        if not self._writer and self._readers == 0 and not self._waiters:
+            self._writer = True
+            return
+        await self._wait(exclusive=True)
+
+    def release_read(self) -> None:
+        if self._readers <= 0:
+            raise RuntimeError("RWLock.release_read() called without a reader")
+        self._readers -= 1
+        if self._readers == 0:
+            self._wake()
+
+    def release_write(self) -> None:
+        if not self._writer:
+            raise RuntimeError("RWLock.release_write() called without a writer")
+        self._writer = False
+        self._wake()
+
+    acquire = acquire_write
+    release = release_write
+
+    async def _wait(self, exclusive: bool) -> None:
+        future = asyncio.get_running_loop().create_future()
+        item = (exclusive, future)
+        self._waiters.append(item)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 취소 직전에 잠금이 부여된 경우 되돌려 놓기
+                self.release_write() if exclusive else self.release_read()
+            else:
+                self._waiters.remove(item)
+                self._wake()
+            raise
+
+    def _wake(self) -> None:
+        while self._waiters:
+            exclusive, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            if exclusive:
+                if not self._writer and self._readers == 0:
+                    self._waiters.popleft()
+                    self._writer = True
+                    future.set_result(None)
+                return
+            if self._writer:
+                return
+            self._waiters.popleft()
+            self._readers += 1
+            future.set_result(None)
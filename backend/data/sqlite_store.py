@@ -0,0 +1,866 @@
+"""SQLite-backed data store with the same interface as DataStore."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping, TypeVar
+
+from backend.data import durability, query
+from backend.data.datastore import DEFAULT_PARTITIONS
+from backend.data.mutations import Predicate, satisfies
+from backend.data.query import OrderBy, Where
+from backend.data.transaction import Transaction
+from backend.exceptions import ConcurrencyError, NotFoundError, PreconditionFailedError
+
+logger = logging.getLogger("datastore")
+
+T = TypeVar("T")
+
+# 레코드에서 추출해 별도 컬럼으로 인덱싱하는 필드
+INDEXED_COLUMNS: tuple[str, ...] = ("id", "session_id", "table_number", "status")
+
+# iter()가 한 번에 가져오는 행 수
+_ITER_PAGE_SIZE = 256
+
+# fsync 정책 → PRAGMA synchronous (WAL 모드 기준)
+_SYNCHRONOUS = {
+    durability.FSYNC_ALWAYS: "FULL",
+    durability.FSYNC_BATCH: "NORMAL",
+    durability.FSYNC_OS: "OFF",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity TEXT NOT NULL,
+    store_id TEXT NOT NULL,
+    id TEXT,
+    session_id TEXT,
+    table_number INTEGER,
+    status TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_records_entity ON records (entity, store_id, seq);
+CREATE INDEX IF NOT EXISTS idx_records_id ON records (entity, store_id, id);
+CREATE INDEX IF NOT EXISTS idx_records_session ON records (entity, store_id, session_id);
+CREATE INDEX IF NOT EXISTS idx_records_table ON records (entity, store_id, table_number, status);
+CREATE INDEX IF NOT EXISTS idx_records_status ON records (entity, store_id, status);
+"""
+
+
+class SqliteDataStore:
+    """stdlib sqlite3 기반 데이터 저장소 (WAL 모드).
+
+    DataStore와 동일한 read/write/find_by_id/find_by/append/update/delete
+    인터페이스를 제공합니다. 모든 DB 작업은 전용 스레드 1개에서
+    직렬 실행되므로 이벤트 루프를 막지 않고 커넥션을 공유하지 않습니다.
+
+    transaction()의 변경은 SQLite 트랜잭션 하나로 커밋됩니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/datastore.sqlite3",
+        lock_timeout: float = 5.0,
+        partitions: Mapping[str, str] | None = None,
+        fsync: str = durability.FSYNC_BATCH,
+    ) -> None:
+        if fsync not in _SYNCHRONOUS:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self._synchronous = _SYNCHRONOUS[fsync]
+        self._db_path = Path(db_path)
+        self._lock_timeout = lock_timeout
+        # 구간 조회 대상 필드 (DataStore의 파티션 키와 동일, 표현식 인덱스 사용)
+        self._partitions = dict(DEFAULT_PARTITIONS if partitions is None else partitions)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-datastore")
+        self._conn: sqlite3.Connection | None = None
+        self._tx_lock = asyncio.Lock()
+        # (entity, store_id)별 이 커넥션의 쓰기 횟수와 마지막 쓰기 전후 시그니처
+        self._write_counts: dict[tuple[str, str], int] = {}
+        self._written: dict[tuple[str, str], tuple[object, object]] = {}
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # ── Connection (전용 스레드에서만 접근) ──
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(str(self._db_path), timeout=self._lock_timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self._synchronous}")
+            conn.executescript(_SCHEMA)
+            for field in set(self._partitions.values()):
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_records_range_{field} "
+                    f"ON records (entity, store_id, {_json_path(field)})"
+                )
+            self._conn = conn
+            logger.info("sqlite_opened: path=%s", self._db_path)
+        return self._conn
+
+    async def _run(self, fn: Callable[..., T], *args: object) -> T:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, fn, *args)
+        except sqlite3.OperationalError as e:
+            if "locked" in str(e) or "busy" in str(e):
+                logger.error("lock_timeout: db=%s, error=%s", self._db_path, str(e))
+                raise ConcurrencyError(f"Database lock timeout after {self._lock_timeout}s")
+            raise
+
+    async def _acquire_tx_lock(self, store_id: str = "") -> None:
+        try:
+            await asyncio.wait_for(self._tx_lock.acquire(), timeout=self._lock_timeout)
+        except asyncio.TimeoutError:
+            logger.error("lock_timeout: db=%s, store_id=%s", self._db_path, store_id)
+            raise ConcurrencyError(f"Transaction lock timeout after {self._lock_timeout}s")
+
+    async def _write(
+        self, fn: Callable[..., T], *args: object, key: tuple[str, str] | None = None,
+    ) -> T:
+        """쓰기 실행. 진행 중인 transaction()과 같은 커넥션을 쓰므로 끝날 때까지 대기.
+
+        key는 변경되는 (entity, store_id)로, 생략하면 args 앞의 두 값입니다.
+        """
+        key = key or (args[0], args[1])
+
+        def write() -> T:
+            result = fn(*args)
+            self._mark_written_sync([key])
+            return result
+
+        await self._acquire_tx_lock()
+        try:
+            return await self._run(write)
+        finally:
+            self._tx_lock.release()
+
+    def _signature_sync(self, key: tuple[str, str]) -> tuple[int, int]:
+        # data_version: 다른 커넥션의 커밋마다 바뀜, 쓰기 횟수: 이 커넥션의 변경
+        data_version = self._connection().execute("PRAGMA data_version").fetchone()[0]
+        return (data_version, self._write_counts.get(key, 0))
+
+    def _mark_written_sync(self, keys: Iterable[tuple[str, str]]) -> None:
+        for key in keys:
+            data_version, count = self._signature_sync(key)
+            self._write_counts[key] = count + 1
+            self._written[key] = ((data_version, count), (data_version, count + 1))
+
+    def io_metrics(self) -> dict:
+        """DataStore 호환용 (모든 작업이 전용 스레드 1개에서 실행)."""
+        return {"workers": 1}
+
+    def evict_idle_stores(self) -> list[str]:
+        """DataStore 호환용 (매장별 메모리 상주 상태 없음)."""
+        return []
+
+    def residency_stats(self) -> dict:
+        """DataStore 호환용 (매장별 메모리 상주 상태 없음)."""
+        return {"resident_stores": 0, "evictions": 0, "cached_entities": 0}
+
+    async def start(self) -> None:
+        """DataStore 호환용 (SQLite는 자체 WAL 체크포인트 사용)."""
+
+    async def checkpoint(self) -> int:
+        """WAL 내용을 DB 파일에 반영. DataStore와 달리 컴팩션할 저널이 없어 0 반환."""
+        await self._run(lambda: self._connection().execute("PRAGMA wal_checkpoint(PASSIVE)"))
+        return 0
+
+    async def close(self) -> None:
+        """커넥션 종료 및 전용 스레드 정리."""
+        def _close() -> None:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+        await asyncio.get_running_loop().run_in_executor(self._executor, _close)
+        self._executor.shutdown(wait=True)
+
+    # ── Row Helpers ──
+
+    @staticmethod
+    def _columns(record: dict) -> tuple:
+        return (
+            _as_text(record.get("id")),
+            _as_text(record.get("session_id")),
+            record.get("table_number") if isinstance(record.get("table_number"), int) else None,
+            _as_text(record.get("status")),
+            json.dumps(record, ensure_ascii=False),
+        )
+
+    def _insert(self, conn: sqlite3.Connection, entity: str, store_id: str, record: dict) -> None:
+        conn.execute(
+            "INSERT INTO records (entity, store_id, id, session_id, table_number, status, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (entity, store_id, *self._columns(record)),
+        )
+
+    def _update_row(self, conn: sqlite3.Connection, seq: int, record: dict) -> None:
+        conn.execute(
+            "UPDATE records SET id = ?, session_id = ?, table_number = ?, status = ?, data = ? "
+            "WHERE seq = ?",
+            (*self._columns(record), seq),
+        )
+
+    def _select_by_id(
+        self, conn: sqlite3.Connection, entity: str, store_id: str, id: str,
+    ) -> tuple[int, dict] | None:
+        row = conn.execute(
+            "SELECT seq, data FROM records WHERE entity = ? AND store_id = ? AND id = ? "
+            "ORDER BY seq LIMIT 1",
+            (entity, store_id, id),
+        ).fetchone()
+        return None if row is None else (row[0], json.loads(row[1]))
+
+    # ── Sync Operations (전용 스레드) ──
+
+    def _read_sync(self, entity: str, store_id: str) -> list[dict]:
+        rows = self._connection().execute(
+            "SELECT data FROM records WHERE entity = ? AND store_id = ? ORDER BY seq",
+            (entity, store_id),
+        ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def _write_sync(self, entity: str, store_id: str, data: list[dict]) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "DELETE FROM records WHERE entity = ? AND store_id = ?", (entity, store_id),
+            )
+            for record in data:
+                self._insert(conn, entity, store_id, record)
+
+    def _read_range_sync(
+        self, entity: str, store_id: str, field: str, start: str | None, end: str | None,
+    ) -> list[dict]:
+        sql = "SELECT data FROM records WHERE entity = ? AND store_id = ?"
+        params: list[object] = [entity, store_id]
+        if start is not None:
+            sql += f" AND {_json_path(field)} >= ?"
+            params.append(start)
+        if end is not None:
+            sql += f" AND {_json_path(field)} <= ?"
+            params.append(end)
+        rows = self._connection().execute(sql + " ORDER BY seq", params).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def _page_sync(
+        self,
+        entity: str,
+        store_id: str,
+        after: int,
+        range_: tuple[str, str | None, str | None] | None,
+        size: int,
+    ) -> list[tuple[int, str]]:
+        sql = "SELECT seq, data FROM records WHERE entity = ? AND store_id = ? AND seq > ?"
+        params: list[object] = [entity, store_id, after]
+        if range_ is not None:
+            field, start, end = range_
+            if start is not None:
+                sql += f" AND {_json_path(field)} >= ?"
+                params.append(start)
+            if end is not None:
+                sql += f" AND {_json_path(field)} <= ?"
+                params.append(end)
+        return self._connection().execute(
+            sql + " ORDER BY seq LIMIT ?", (*params, size),
+        ).fetchall()
+
+    def _find_by_sync(
+        self, entity: str, store_id: str, fields: tuple[str, ...], values: tuple,
+    ) -> list[dict]:
+        indexed = [(f, v) for f, v in zip(fields, values) if f in INDEXED_COLUMNS]
+        sql = "SELECT data FROM records WHERE entity = ? AND store_id = ?"
+        params: list[object] = [entity, store_id]
+        for f, v in indexed:
+            if v is None:
+                sql += f" AND {f} IS NULL"
+            else:
+                sql += f" AND {f} = ?"
+                params.append(v)
+        rows = self._connection().execute(sql + " ORDER BY seq", params).fetchall()
+        records = [json.loads(r[0]) for r in rows]
+        # 컬럼 변환(문자열화 등)과 비인덱스 필드는 원본 값으로 재확인
+        return [r for r in records if tuple(r.get(f) for f in fields) == values]
+
+    def _query_sync(
+        self,
+        entity: str,
+        store_id: str,
+        where: Where,
+        order: list[tuple[str, bool]],
+        limit: int | None,
+        offset: int,
+        range_: tuple[str, str | None, str | None] | None,
+    ) -> list[dict]:
+        sql = "SELECT data FROM records WHERE entity = ? AND store_id = ?"
+        params: list[object] = [entity, store_id]
+        for f, v in where.items():
+            if v is None:
+                sql += f" AND {_json_path(f)} IS NULL"
+            elif f in INDEXED_COLUMNS and isinstance(v, int if f == "table_number" else str) \
+                    and not isinstance(v, bool):
+                sql += f" AND {f} = ?"
+                params.append(v)
+            else:
+                sql += f" AND {_json_path(f)} = ?"
+                params.append(v)
+        if range_ is not None:
+            field, start, end = range_
+            if start is not None:
+                sql += f" AND {_json_path(field)} >= ?"
+                params.append(start)
+            if end is not None:
+                sql += f" AND {_json_path(field)} <= ?"
+                params.append(end)
+        # 값 없는(NULL) 레코드는 방향과 무관하게 마지막 (query.page와 동일)
+        terms = [
+            f"{_json_path(f)} IS NULL, {_json_path(f)}{' DESC' if desc else ''}"
+            for f, desc in order
+        ]
+        sql += " ORDER BY " + ", ".join([*terms, "seq"])
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset])
+        rows = self._connection().execute(sql, params).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def _next_sequence_sync(self, store_id: str, name: str, floor: int) -> int:
+        from backend.models.schemas import utc_now
+
+        conn = self._connection()
+        # 읽기 전에 쓰기 잠금을 잡아 다른 프로세스와 같은 값을 읽지 않음
+        with _immediate(conn):
+            found = self._select_by_id(conn, "sequences", store_id, name)
+            if found is None:
+                record = {"id": name, "value": floor + 1, "updated_at": utc_now()}
+                self._insert(conn, "sequences", store_id, record)
+            else:
+                seq, record = found
+                record.update(value=max(record.get("value", 0), floor) + 1, updated_at=utc_now())
+                self._update_row(conn, seq, record)
+        return record["value"]
+
+    def _find_by_ids_sync(self, entity: str, store_id: str, ids: list[str]) -> dict[str, dict]:
+        found: dict[str, dict] = {}
+        conn = self._connection()
+        # SQLite 바인딩 변수 수 제한을 넘지 않도록 나눠서 조회
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            rows = conn.execute(
+                "SELECT id, data FROM records WHERE entity = ? AND store_id = ? "
+                f"AND id IN ({', '.join('?' * len(chunk))}) ORDER BY seq",
+                (entity, store_id, *chunk),
+            ).fetchall()
+            for id, raw in rows:
+                found.setdefault(id, json.loads(raw))
+        return found
+
+    def _append_sync(self, entity: str, store_id: str, record: dict) -> None:
+        conn = self._connection()
+        with conn:
+            self._insert(conn, entity, store_id, record)
+
+    def _update_sync(self, entity: str, store_id: str, id: str, updates: dict) -> dict:
+        from backend.models.schemas import utc_now
+
+        conn = self._connection()
+        with _immediate(conn):
+            found = self._select_by_id(conn, entity, store_id, id)
+            if found is None:
+                raise NotFoundError(entity, id)
+            seq, record = found
+            record.update(updates)
+            record["updated_at"] = utc_now()
+            self._update_row(conn, seq, record)
+        return record
+
+    def _update_if_sync(
+        self,
+        entity: str,
+        store_id: str,
+        id: str,
+        expected: Mapping[str, object] | Predicate,
+        updates: dict,
+    ) -> tuple[dict, dict]:
+        from backend.models.schemas import utc_now
+
+        conn = self._connection()
+        with _immediate(conn):
+            found = self._select_by_id(conn, entity, store_id, id)
+            if found is None:
+                raise NotFoundError(entity, id)
+            seq, record = found
+            if not satisfies(record, expected):
+                raise PreconditionFailedError(entity, id, record)
+            before = dict(record)
+            record.update(updates)
+            record["updated_at"] = utc_now()
+            self._update_row(conn, seq, record)
+        return before, record
+
+    def _delete_sync(self, entity: str, store_id: str, id: str) -> None:
+        conn = self._connection()
+        with conn:
+            cur = conn.execute(
+                "DELETE FROM records WHERE entity = ? AND store_id = ? AND id = ?",
+                (entity, store_id, id),
+            )
+            if cur.rowcount == 0:
+                raise NotFoundError(entity, id)
+
+    def _update_many_sync(
+        self, entity: str, store_id: str, updates_by_id: dict[str, dict],
+    ) -> dict[str, dict | None]:
+        from backend.models.schemas import utc_now
+
+        now = utc_now()
+        results: dict[str, dict | None] = {}
+        conn = self._connection()
+        with _immediate(conn):
+            for id, updates in updates_by_id.items():
+                found = self._select_by_id(conn, entity, store_id, id)
+                if found is None:
+                    results[id] = None
+                    continue
+                seq, record = found
+                record.update(updates)
+                record["updated_at"] = now
+                self._update_row(conn, seq, record)
+                results[id] = record
+        return results
+
+    def _update_many_if_sync(
+        self,
+        entity: str,
+        store_id: str,
+        updates_by_id: dict[str, dict],
+        expected: Mapping[str, object] | Predicate,
+    ) -> dict[str, tuple[dict | None, dict | None]]:
+        from backend.models.schemas import utc_now
+
+        now = utc_now()
+        results: dict[str, tuple[dict | None, dict | None]] = {}
+        conn = self._connection()
+        with _immediate(conn):
+            for id, updates in updates_by_id.items():
+                found = self._select_by_id(conn, entity, store_id, id)
+                if found is None:
+                    results[id] = (None, None)
+                    continue
+                seq, record = found
+                if not satisfies(record, expected):
+                    results[id] = (record, None)
+                    continue
+                before = dict(record)
+                record.update(updates)
+                record["updated_at"] = now
+                self._update_row(conn, seq, record)
+                results[id] = (before, record)
+        return results
+
+    def _delete_many_sync(self, entity: str, store_id: str, ids: list[str]) -> dict[str, bool]:
+        results: dict[str, bool] = {}
+        conn = self._connection()
+        with conn:
+            for id in ids:
+                cur = conn.execute(
+                    "DELETE FROM records WHERE entity = ? AND store_id = ? AND id = ?",
+                    (entity, store_id, id),
+                )
+                results[id] = cur.rowcount > 0
+        return results
+
+    def _update_where_sync(
+        self, entity: str, store_id: str, predicate: Predicate, updates: dict,
+    ) -> list[dict]:
+        from backend.models.schemas import utc_now
+
+        values = {**updates, "updated_at": utc_now()}
+        updated: list[dict] = []
+        conn = self._connection()
+        with _immediate(conn):
+            rows = conn.execute(
+                "SELECT seq, data FROM records WHERE entity = ? AND store_id = ? ORDER BY seq",
+                (entity, store_id),
+            ).fetchall()
+            for seq, raw in rows:
+                record = json.loads(raw)
+                if predicate(record):
+                    record.update(values)
+                    self._update_row(conn, seq, record)
+                    updated.append(record)
+        return updated
+
+    def _delete_where_sync(self, entity: str, store_id: str, predicate: Predicate) -> list[str]:
+        deleted: list[str] = []
+        conn = self._connection()
+        with _immediate(conn):
+            rows = conn.execute(
+                "SELECT seq, data FROM records WHERE entity = ? AND store_id = ? ORDER BY seq",
+                (entity, store_id),
+            ).fetchall()
+            for seq, raw in rows:
+                record = json.loads(raw)
+                if predicate(record):
+                    conn.execute("DELETE FROM records WHERE seq = ?", (seq,))
+                    deleted.append(record.get("id"))
+        return deleted
+
+    def _rows_sync(self, entity: str, store_id: str) -> list[tuple[int, str]]:
+        return self._connection().execute(
+            "SELECT seq, data FROM records WHERE entity = ? AND store_id = ? ORDER BY seq",
+            (entity, store_id),
+        ).fetchall()
+
+    def _begin_sync(self) -> None:
+        self._connection().execute("BEGIN IMMEDIATE")
+
+    def _commit_sync(self, keys: list[tuple[str, str]]) -> None:
+        self._connection().commit()
+        self._mark_written_sync(keys)
+
+    def _rollback_sync(self) -> None:
+        self._connection().rollback()
+
+    def _apply_sync(
+        self,
+        store_id: str,
+        changes: dict[str, tuple[list[dict], list[dict] | None]],
+    ) -> None:
+        """트랜잭션 변경 반영 (BEGIN IMMEDIATE 안에서 호출). 저널 항목이 있으면 레코드 단위로 적용."""
+        conn = self._connection()
+        for entity, (data, entries) in changes.items():
+            if entries is None:
+                conn.execute(
+                    "DELETE FROM records WHERE entity = ? AND store_id = ?",
+                    (entity, store_id),
+                )
+                for record in data:
+                    self._insert(conn, entity, store_id, record)
+                continue
+            for entry in entries:
+                op = entry.get("op")
+                if op == "append":
+                    self._insert(conn, entity, store_id, entry["record"])
+                elif op == "delete":
+                    conn.execute(
+                        "DELETE FROM records WHERE entity = ? AND store_id = ? AND id = ?",
+                        (entity, store_id, entry["id"]),
+                    )
+                elif op == "update":
+                    found = self._select_by_id(conn, entity, store_id, entry["id"])
+                    if found is None:
+                        raise NotFoundError(entity, entry["id"])
+                    seq, record = found
+                    self._update_row(conn, seq, {**record, **entry["set"]})
+
+    # ── Public API ──
+
+    async def read(self, entity: str, store_id: str) -> list[dict]:
+        """엔티티 전체 데이터 읽기."""
+        return await self._run(self._read_sync, entity, store_id)
+
+    async def signature(self, entity: str, store_id: str) -> object:
+        """변경 감지용 시그니처 (DataStore.signature와 동일한 용도).
+
+        다른 커넥션의 변경은 엔티티 구분 없이 DB 단위로 감지하므로, 다른
+        엔티티가 바뀌어도 달라질 수 있습니다(무효화가 늘어날 뿐 누락은 없음).
+        """
+        return await self._run(self._signature_sync, (entity, store_id))
+
+    def written_signature(self, entity: str, store_id: str) -> tuple[object, object] | None:
+        """이 인스턴스가 마지막으로 기록한 (기록 직전, 기록 직후) 시그니처.
+
+        기록 직후의 data_version으로 계산하므로, 그 사이 다른 커넥션이
+        커밋했다면 기록 직전 시그니처가 이전에 관찰한 값과 달라집니다.
+        """
+        return self._written.get((entity, store_id))
+
+    async def read_range(
+        self,
+        entity: str,
+        store_id: str,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> list[dict]:
+        """키 필드가 [start, end] 구간인 레코드 (DataStore.read_range와 동일)."""
+        field = self._partitions.get(entity)
+        if field is None:
+            raise ValueError(f"Entity '{entity}' is not partitioned")
+        return await self._run(self._read_range_sync, entity, store_id, field, start, end)
+
+    async def iter(
+        self,
+        entity: str,
+        store_id: str,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> AsyncIterator[dict]:
+        """레코드를 하나씩 생성 (DataStore.iter와 동일, seq 기준 페이지 조회)."""
+        range_ = None
+        if start is not None or end is not None:
+            field = self._partitions.get(entity)
+            if field is None:
+                raise ValueError(f"Entity '{entity}' is not partitioned")
+            range_ = (field, start, end)
+        after = 0
+        while rows := await self._run(
+            self._page_sync, entity, store_id, after, range_, _ITER_PAGE_SIZE,
+        ):
+            for _, raw in rows:
+                yield json.loads(raw)
+            after = rows[-1][0]
+
+    def partition_for(self, entity: str, record: dict) -> str:
+        """DataStore 호환용 (SQLite는 물리 파티션 없이 인덱스로 구간 조회)."""
+        return entity
+
+    async def write(self, entity: str, store_id: str, data: list[dict]) -> None:
+        """엔티티 전체 데이터 쓰기 (덮어쓰기)."""
+        await self._write(self._write_sync, entity, store_id, data)
+        logger.info(
+            "write: entity=%s, store_id=%s, records=%d",
+            entity, store_id, len(data),
+        )
+
+    async def find_by_id(
+        self, entity: str, store_id: str, id: str
+    ) -> dict | None:
+        """ID로 단건 조회."""
+        found = await self.find_by(entity, store_id, "id", id)
+        return found[0] if found else None
+
+    async def find_by_ids(
+        self, entity: str, store_id: str, ids: Iterable[str],
+    ) -> dict[str, dict]:
+        """여러 ID를 한 번의 쿼리로 조회 (DataStore.find_by_ids와 동일)."""
+        return await self._run(self._find_by_ids_sync, entity, store_id, list(dict.fromkeys(ids)))
+
+    async def find_by(
+        self,
+        entity: str,
+        store_id: str,
+        field: str | tuple[str, ...],
+        value: object,
+    ) -> list[dict]:
+        """필드 값 일치 조회. id/session_id/table_number/status는 인덱스 사용."""
+        fields = (field,) if isinstance(field, str) else tuple(field)
+        values = (value,) if isinstance(field, str) else tuple(value)
+        return await self._run(self._find_by_sync, entity, store_id, fields, values)
+
+    async def query(
+        self,
+        entity: str,
+        store_id: str,
+        where: Where | None = None,
+        order_by: OrderBy | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> list[dict]:
+        """조건/정렬/페이지를 SQL로 처리 (DataStore.query와 동일)."""
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset and limit must be non-negative")
+        where = dict(where or {})
+        if any(isinstance(v, (dict, list)) for v in where.values()):
+            # 바인딩할 수 없는 값은 메모리에서 비교
+            records = await self.query(entity, store_id, start=start, end=end)
+            matched = [r for r in records if query.matches(r, where)]
+            return query.page(matched, order_by, limit, offset)
+        range_ = None
+        if start is not None or end is not None:
+            field = self._partitions.get(entity)
+            if field is None:
+                raise ValueError(f"Entity '{entity}' is not partitioned")
+            range_ = (field, start, end)
+        return await self._run(
+            self._query_sync, entity, store_id, where,
+            query.parse_order(order_by), limit, offset, range_,
+        )
+
+    async def append(self, entity: str, store_id: str, record: dict) -> None:
+        """레코드 추가."""
+        await self._write(self._append_sync, entity, store_id, record)
+        logger.info("append: entity=%s, store_id=%s", entity, store_id)
+
+    async def update(
+        self, entity: str, store_id: str, id: str, updates: dict
+    ) -> dict:
+        """레코드 수정. 수정된 레코드를 반환."""
+        updated = await self._write(self._update_sync, entity, store_id, id, updates)
+        logger.info(
+            "update: entity=%s, store_id=%s, id=%s",
+            entity, store_id, id,
+        )
+        return updated
+
+    async def update_if(
+        self,
+        entity: str,
+        store_id: str,
+        id: str,
+        expected: Mapping[str, object] | Predicate,
+        updates: dict,
+    ) -> tuple[dict, dict]:
+        """조건부 수정 (DataStore.update_if와 동일, SQLite 트랜잭션 1회)."""
+        result = await self._write(self._update_if_sync, entity, store_id, id, expected, updates)
+        logger.info(
+            "update_if: entity=%s, store_id=%s, id=%s",
+            entity, store_id, id,
+        )
+        return result
+
+    async def delete(self, entity: str, store_id: str, id: str) -> None:
+        """레코드 삭제."""
+        await self._write(self._delete_sync, entity, store_id, id)
+        logger.info(
+            "delete: entity=%s, store_id=%s, id=%s",
+            entity, store_id, id,
+        )
+
+    async def update_many(
+        self, entity: str, store_id: str, updates: Mapping[str, dict],
+    ) -> dict[str, dict | None]:
+        """여러 레코드 일괄 수정 (SQLite 트랜잭션 1회). 없는 id는 None."""
+        results = await self._write(self._update_many_sync, entity, store_id, dict(updates))
+        logger.info(
+            "update_many: entity=%s, store_id=%s, requested=%d, updated=%d",
+            entity, store_id, len(results), sum(r is not None for r in results.values()),
+        )
+        return results
+
+    async def update_many_if(
+        self,
+        entity: str,
+        store_id: str,
+        updates: Mapping[str, dict],
+        expected: Mapping[str, object] | Predicate,
+    ) -> dict[str, tuple[dict | None, dict | None]]:
+        """조건부 일괄 수정 (DataStore.update_many_if와 동일, SQLite 트랜잭션 1회)."""
+        results = await self._write(
+            self._update_many_if_sync, entity, store_id, dict(updates), expected,
+        )
+        logger.info(
+            "update_many_if: entity=%s, store_id=%s, requested=%d, updated=%d",
+            entity, store_id, len(results), sum(r[1] is not None for r in results.values()),
+        )
+        return results
+
+    async def delete_many(
+        self, entity: str, store_id: str, ids: Iterable[str],
+    ) -> dict[str, bool]:
+        """여러 레코드 일괄 삭제 (SQLite 트랜잭션 1회). {id: 삭제 여부} 반환."""
+        results = await self._write(
+            self._delete_many_sync, entity, store_id, list(dict.fromkeys(ids)),
+        )
+        logger.info(
+            "delete_many: entity=%s, store_id=%s, requested=%d, deleted=%d",
+            entity, store_id, len(results), sum(results.values()),
+        )
+        return results
+
+    async def update_where(
+        self, entity: str, store_id: str, predicate: Predicate, updates: dict,
+    ) -> list[dict]:
+        """조건에 맞는 레코드 일괄 수정. 수정된 레코드 목록 반환."""
+        updated = await self._write(self._update_where_sync, entity, store_id, predicate, updates)
+        logger.info(
+            "update_where: entity=%s, store_id=%s, updated=%d",
+            entity, store_id, len(updated),
+        )
+        return updated
+
+    async def delete_where(
+        self, entity: str, store_id: str, predicate: Predicate,
+    ) -> list[str]:
+        """조건에 맞는 레코드 일괄 삭제. 삭제된 id 목록 반환."""
+        deleted = await self._write(self._delete_where_sync, entity, store_id, predicate)
+        logger.info(
+            "delete_where: entity=%s, store_id=%s, deleted=%d",
+            entity, store_id, len(deleted),
+        )
+        return deleted
+
+    async def next_sequence(
+        self,
+        store_id: str,
+        name: str,
+        seed: Callable[[], Awaitable[int]] | None = None,
+    ) -> int:
+        """매장별 카운터의 다음 값 (DataStore.next_sequence와 동일)."""
+        floor = 0
+        if seed is not None and await self.find_by_id("sequences", store_id, name) is None:
+            floor = await seed()
+        return await self._write(
+            self._next_sequence_sync, store_id, name, floor, key=("sequences", store_id),
+        )
+
+    async def compact(self, entity: str, store_id: str) -> None:
+        """DataStore 호환용 (SQLite는 별도 컴팩션 불필요)."""
+
+    @asynccontextmanager
+    async def transaction(
+        self, store_id: str, entities: Iterable[str],
+    ) -> AsyncIterator[Transaction]:
+        """매장 내 여러 엔티티에 대한 원자적 변경 (DataStore.transaction과 동일).
+
+        본문 전체를 전용 커넥션의 BEGIN IMMEDIATE 안에서 실행하므로 읽은
+        뒤 다른 워커가 끼어들 수 없고, 이 프로세스의 다른 쓰기는 커밋될
+        때까지 기다립니다. 본문에서 예외가 나면 아무것도 기록하지 않습니다.
+        """
+        names = tuple(sorted(set(entities)))
+        await self._acquire_tx_lock(store_id)
+        try:
+            await self._run(self._begin_sync)
+
+            async def load(entity: str) -> list[dict]:
+                rows = await self._run(self._rows_sync, entity, store_id)
+                return [json.loads(raw) for _, raw in rows]
+
+            try:
+                tx = Transaction(store_id, names, load)
+                yield tx
+                changes = tx.changes()
+                if changes:
+                    await self._run(self._apply_sync, store_id, changes)
+                await self._run(self._commit_sync, [(entity, store_id) for entity in changes])
+            except BaseException:
+                # 취소되어도 전용 스레드에서 순서대로 롤백되도록
+                await asyncio.shield(self._run(self._rollback_sync))
+                raise
+            if changes:
+                logger.info(
+                    "transaction_committed: store_id=%s, entities=%s",
+                    store_id, ",".join(changes),
+                )
+        finally:
+            self._tx_lock.release()
+
+
+@contextmanager
+def _immediate(conn: sqlite3.Connection) -> Iterator[None]:
+    """쓰기 잠금을 먼저 잡는 트랜잭션 (읽은 뒤 다른 프로세스가 끼어들지 못함)."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+def _json_path(field: str) -> str:
+    if not field.isidentifier():
+        raise ValueError(f"Invalid field name: {field!r}")
+    return f"json_extract(data, '$.{field}')"
+
+
+def _as_text(value: object) -> str | None:
+    return None if value is None else str(value)
@@ -0,0 +1,99 @@
+"""Multi-entity transaction staging shared by the storage backends."""
+
+from __future__ import annotations
+
+from typing import Awaitable, Callable, Iterable, Mapping
+
+from backend.data import mutations
+from backend.data.mutations import Mutation, Predicate
+
+
+class Transaction:
+    """매장 단위 다중 엔티티 트랜잭션.
+
+    선언된 엔티티의 Lock을 보유한 상태에서 작업 사본에 변경을
+    즉시 적용(검증 오류는 호출 지점에서 발생)하고, 컨텍스트 종료 시
+    저장소가 변경된 엔티티마다 한 번씩 기록합니다. 예외로 빠져나가면
+    아무것도 기록되지 않습니다.
+    """
+
+    def __init__(
+        self,
+        store_id: str,
+        entities: tuple[str, ...],
+        load: Callable[[str], Awaitable[list[dict]]],
+    ) -> None:
+        self.store_id = store_id
+        self._entities = entities
+        self._load = load
+        self._working: dict[str, list[dict]] = {}
+        # {entity: 저널 항목 목록, None이면 전체 스냅샷 필요}
+        self._entries: dict[str, list[dict] | None] = {}
+
+    async def _data(self, entity: str) -> list[dict]:
+        if entity not in self._entities:
+            raise ValueError(f"Entity '{entity}' is not part of this transaction")
+        if entity not in self._working:
+            self._working[entity] = [dict(r) for r in await self._load(entity)]
+        return self._working[entity]
+
+    async def _apply(self, entity: str, mutation: Mutation) -> object:
+        data = await self._data(entity)
+        result, entries = mutation(data, None)
+        if entries == []:
+            return result
+        staged = self._entries.setdefault(entity, [])
+        if entries is None or staged is None:
+            self._entries[entity] = None
+        else:
+            staged.extend(entries)
+        return result
+
+    async def read(self, entity: str) -> list[dict]:
+        """스테이징된 변경이 반영된 엔티티 데이터."""
+        return [dict(r) for r in await self._data(entity)]
+
+    async def find_by(
+        self, entity: str, field: str | tuple[str, ...], value: object,
+    ) -> list[dict]:
+        fields = (field,) if isinstance(field, str) else tuple(field)
+        values = (value,) if isinstance(field, str) else tuple(value)
+        return [
+            dict(r) for r in await self._data(entity)
+            if tuple(r.get(f) for f in fields) == values
+        ]
+
+    async def write(self, entity: str, data: list[dict]) -> None:
+        await self._apply(entity, mutations.replace_op([dict(r) for r in data]))
+
+    async def append(self, entity: str, record: dict) -> None:
+        await self._apply(entity, mutations.append_op(dict(record)))
+
+    async def update(self, entity: str, id: str, updates: dict) -> dict:
+        return await self._apply(entity, mutations.update_op(entity, id, updates))
+
+    async def delete(self, entity: str, id: str) -> None:
+        await self._apply(entity, mutations.delete_op(entity, id))
+
+    async def update_many(
+        self, entity: str, updates: Mapping[str, dict],
+    ) -> dict[str, dict | None]:
+        return await self._apply(entity, mutations.update_many_op(dict(updates)))
+
+    async def delete_many(self, entity: str, ids: Iterable[str]) -> dict[str, bool]:
+        return await self._apply(entity, mutations.delete_many_op(ids))
+
+    async def update_where(
+        self, entity: str, predicate: Predicate, updates: dict,
+    ) -> list[dict]:
+        return await self._apply(entity, mutations.update_where_op(predicate, dict(updates)))
+
+    async def delete_where(self, entity: str, predicate: Predicate) -> list[str]:
+        return await self._apply(entity, mutations.delete_where_op(predicate))
+
+    def changes(self) -> dict[str, tuple[list[dict], list[dict] | None]]:
+        """{entity: (새 데이터, 저널 항목 또는 None)} — 변경된 엔티티만."""
+        return {
+            entity: (self._working[entity], entries)
+            for entity, entries in self._entries.items()
+        }
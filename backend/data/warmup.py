@@ -0,0 +1,74 @@
+"""Startup cache warm-up: preload hot entities for every store concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Iterable, Protocol
+
+logger = logging.getLogger("datastore")
+
+DEFAULT_WARMUP_ENTITIES = ("menus", "tables", "sessions", "orders")
+
+
+class _Readable(Protocol):
+    async def read(self, entity: str, store_id: str) -> list[dict]: ...
+
+
+class CacheWarmer:
+    """재시작 직후 매장별 주요 엔티티를 미리 읽어 캐시를 채웁니다.
+
+    stores가 비어 있으면 stores.json의 모든 매장을 대상으로 하며,
+    동시에 준비하는 매장 수는 concurrency로 제한합니다. 한 매장의
+    실패는 기록만 하고 나머지 매장 준비는 계속합니다(캐시는 최적화일 뿐).
+    max_resident_stores보다 많은 매장을 준비하면 먼저 준비한 매장이
+    축출되므로 stores로 대상을 좁히세요.
+    """
+
+    def __init__(
+        self,
+        datastore: _Readable,
+        entities: Iterable[str] = DEFAULT_WARMUP_ENTITIES,
+        stores: Iterable[str] = (),
+        concurrency: int = 4,
+    ) -> None:
+        self._datastore = datastore
+        self._entities = tuple(entities)
+        self._stores = tuple(stores)
+        self._concurrency = max(1, concurrency)
+        self._durations: dict[str, float] = {}
+
+    async def run(self) -> dict[str, float]:
+        """전체 매장 준비. {store_id: 소요 시간(초)} 반환."""
+        start = time.perf_counter()
+        store_ids = self._stores or [
+            store["id"] for store in await self._datastore.read("stores", "")
+        ]
+        slots = asyncio.Semaphore(self._concurrency)
+
+        async def warm(store_id: str) -> None:
+            async with slots:
+                await self._warm_store(store_id)
+
+        await asyncio.gather(*(warm(store_id) for store_id in store_ids))
+        logger.info(
+            "warmup_completed: stores=%d, duration_ms=%.1f",
+            len(self._durations), (time.perf_counter() - start) * 1000,
+        )
+        return dict(self._durations)
+
+    async def _warm_store(self, store_id: str) -> None:
+        start = time.perf_counter()
+        try:
+            for entity in self._entities:
+                await self._datastore.read(entity, store_id)
+        except Exception as e:
+            logger.error("warmup_failed: store_id=%s, error=%s", store_id, str(e))
+            return
+        elapsed = time.perf_counter() - start
+        self._durations[store_id] = elapsed
+        logger.info(
+            "store_warmed: store_id=%s, entities=%d, duration_ms=%.1f",
+            store_id, len(self._entities), elapsed * 1000,
+        )
@@ -4,18 +4,83 @@ from __future__ import annotations
 
 from functools import lru_cache
 
-from backend.config import DATA_DIR, LOCK_TIMEOUT
+from backend.config import (
+    DATA_DIR,
+    DATASTORE_BACKEND,
+    DATASTORE_CACHE_BUDGET_BYTES,
+    DATASTORE_CACHE_ENABLED,
+    DATASTORE_CHECKPOINT_INTERVAL,
+    DATASTORE_CODEC,
+    DATASTORE_ENTITY_CODECS,
+    DATASTORE_FSYNC,
+    DATASTORE_FSYNC_INTERVAL_MS,
+    DATASTORE_GROUP_COMMIT_MAX_BATCH,
+    DATASTORE_GROUP_COMMIT_WINDOW,
+    DATASTORE_IO_INLINE_THRESHOLD,
+    DATASTORE_IO_WORKERS,
+    DATASTORE_JOURNAL_COMPACT_THRESHOLD,
+    DATASTORE_JOURNAL_ENTITIES,
+    DATASTORE_MAX_RESIDENT_STORES,
+    DATASTORE_PROCESS_LOCKS,
+    DATASTORE_STORE_IDLE_SECONDS,
+    DATASTORE_WARMUP_CONCURRENCY,
+    DATASTORE_WARMUP_ENTITIES,
+    DATASTORE_WARMUP_STORES,
+    IDEMPOTENCY_MAX_KEYS,
+    IDEMPOTENCY_TTL_SECONDS,
+    LOCK_TIMEOUT,
+    SESSION_ARCHIVE_GRACE_SECONDS,
+    SESSION_ARCHIVE_INTERVAL,
+    SQLITE_PATH,
+)
 from backend.data.datastore import DataStore
+from backend.data.sqlite_store import SqliteDataStore
+from backend.data.warmup import CacheWarmer
 from backend.services.auth_service import AuthService
 from backend.services.event_bus import EventBus
+from backend.services.idempotency import IdempotencyStore
 from backend.services.menu_service import MenuService
 from backend.services.order_service import OrderService
+from backend.services.order_summary import OrderSummaryTracker
+from backend.services.session_compactor import SessionCompactor
 from backend.services.table_service import TableService
 
 
 @lru_cache
-def get_datastore() -> DataStore:
-    return DataStore(base_path=DATA_DIR, lock_timeout=LOCK_TIMEOUT)
+def get_datastore() -> DataStore | SqliteDataStore:
+    if DATASTORE_BACKEND == "sqlite":
+        return SqliteDataStore(
+            db_path=SQLITE_PATH, lock_timeout=LOCK_TIMEOUT, fsync=DATASTORE_FSYNC,
+        )
+    return DataStore(
+        base_path=DATA_DIR,
+        lock_timeout=LOCK_TIMEOUT,
+        cache_enabled=DATASTORE_CACHE_ENABLED,
+        journal_entities=DATASTORE_JOURNAL_ENTITIES,
+        journal_compact_threshold=DATASTORE_JOURNAL_COMPACT_THRESHOLD,
+        group_commit_window=DATASTORE_GROUP_COMMIT_WINDOW,
+        group_commit_max_batch=DATASTORE_GROUP_COMMIT_MAX_BATCH,
+        process_locks=DATASTORE_PROCESS_LOCKS,
+        fsync=DATASTORE_FSYNC,
+        fsync_interval=DATASTORE_FSYNC_INTERVAL_MS / 1000,
+        checkpoint_interval=DATASTORE_CHECKPOINT_INTERVAL,
+        codec=DATASTORE_CODEC,
+        entity_codecs=DATASTORE_ENTITY_CODECS,
+        io_workers=DATASTORE_IO_WORKERS,
+        io_inline_threshold=DATASTORE_IO_INLINE_THRESHOLD,
+        store_idle_seconds=DATASTORE_STORE_IDLE_SECONDS,
+        max_resident_stores=DATASTORE_MAX_RESIDENT_STORES,
+        cache_budget_bytes=DATASTORE_CACHE_BUDGET_BYTES,
+    )
+
+
+def get_cache_warmer() -> CacheWarmer:
+    return CacheWarmer(
+        get_datastore(),
+        entities=DATASTORE_WARMUP_ENTITIES,
+        stores=DATASTORE_WARMUP_STORES,
+        concurrency=DATASTORE_WARMUP_CONCURRENCY,
+    )
 
 
 @lru_cache
@@ -23,6 +88,20 @@ def get_event_bus() -> EventBus:
     return EventBus()
 
 
+@lru_cache
+def get_idempotency_store() -> IdempotencyStore:
+    return IdempotencyStore(
+        datastore=get_datastore(),
+        ttl_seconds=IDEMPOTENCY_TTL_SECONDS,
+        max_entries=IDEMPOTENCY_MAX_KEYS,
+    )
+
+
+@lru_cache
+def get_order_summary_tracker() -> OrderSummaryTracker:
+    return OrderSummaryTracker(datastore=get_datastore())
+
+
 def get_auth_service() -> AuthService:
     return AuthService(datastore=get_datastore())
 
@@ -36,6 +115,7 @@ def get_order_service() -> OrderService:
         datastore=get_datastore(),
         event_bus=get_event_bus(),
         menu_service=get_menu_service(),
+        summaries=get_order_summary_tracker(),
     )
 
 
@@ -44,3 +124,14 @@ def get_table_service() -> TableService:
         datastore=get_datastore(),
         order_service=get_order_service(),
     )
+
+
+@lru_cache
+def get_session_compactor() -> SessionCompactor:
+    return SessionCompactor(
+        datastore=get_datastore(),
+        table_service=get_table_service(),
+        idempotency=get_idempotency_store(),
+        interval=SESSION_ARCHIVE_INTERVAL,
+        grace_seconds=SESSION_ARCHIVE_GRACE_SECONDS,
+    )
@@ -41,6 +41,16 @@ class ConcurrencyError(Exception):
         super().__init__(message)
 
 
+class PreconditionFailedError(Exception):
+    """조건부 수정 시 레코드가 기대한 상태가 아님 (409)."""
+
+    def __init__(self, entity: str, id: str, current: dict) -> None:
+        self.entity = entity
+        self.id = id
+        self.current = current
+        super().__init__(f"{entity} with id '{id}' does not match the expected state")
+
+
 class DataCorruptionError(Exception):
     """데이터 파일 손상 (500)."""
 
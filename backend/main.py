@@ -1,13 +1,40 @@
 """FastAPI application entry point for the table order system."""
 
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.config import APP_TITLE, APP_VERSION, CORS_ORIGINS
+from backend.config import APP_TITLE, APP_VERSION, CORS_ORIGINS, DATASTORE_WARMUP_ENABLED
+from backend.dependencies import get_cache_warmer, get_datastore, get_session_compactor
 from backend.middleware.error_handler import register_exception_handlers
 from backend.routers import admin, customer, sse
 
-app = FastAPI(title=APP_TITLE, version=APP_VERSION)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """DataStore 저널 복구/체크포인트·캐시 워밍업·세션 보관 시작 및 종료 시 정리.
+
+    워밍업은 백그라운드로 진행되며 끝날 때까지 /health는 503을 반환합니다.
+    """
+    datastore = get_datastore()
+    await datastore.start()
+    if DATASTORE_WARMUP_ENABLED:
+        app.state.warmup = asyncio.create_task(get_cache_warmer().run())
+    get_session_compactor().start()
+    yield
+    await get_session_compactor().stop()
+    warmup = getattr(app.state, "warmup", None)
+    if warmup is not None:
+        warmup.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await warmup
+    await datastore.close()
+
+
+app = FastAPI(title=APP_TITLE, version=APP_VERSION, lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -28,6 +55,16 @@ app.include_router(sse.router)
 
 
 @app.get("/health")
-async def health_check() -> dict:
-    """Health check endpoint."""
+async def health_check(response: Response) -> dict:
+    """Health check endpoint. 캐시 워밍업 중에는 503 (readiness)."""
+    warmup = getattr(app.state, "warmup", None)
+    if warmup is not None and not warmup.done():
+        response.status_code = 503
+        return {"status": "warming"}
     return {"status": "ok"}
+
+
+@app.get("/health/datastore")
+async def datastore_metrics() -> dict:
+    """DataStore I/O 풀 지표 (대기 깊이, 처리 건수, 누적 시간)."""
+    return get_datastore().io_metrics()
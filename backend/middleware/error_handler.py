@@ -11,6 +11,7 @@ from backend.exceptions import (
     DataCorruptionError,
     DuplicateError,
     NotFoundError,
+    PreconditionFailedError,
     ValidationError,
 )
 
@@ -40,6 +41,10 @@ def register_exception_handlers(app: FastAPI) -> None:
     async def concurrency_handler(request: Request, exc: ConcurrencyError) -> JSONResponse:
         return JSONResponse(status_code=409, content={"detail": str(exc)})
 
+    @app.exception_handler(PreconditionFailedError)
+    async def precondition_handler(request: Request, exc: PreconditionFailedError) -> JSONResponse:
+        return JSONResponse(status_code=409, content={"detail": str(exc)})
+
     @app.exception_handler(DataCorruptionError)
     async def corruption_handler(request: Request, exc: DataCorruptionError) -> JSONResponse:
         logger.error("Data corruption: %s", str(exc))
@@ -1,7 +1,7 @@
 """Admin API router with real service integration."""
 
-from fastapi import APIRouter, Depends, Response
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import BaseModel, Field
 
 from backend.dependencies import (
     get_auth_service,
@@ -35,6 +35,11 @@ class OrderStatusUpdateRequest(BaseModel):
     status: str
 
 
+class BulkOrderStatusUpdateRequest(BaseModel):
+    order_ids: list[str] = Field(..., min_length=1, max_length=100)
+    status: str
+
+
 class MenuCreateRequest(BaseModel):
     name: str
     price: int
@@ -94,6 +99,31 @@ async def get_tables(
     return await table_svc.get_tables(store_id)
 
 
+@router.get("/dashboard")
+async def get_dashboard(
+    store_id: str,
+    since: str | None = Query(default=None),
+    token: str = Depends(get_admin_token),
+    auth_svc: AuthService = Depends(get_auth_service),
+    table_svc: TableService = Depends(get_table_service),
+) -> dict:
+    """테이블·활성 세션·현재 주문 통합 조회 (since 이후 바뀐 테이블만)."""
+    await auth_svc.verify_admin_token(token)
+    return await table_svc.get_dashboard(store_id, since)
+
+
+@router.get("/tables/summary")
+async def get_table_summaries(
+    store_id: str,
+    token: str = Depends(get_admin_token),
+    auth_svc: AuthService = Depends(get_auth_service),
+    order_svc: OrderService = Depends(get_order_service),
+) -> list[dict]:
+    """테이블별 현재 주문 요약 (주문 수, 상태별 수, 합계, 마지막 주문 시각)."""
+    await auth_svc.verify_admin_token(token)
+    return await order_svc.get_table_summaries(store_id)
+
+
 @router.post("/tables", status_code=201)
 async def create_table(
     store_id: str,
@@ -154,13 +184,32 @@ async def get_table_orders(
 async def get_table_history(
     store_id: str,
     table_num: int,
+    date_from: str | None = Query(default=None),
+    date_to: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1),
+    offset: int = Query(default=0, ge=0),
     token: str = Depends(get_admin_token),
     auth_svc: AuthService = Depends(get_auth_service),
     table_svc: TableService = Depends(get_table_service),
 ) -> list[dict]:
-    """과거 주문 이력."""
+    """과거 주문 이력 (최신순, 기간/페이지 지정 가능)."""
+    await auth_svc.verify_admin_token(token)
+    return await table_svc.get_order_history(
+        store_id, table_num, date_from, date_to, limit=limit, offset=offset,
+    )
+
+
+@router.patch("/orders/status")
+async def update_orders_status(
+    store_id: str,
+    body: BulkOrderStatusUpdateRequest,
+    token: str = Depends(get_admin_token),
+    auth_svc: AuthService = Depends(get_auth_service),
+    order_svc: OrderService = Depends(get_order_service),
+) -> list[dict]:
+    """여러 주문 상태 일괄 변경 (주문별 결과 반환)."""
     await auth_svc.verify_admin_token(token)
-    return await table_svc.get_order_history(store_id, table_num)
+    return await order_svc.update_orders_status(store_id, body.order_ids, body.status)
 
 
 @router.patch("/orders/{order_id}/status")
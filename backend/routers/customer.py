@@ -1,10 +1,19 @@
 """Customer API router with real service integration."""
 
-from fastapi import APIRouter, Depends, Query
+import hashlib
+import json
+
+from fastapi import APIRouter, Depends, Header, Query, Response
 from pydantic import BaseModel
 
-from backend.dependencies import get_auth_service, get_menu_service, get_order_service
+from backend.dependencies import (
+    get_auth_service,
+    get_idempotency_store,
+    get_menu_service,
+    get_order_service,
+)
 from backend.services.auth_service import AuthService
+from backend.services.idempotency import IdempotencyStore
 from backend.services.menu_service import MenuService
 from backend.services.order_service import OrderService
 
@@ -59,11 +68,29 @@ async def create_order(
     store_id: str,
     table_num: int,
     body: OrderCreateRequest,
+    response: Response,
+    idempotency_key: str | None = Header(default=None),
     order_svc: OrderService = Depends(get_order_service),
+    idempotency: IdempotencyStore = Depends(get_idempotency_store),
 ) -> dict:
-    """주문 생성."""
+    """주문 생성. Idempotency-Key가 같은 재시도는 처음 생성된 주문을 그대로 반환."""
     items = [{"menu_id": i.menu_id, "quantity": i.quantity} for i in body.items]
-    return await order_svc.create_order(store_id, table_num, body.session_id, items)
+    if idempotency_key is None:
+        return await order_svc.create_order(store_id, table_num, body.session_id, items)
+
+    fingerprint = hashlib.sha256(
+        json.dumps(body.model_dump(), sort_keys=True).encode()
+    ).hexdigest()
+    order, replayed = await idempotency.run(
+        idempotency_key,
+        fingerprint,
+        lambda: order_svc.create_order(store_id, table_num, body.session_id, items),
+        store_id=store_id,
+        scope=f"{store_id}:{table_num}",
+    )
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return order
 
 
 @router.get("/sessions/{session_id}/orders")
@@ -14,7 +14,7 @@ router = APIRouter(prefix="/api/stores/{store_id}/events", tags=["sse"])
 
 async def _event_generator(store_id: str, request: Request, event_bus: EventBus):
     """실제 EventBus에서 이벤트를 수신하여 SSE로 전달."""
-    event_types = ["order_created", "order_status_changed", "order_deleted"]
+    event_types = ["order_created", "order_status_changed", "orders_status_changed", "order_deleted"]
 
     async def _stream():
         async for event in event_bus.subscribe(store_id, event_types):
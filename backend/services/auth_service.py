@@ -49,8 +49,8 @@ class AuthService:
 
     async def login_admin(self, store_id: str, username: str, password: str) -> dict:
         """관리자 로그인 → JWT 토큰 반환."""
-        users = await self._ds.read("users", store_id)
-        user = next((u for u in users if u.get("username") == username), None)
+        users = await self._ds.query("users", store_id, where={"username": username}, limit=1)
+        user = users[0] if users else None
         if not user:
             logger.warning("login_failed: store=%s, user=%s, reason=not_found", store_id, username)
             raise AuthenticationError("Invalid username or password")
@@ -100,8 +100,7 @@ class AuthService:
 
         admin_id = payload.get("sub")
         store_id = payload.get("store_id")
-        users = await self._ds.read("users", store_id)
-        user = next((u for u in users if u.get("id") == admin_id), None)
+        user = await self._ds.find_by_id("users", store_id, admin_id)
         if not user:
             raise AuthenticationError("User not found")
         return {"id": user["id"], "username": user["username"], "store_id": store_id, "role": user.get("role", "admin")}
@@ -110,8 +109,8 @@ class AuthService:
         self, store_id: str, table_number: int, password: str,
     ) -> dict:
         """테이블 인증 → 세션 정보 반환."""
-        tables = await self._ds.read("tables", store_id)
-        table = next((t for t in tables if t.get("table_number") == table_number), None)
+        tables = await self._ds.find_by("tables", store_id, "table_number", table_number)
+        table = tables[0] if tables else None
         if not table:
             logger.warning("table_auth_failed: store=%s, table=%d, reason=not_found", store_id, table_number)
             raise AuthenticationError("Invalid table or password")
@@ -123,15 +122,11 @@ class AuthService:
             logger.warning("table_auth_failed: store=%s, table=%d, reason=bad_password", store_id, table_number)
             raise AuthenticationError("Invalid table or password")
 
-        sessions = await self._ds.read("sessions", store_id)
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        active = next(
-            (s for s in sessions
-             if s.get("table_number") == table_number
-             and s.get("status") == "active"
-             and s.get("expires_at", "") > now),
-            None,
+        sessions = await self._ds.find_by(
+            "sessions", store_id, ("table_number", "status"), (table_number, "active"),
         )
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        active = next((s for s in sessions if s.get("expires_at", "") > now), None)
         if not active:
             raise AuthenticationError("No active session for this table")
 
@@ -145,8 +140,7 @@ class AuthService:
 
     async def verify_table_session(self, session_id: str, store_id: str) -> dict:
         """테이블 세션 유효성 검증."""
-        sessions = await self._ds.read("sessions", store_id)
-        session = next((s for s in sessions if s.get("id") == session_id), None)
+        session = await self._ds.find_by_id("sessions", store_id, session_id)
         if not session:
             raise AuthenticationError("Session not found")
         if session.get("status") != "active":
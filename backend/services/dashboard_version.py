@@ -0,0 +1,42 @@
+"""Content-derived admin dashboard versions for `since` deltas across workers."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+
+# 테이블당 해시 길이 (버전 길이 = 4 + 테이블 수 × DIGEST_SIZE 바이트)
+DIGEST_SIZE = 4
+
+
+def _digest(value: object) -> bytes:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=str).encode()
+    ).digest()[:DIGEST_SIZE]
+
+
+def diff(entries: dict[int, dict], since: str | None) -> tuple[str, set[int] | None]:
+    """(현재 버전, since 이후 바뀐 테이블 번호). 전체 조회가 필요하면 None.
+
+    버전은 테이블 번호 목록의 해시와 테이블별 응답 내용의 해시를 이어 붙인
+    값이라, 서버에 상태를 두지 않고도 어느 워커에서든 since와 비교할 수
+    있습니다. 테이블이 추가되었거나 since를 해석할 수 없으면 전체 조회입니다.
+    """
+    numbers = sorted(entries)
+    digests = [_digest(entries[n]) for n in numbers]
+    raw = _digest(numbers) + b"".join(digests)
+    version = base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+    if not since:
+        return version, None
+    try:
+        previous = base64.urlsafe_b64decode(since + "=" * (-len(since) % 4))
+    except (binascii.Error, ValueError):
+        return version, None
+    if len(previous) != len(raw) or previous[:DIGEST_SIZE] != raw[:DIGEST_SIZE]:
+        return version, None
+    return version, {
+        number for i, number in enumerate(numbers)
+        if previous[(i + 1) * DIGEST_SIZE:(i + 2) * DIGEST_SIZE] != digests[i]
+    }
@@ -0,0 +1,186 @@
+"""Idempotency-Key → response store for retried requests (memory + persisted)."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from backend.data.datastore import DataStore
+from backend.exceptions import ConcurrencyError, ValidationError
+
+logger = logging.getLogger("table_order.order")
+
+MAX_KEY_LENGTH = 255
+ENTITY = "idempotency_keys"
+# 처리 중 표시의 유효 시간(초). 처리하던 워커가 죽어도 이 시간이 지나면 재시도 가능
+IN_FLIGHT_LEASE_SECONDS = 60.0
+
+
+@dataclass
+class _Entry:
+    fingerprint: str
+    future: asyncio.Future
+    expires_at: float
+
+
+class IdempotencyStore:
+    """최근 Idempotency-Key의 응답을 보관해 재시도 요청을 다시 실행하지 않고 응답.
+
+    같은 키의 요청이 처리 중이면 새로 실행하지 않고 그 결과를 기다립니다.
+    실패한 요청은 보관하지 않으므로 재시도하면 다시 실행됩니다. 키는
+    ttl_seconds 동안 유지되고, max_entries를 넘으면 오래된 완료 항목부터
+    버립니다. 같은 키를 다른 요청 본문(fingerprint)으로 쓰면 400입니다.
+
+    메모리는 프로세스별 빠른 경로입니다. datastore가 있으면 메모리에 없는
+    키를 매장의 idempotency_keys 엔티티에서 트랜잭션으로 확인·선점하므로,
+    재시도가 다른 워커로 가도 한 번만 실행됩니다. 다른 워커가 처리 중인
+    키는 409이며, 만료된 키는 purge_expired로 정리합니다.
+    """
+
+    def __init__(
+        self,
+        datastore: DataStore | None = None,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 10000,
+    ) -> None:
+        self._ds = datastore
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    async def run(
+        self,
+        key: str,
+        fingerprint: str,
+        fn: Callable[[], Awaitable[dict]],
+        store_id: str = "",
+        scope: str = "",
+    ) -> tuple[dict, bool]:
+        """(scope, key)당 fn 1회만 실행. (응답, 재사용 여부) 반환."""
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise ValidationError(f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters")
+        key = f"{scope}:{key}"
+        now = time.monotonic()
+        self._purge(now)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.fingerprint != fingerprint:
+                raise ValidationError("Idempotency-Key was already used with a different request")
+            self._hits += 1
+            logger.info("idempotent_replay: key=%s, in_flight=%s", key, not entry.future.done())
+            # 대기 중인 요청이 취소되어도 원 요청은 계속 진행
+            result = await asyncio.shield(entry.future)
+            return copy.deepcopy(result), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._entries[key] = _Entry(fingerprint, future, now + self._ttl)
+        persisted = self._ds is not None and bool(store_id)
+        reserved = False
+        try:
+            stored = await self._reserve(store_id, key, fingerprint) if persisted else None
+            if stored is not None:
+                self._hits += 1
+                logger.info("idempotent_replay: key=%s, persisted=True", key)
+                result, replayed = stored, True
+            else:
+                reserved = persisted
+                self._misses += 1
+                result, replayed = await fn(), False
+                if reserved:
+                    await self._ds.update(ENTITY, store_id, key, {
+                        "response": result, "expires_at": _utc_after(self._ttl),
+                    })
+        except Exception as e:
+            self._entries.pop(key, None)
+            future.set_exception(e)
+            future.exception()  # 기다리는 요청이 없어도 경고가 남지 않도록
+            if reserved:
+                await self._release(store_id, key)
+            raise
+        except BaseException:
+            self._entries.pop(key, None)
+            future.cancel()
+            if reserved:
+                await asyncio.shield(self._release(store_id, key))
+            raise
+        future.set_result(copy.deepcopy(result))
+        self._enforce()
+        return result, replayed
+
+    async def _reserve(self, store_id: str, key: str, fingerprint: str) -> dict | None:
+        """저장된 응답이 있으면 반환, 없으면 처리 중으로 선점하고 None."""
+        now = _utc_after(0)
+        async with self._ds.transaction(store_id, [ENTITY]) as tx:
+            found = await tx.find_by(ENTITY, "id", key)
+            record = found[0] if found else None
+            if record is not None and record["expires_at"] > now:
+                if record["fingerprint"] != fingerprint:
+                    raise ValidationError(
+                        "Idempotency-Key was already used with a different request"
+                    )
+                if record.get("response") is None:
+                    raise ConcurrencyError("A request with this Idempotency-Key is in progress")
+                return record["response"]
+            if record is not None:
+                await tx.delete(ENTITY, key)
+            await tx.append(ENTITY, {
+                "id": key,
+                "fingerprint": fingerprint,
+                "response": None,
+                "expires_at": _utc_after(min(self._ttl, IN_FLIGHT_LEASE_SECONDS)),
+            })
+        return None
+
+    async def _release(self, store_id: str, key: str) -> None:
+        try:
+            await self._ds.delete(ENTITY, store_id, key)
+        except Exception as e:
+            # 선점은 IN_FLIGHT_LEASE_SECONDS 후 만료되므로 기록만
+            logger.error("idempotency_release_failed: key=%s, error=%s", key, str(e))
+
+    async def purge_expired(self, store_id: str) -> int:
+        """매장의 만료된 저장 키 삭제. 삭제한 수 반환."""
+        if self._ds is None:
+            return 0
+        now = _utc_after(0)
+        deleted = await self._ds.delete_where(
+            ENTITY, store_id, lambda r: r.get("expires_at", "") <= now,
+        )
+        return len(deleted)
+
+    def _purge(self, now: float) -> None:
+        # TTL이 일정하고 재사용 시 순서를 바꾸지 않으므로 삽입 순서 = 만료 순서
+        while self._entries:
+            entry = next(iter(self._entries.values()))
+            if entry.expires_at > now or not entry.future.done():
+                break  # 처리 중인 항목은 완료 후 다음 정리에서 제거
+            self._entries.popitem(last=False)
+
+    def _enforce(self) -> None:
+        while len(self._entries) > self._max_entries:
+            victim = next(
+                (key for key, entry in self._entries.items() if entry.future.done()), None,
+            )
+            if victim is None:
+                break  # 모두 처리 중이면 한도를 잠시 넘도록 둠
+            del self._entries[victim]
+
+    def stats(self) -> dict:
+        return {"keys": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _utc_after(seconds: float) -> str:
+    moment = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
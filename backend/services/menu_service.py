@@ -20,16 +20,13 @@ class MenuService:
 
     async def get_menus(self, store_id: str) -> list[dict]:
         """매장 전체 메뉴 목록 (sort_order 정렬)."""
-        menus = await self._ds.read("menus", store_id)
-        menus.sort(key=lambda m: m.get("sort_order", 0))
-        return menus
+        return await self._ds.query("menus", store_id, order_by="sort_order")
 
     async def get_menus_by_category(self, store_id: str, category: str) -> list[dict]:
         """카테고리별 메뉴 조회."""
-        menus = await self._ds.read("menus", store_id)
-        filtered = [m for m in menus if m.get("category") == category]
-        filtered.sort(key=lambda m: m.get("sort_order", 0))
-        return filtered
+        return await self._ds.query(
+            "menus", store_id, where={"category": category}, order_by="sort_order",
+        )
 
     async def get_menu(self, store_id: str, menu_id: str) -> dict:
         """단일 메뉴 상세 조회."""
@@ -38,6 +35,10 @@ class MenuService:
             raise NotFoundError("Menu", menu_id)
         return menu
 
+    async def get_menus_by_ids(self, store_id: str, menu_ids: list[str]) -> dict[str, dict]:
+        """여러 메뉴를 한 번에 조회 → {menu_id: menu}. 없는 메뉴는 빠짐."""
+        return await self._ds.find_by_ids("menus", store_id, menu_ids)
+
     async def create_menu(self, store_id: str, data: dict) -> dict:
         """메뉴 등록."""
         self._validate_menu_data(data)
@@ -7,10 +7,11 @@ import uuid
 from datetime import datetime, timezone
 
 from backend.data.datastore import DataStore
-from backend.exceptions import NotFoundError, ValidationError
+from backend.exceptions import NotFoundError, PreconditionFailedError, ValidationError
 from backend.models.enums import OrderStatus
 from backend.models.schemas import utc_now
 from backend.services.event_bus import EventBus
+from backend.services.order_summary import OrderSummaryTracker
 
 logger = logging.getLogger("table_order.order")
 
@@ -23,10 +24,16 @@ class OrderService:
         datastore: DataStore,
         event_bus: EventBus,
         menu_service: "MenuService",
+        summaries: OrderSummaryTracker | None = None,
     ) -> None:
         self._ds = datastore
         self._event_bus = event_bus
         self._menu_service = menu_service
+        self._summaries = summaries or OrderSummaryTracker(datastore)
+
+    @property
+    def summaries(self) -> OrderSummaryTracker:
+        return self._summaries
 
     async def create_order(
         self,
@@ -39,15 +46,21 @@ class OrderService:
         if not items:
             raise ValidationError("Order must have at least one item")
 
-        # 메뉴 검증 및 스냅샷
+        for item in items:
+            if item.get("quantity", 0) < 1:
+                raise ValidationError(f"quantity must be >= 1 for menu {item.get('menu_id', '')}")
+
+        # 메뉴 검증 및 스냅샷 (한 번의 조회로 모든 항목 처리)
+        menus = await self._menu_service.get_menus_by_ids(
+            store_id, [item.get("menu_id", "") for item in items],
+        )
         order_items = []
         for item in items:
             menu_id = item.get("menu_id", "")
-            quantity = item.get("quantity", 0)
-            if quantity < 1:
-                raise ValidationError(f"quantity must be >= 1 for menu {menu_id}")
-
-            menu = await self._menu_service.get_menu(store_id, menu_id)
+            quantity = item["quantity"]
+            menu = menus.get(menu_id)
+            if menu is None:
+                raise NotFoundError("Menu", menu_id)
             if not menu.get("is_available", False):
                 raise ValidationError(f"Menu '{menu.get('name')}' is not available")
 
@@ -72,11 +85,12 @@ class OrderService:
             "session_id": session_id,
             "items": order_items,
             "total_amount": total_amount,
-            "status": OrderStatus.PENDING,
+            "status": OrderStatus.PENDING.value,
             "created_at": now,
             "updated_at": now,
         }
         await self._ds.append("orders", store_id, order)
+        self._summaries.orders_changed(store_id, [order])
         logger.info(
             "order_created: number=%s, table=%d, total=%d",
             order_number, table_number, total_amount,
@@ -88,7 +102,7 @@ class OrderService:
             "order_id": order["id"],
             "order_number": order_number,
             "table_number": table_number,
-            "status": OrderStatus.PENDING,
+            "status": OrderStatus.PENDING.value,
             "total_amount": total_amount,
             "timestamp": now,
         })
@@ -103,34 +117,39 @@ class OrderService:
 
     async def get_orders_by_session(self, store_id: str, session_id: str) -> list[dict]:
         """세션별 주문 목록."""
-        orders = await self._ds.read("orders", store_id)
-        return [o for o in orders if o.get("session_id") == session_id]
+        return await self._ds.find_by("orders", store_id, "session_id", session_id)
 
     async def get_orders_by_table(self, store_id: str, table_number: int) -> list[dict]:
         """테이블별 현재 주문 목록."""
-        orders = await self._ds.read("orders", store_id)
-        return [o for o in orders if o.get("table_number") == table_number]
+        return await self._ds.query(
+            "orders", store_id, where={"table_number": table_number}, order_by="created_at",
+        )
+
+    async def get_table_summaries(self, store_id: str) -> list[dict]:
+        """테이블별 현재 주문 요약 (주문 수, 상태별 수, 합계, 마지막 주문 시각)."""
+        return await self._summaries.get_summaries(store_id)
 
     async def update_order_status(
         self, store_id: str, order_id: str, new_status: str,
     ) -> dict:
-        """주문 상태 변경."""
-        order = await self._ds.find_by_id("orders", store_id, order_id)
-        if not order:
-            raise NotFoundError("Order", order_id)
-
-        current = OrderStatus(order["status"])
+        """주문 상태 변경 (전이 검증과 수정을 한 번의 잠금 구간에서 처리)."""
         target = OrderStatus(new_status)
-        if not current.can_transition_to(target):
+        now = utc_now()
+        try:
+            order, updated = await self._ds.update_if(
+                "orders", store_id, order_id,
+                expected=lambda o: OrderStatus(o["status"]).can_transition_to(target),
+                updates={"status": target.value, "updated_at": now},
+            )
+        except NotFoundError:
+            raise NotFoundError("Order", order_id)
+        except PreconditionFailedError as e:
             raise ValidationError(
-                f"Cannot transition from '{current}' to '{target}'"
+                f"Cannot transition from '{e.current.get('status')}' to '{target}'"
             )
+        self._summaries.orders_changed(store_id, [updated])
 
-        now = utc_now()
-        updated = await self._ds.update("orders", store_id, order_id, {
-            "status": target.value,
-            "updated_at": now,
-        })
+        current = OrderStatus(order["status"])
         logger.info("order_status_changed: id=%s, %s→%s", order_id, current, target)
 
         await self._event_bus.publish({
@@ -145,6 +164,63 @@ class OrderService:
         })
         return updated
 
+    async def update_orders_status(
+        self, store_id: str, order_ids: list[str], new_status: str,
+    ) -> list[dict]:
+        """여러 주문 상태 일괄 변경 (검증+수정을 한 번의 쓰기로, 이벤트 1건).
+
+        주문별 결과 {order_id, ok, order, error}를 요청 순서대로 반환하며,
+        없는 주문이나 허용되지 않는 전이는 해당 주문만 실패합니다.
+        """
+        try:
+            target = OrderStatus(new_status)
+        except ValueError:
+            raise ValidationError(f"Invalid order status '{new_status}'")
+        now = utc_now()
+        ids = list(dict.fromkeys(order_ids))
+        outcomes = await self._ds.update_many_if(
+            "orders", store_id,
+            {id: {"status": target.value, "updated_at": now} for id in ids},
+            expected=lambda o: OrderStatus(o["status"]).can_transition_to(target),
+        )
+
+        self._summaries.orders_changed(
+            store_id, [after for _, after in outcomes.values() if after is not None],
+        )
+
+        results: list[dict] = []
+        changes: list[dict] = []
+        for id in ids:
+            before, after = outcomes[id]
+            if before is None:
+                results.append({"order_id": id, "ok": False, "order": None,
+                                "error": str(NotFoundError("Order", id))})
+            elif after is None:
+                results.append({"order_id": id, "ok": False, "order": None,
+                                "error": f"Cannot transition from '{before.get('status')}' to '{target}'"})
+            else:
+                results.append({"order_id": id, "ok": True, "order": after, "error": None})
+                changes.append({
+                    "order_id": id,
+                    "order_number": after.get("order_number"),
+                    "table_number": after.get("table_number"),
+                    "old_status": before.get("status"),
+                    "new_status": target.value,
+                })
+        logger.info(
+            "orders_status_changed: requested=%d, updated=%d, status=%s",
+            len(ids), len(changes), target,
+        )
+
+        if changes:
+            await self._event_bus.publish({
+                "type": "orders_status_changed",
+                "store_id": store_id,
+                "orders": changes,
+                "timestamp": now,
+            })
+        return results
+
     async def delete_order(self, store_id: str, order_id: str) -> None:
         """주문 삭제 (관리자)."""
         order = await self._ds.find_by_id("orders", store_id, order_id)
@@ -152,6 +228,7 @@ class OrderService:
             raise NotFoundError("Order", order_id)
 
         await self._ds.delete("orders", store_id, order_id)
+        self._summaries.orders_removed(store_id, [order])
         now = utc_now()
         logger.info("order_deleted: id=%s, table=%s", order_id, order.get("table_number"))
 
@@ -165,11 +242,26 @@ class OrderService:
         })
 
     async def _generate_order_number(self, store_id: str) -> str:
-        """당일 주문 수 기반 순번 생성: YYYYMMDD-NNNNN."""
+        """매장별 일일 순번 생성: YYYYMMDD-NNNNN (영속 카운터, O(1))."""
         today = datetime.now(timezone.utc).strftime("%Y%m%d")
+        seq = await self._ds.next_sequence(
+            store_id, f"order_number:{today}",
+            seed=lambda: self._max_order_seq(store_id, today),
+        )
+        return f"{today}-{seq:05d}"
+
+    async def _max_order_seq(self, store_id: str, today: str) -> int:
+        """카운터 도입 전 발급된 당일 최대 순번 (당일 첫 주문에서만 호출)."""
+        day = f"{today[:4]}-{today[4:6]}-{today[6:]}"
         orders = await self._ds.read("orders", store_id)
-        today_count = sum(
-            1 for o in orders
-            if o.get("order_number", "").startswith(today)
+        for history in await self._ds.query("order_history", store_id, start=day):
+            orders.extend(history.get("orders", []))
+        prefix = f"{today}-"
+        return max(
+            (
+                int(number[len(prefix):])
+                for number in (o.get("order_number", "") for o in orders)
+                if number.startswith(prefix) and number[len(prefix):].isdigit()
+            ),
+            default=0,
         )
-        return f"{today}-{today_count + 1:05d}"
@@ -0,0 +1,120 @@
+"""In-memory per-table running order summaries, updated as orders change."""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+
+from backend.data.datastore import DataStore
+
+logger = logging.getLogger("table_order.order")
+
+
+@dataclass
+class TableSummary:
+    """테이블 1개의 현재 주문 요약. orders는 주문 id → (상태, 금액, 생성 시각)."""
+
+    table_number: int
+    orders: dict[str, tuple[str, int, str]] = field(default_factory=dict)
+    status_counts: Counter = field(default_factory=Counter)
+    total_amount: int = 0
+    last_order_at: str | None = None
+
+    def add(self, order: dict) -> None:
+        self.discard(order["id"])
+        status = order.get("status", "")
+        amount = order.get("total_amount", 0)
+        created_at = order.get("created_at", "")
+        self.orders[order["id"]] = (status, amount, created_at)
+        self.status_counts[status] += 1
+        self.total_amount += amount
+        if self.last_order_at is None or created_at > self.last_order_at:
+            self.last_order_at = created_at
+
+    def discard(self, order_id: str) -> None:
+        entry = self.orders.pop(order_id, None)
+        if entry is None:
+            return
+        status, amount, created_at = entry
+        self.status_counts[status] -= 1
+        if not self.status_counts[status]:
+            del self.status_counts[status]
+        self.total_amount -= amount
+        if created_at == self.last_order_at:
+            # 가장 최근 주문이 빠질 때만 테이블 내 주문을 다시 훑음
+            self.last_order_at = max((c for _, _, c in self.orders.values()), default=None)
+
+    def to_dict(self) -> dict:
+        return {
+            "table_number": self.table_number,
+            "order_count": len(self.orders),
+            "status_counts": dict(self.status_counts),
+            "total_amount": self.total_amount,
+            "last_order_at": self.last_order_at,
+        }
+
+
+class OrderSummaryTracker:
+    """매장별 테이블 요약을 메모리에 유지.
+
+    매장을 처음 조회할 때 orders 전체를 한 번 읽어 만들고, 이후에는
+    OrderService/TableService가 알려주는 주문 변경만 반영하므로 조회는
+    O(테이블 수)입니다. 변경을 반영할 때 그 쓰기의 직후 시그니처를 함께
+    기록하고, 조회 시 orders 시그니처가 기록과 다르면(다른 워커 프로세스의
+    쓰기) 다시 만듭니다. 변경은 주문 id 기준이라 같은 변경이 두 번 와도
+    결과가 같습니다.
+    """
+
+    def __init__(self, datastore: DataStore) -> None:
+        self._ds = datastore
+        self._stores: dict[str, tuple[object, dict[int, TableSummary]]] = {}
+
+    async def get_summaries(self, store_id: str) -> list[dict]:
+        """테이블 번호 순 요약 목록 (현재 주문이 있는 테이블만)."""
+        tables = await self._load(store_id)
+        return [tables[n].to_dict() for n in sorted(tables) if tables[n].orders]
+
+    def orders_changed(self, store_id: str, orders: list[dict]) -> None:
+        """생성되거나 상태가 바뀐 주문 반영 (쓰기 직후 await 없이 호출)."""
+        self._apply(store_id, orders, add=True)
+
+    def orders_removed(self, store_id: str, orders: list[dict]) -> None:
+        """주문 삭제 또는 세션 종료로 이력으로 옮겨진 주문 반영 (쓰기 직후 호출)."""
+        self._apply(store_id, orders, add=False)
+
+    def _apply(self, store_id: str, orders: list[dict], add: bool) -> None:
+        built = self._stores.get(store_id)
+        if built is None:
+            return
+        signature, tables = built
+        written = self._ds.written_signature("orders", store_id)
+        if written is None or signature not in written:
+            # 기록 이후 다른 워커(또는 알리지 않은 쓰기)가 끼어듦 → 다음 조회에서 재구성
+            del self._stores[store_id]
+            return
+        for order in orders:
+            number = order.get("table_number")
+            if add:
+                tables.setdefault(number, TableSummary(number)).add(order)
+            elif number in tables:
+                tables[number].discard(order["id"])
+        # 같은 배치로 기록된 다른 변경도 직후 시그니처 기준으로 받아들임
+        self._stores[store_id] = (written[1], tables)
+
+    async def _load(self, store_id: str) -> dict[int, TableSummary]:
+        signature = await self._ds.signature("orders", store_id)
+        built = self._stores.get(store_id)
+        if built is not None and built[0] == signature:
+            return built[1]
+
+        # 읽기 전 시그니처를 기록하므로 읽는 중의 쓰기는 다음 조회에서 재구성
+        orders = await self._ds.read("orders", store_id)
+        tables: dict[int, TableSummary] = {}
+        for order in orders:
+            number = order.get("table_number")
+            tables.setdefault(number, TableSummary(number)).add(order)
+        self._stores[store_id] = (signature, tables)
+        logger.info("order_summary_built: store=%s, tables=%d, orders=%d",
+                    store_id, len(tables), len(orders))
+        return tables
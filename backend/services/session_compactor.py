@@ -0,0 +1,82 @@
+"""Background compactor that archives past sessions and purges expired idempotency keys."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from backend.data.datastore import DataStore
+from backend.services.idempotency import IdempotencyStore
+from backend.services.table_service import TableService
+
+logger = logging.getLogger("table_order.table")
+
+
+class SessionCompactor:
+    """주기적으로 모든 매장의 지난 세션을 보관 파일로 이동.
+
+    interval초마다 stores.json의 매장을 순회하며
+    TableService.archive_sessions를 호출하고, idempotency가 있으면 만료된
+    Idempotency-Key 기록도 삭제합니다. 실패는 기록만 하고
+    다음 주기에 다시 시도합니다.
+    """
+
+    def __init__(
+        self,
+        datastore: DataStore,
+        table_service: TableService,
+        idempotency: IdempotencyStore | None = None,
+        interval: float = 300.0,
+        grace_seconds: float = 600.0,
+    ) -> None:
+        self._ds = datastore
+        self._table_service = table_service
+        self._idempotency = idempotency
+        self._interval = interval
+        self._grace_seconds = grace_seconds
+        self._task: asyncio.Task | None = None
+
+    async def run_once(self) -> int:
+        """전체 매장 1회 처리. 이동한 세션 수 반환."""
+        archived = 0
+        for store in await self._ds.read("stores", ""):
+            try:
+                archived += await self._table_service.archive_sessions(
+                    store["id"], self._grace_seconds,
+                )
+            except Exception as e:
+                logger.error(
+                    "session_archive_failed: store=%s, error=%s", store.get("id"), str(e),
+                )
+            if self._idempotency is None:
+                continue
+            try:
+                await self._idempotency.purge_expired(store["id"])
+            except Exception as e:
+                logger.error(
+                    "idempotency_purge_failed: store=%s, error=%s", store.get("id"), str(e),
+                )
+        return archived
+
+    def start(self) -> None:
+        if self._interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                # stores 조회 실패 등은 다음 주기에 재시도
+                logger.error("session_archive_failed: error=%s", str(e))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -12,6 +13,7 @@ from backend.config import BCRYPT_COST, TABLE_SESSION_EXPIRE_HOURS
 from backend.data.datastore import DataStore
 from backend.exceptions import DuplicateError, NotFoundError, ValidationError
 from backend.models.schemas import utc_now
+from backend.services import dashboard_version
 
 logger = logging.getLogger("table_order.table")
 
@@ -27,8 +29,7 @@ class TableService:
         self, store_id: str, table_number: int, password: str,
     ) -> dict:
         """테이블 등록."""
-        tables = await self._ds.read("tables", store_id)
-        if any(t.get("table_number") == table_number for t in tables):
+        if await self._ds.find_by("tables", store_id, "table_number", table_number):
             raise DuplicateError("Table", "table_number", str(table_number))
 
         hashed = bcrypt.hashpw(
@@ -54,47 +55,82 @@ class TableService:
         """매장 전체 테이블 목록 (활성 세션 정보 포함)."""
         tables = await self._ds.read("tables", store_id)
         sessions = await self._ds.read("sessions", store_id)
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        active_by_table = self._active_sessions(sessions)
+        return [
+            self._table_entry(t, active_by_table.get(t.get("table_number")))
+            for t in sorted(tables, key=lambda x: x.get("table_number", 0))
+        ]
+
+    async def get_dashboard(self, store_id: str, since: str | None = None) -> dict:
+        """전체 테이블, 활성 세션, 현재 주문을 한 번에 반환.
+
+        엔티티마다 한 번씩만 읽고 테이블 번호 dict로 합칩니다. since에 이전
+        응답의 version을 주면 그 이후 바뀐 테이블만 담고 full=False로
+        표시합니다. version은 응답 내용에서 만들므로(dashboard_version 참고)
+        어느 워커에서 받은 값이든 비교할 수 있습니다.
+        """
+        tables, sessions, orders = await asyncio.gather(
+            self._ds.read("tables", store_id),
+            self._ds.read("sessions", store_id),
+            self._ds.read("orders", store_id),
+        )
+        active_by_table = self._active_sessions(sessions)
+        orders_by_table: dict[int, list[dict]] = {}
+        for o in sorted(orders, key=lambda x: x.get("created_at", "")):
+            orders_by_table.setdefault(o.get("table_number"), []).append(o)
 
-        result = []
+        entries: dict[int, dict] = {}
         for t in sorted(tables, key=lambda x: x.get("table_number", 0)):
-            active_session = next(
-                (s for s in sessions
-                 if s.get("table_number") == t.get("table_number")
-                 and s.get("status") == "active"
-                 and s.get("expires_at", "") > now),
-                None,
-            )
-            entry = {
-                "id": t["id"],
-                "table_number": t["table_number"],
-                "is_active": t.get("is_active", True),
-                "current_session": None,
+            number = t.get("table_number")
+            entry = self._table_entry(t, active_by_table.get(number))
+            entry["orders"] = orders_by_table.get(number, [])
+            entry["total_amount"] = sum(o.get("total_amount", 0) for o in entry["orders"])
+            entries[number] = entry
+
+        version, changed = dashboard_version.diff(entries, since)
+        result = [
+            entry for number, entry in entries.items()
+            if changed is None or number in changed
+        ]
+        return {"version": version, "full": changed is None, "tables": result}
+
+    @staticmethod
+    def _active_sessions(sessions: list[dict]) -> dict[int, dict]:
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        active_by_table: dict[int, dict] = {}
+        for s in sessions:
+            if s.get("status") == "active" and s.get("expires_at", "") > now:
+                active_by_table.setdefault(s.get("table_number"), s)
+        return active_by_table
+
+    @staticmethod
+    def _table_entry(table: dict, active_session: dict | None) -> dict:
+        entry = {
+            "id": table["id"],
+            "table_number": table["table_number"],
+            "is_active": table.get("is_active", True),
+            "current_session": None,
+        }
+        if active_session:
+            entry["current_session"] = {
+                "session_id": active_session["id"],
+                "started_at": active_session["started_at"],
+                "expires_at": active_session["expires_at"],
             }
-            if active_session:
-                entry["current_session"] = {
-                    "session_id": active_session["id"],
-                    "started_at": active_session["started_at"],
-                    "expires_at": active_session["expires_at"],
-                }
-            result.append(entry)
-        return result
+        return entry
 
     async def start_session(self, store_id: str, table_number: int) -> dict:
         """테이블 세션 시작."""
-        tables = await self._ds.read("tables", store_id)
-        table = next((t for t in tables if t.get("table_number") == table_number), None)
-        if not table:
+        if not await self._ds.find_by("tables", store_id, "table_number", table_number):
             raise NotFoundError("Table", str(table_number))
 
-        sessions = await self._ds.read("sessions", store_id)
+        sessions = await self._ds.find_by(
+            "sessions", store_id, ("table_number", "status"), (table_number, "active"),
+        )
         now_dt = datetime.now(timezone.utc)
         now_str = now_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
         active = next(
-            (s for s in sessions
-             if s.get("table_number") == table_number
-             and s.get("status") == "active"
-             and s.get("expires_at", "") > now_str),
+            (s for s in sessions if s.get("expires_at", "") > now_str),
             None,
         )
         if active:
@@ -117,52 +153,13 @@ class TableService:
         return session
 
     async def end_session(self, store_id: str, table_number: int) -> None:
-        """테이블 세션 종료 (주문 이력 이동)."""
-        sessions = await self._ds.read("sessions", store_id)
+        """테이블 세션 종료 (주문 이력 이동).
+
+        이력 추가, 주문 삭제, 세션 종료를 한 트랜잭션으로 처리하여
+        중간 실패 시 주문이 이력과 현재 목록에 중복되거나 사라지지 않게 합니다.
+        """
         now_str = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        active = next(
-            (s for s in sessions
-             if s.get("table_number") == table_number
-             and s.get("status") == "active"),
-            None,
-        )
-        if not active:
-            raise ValidationError("No active session for this table")
-
-        session_id = active["id"]
-        orders = await self._order_service.get_orders_by_session(store_id, session_id)
-
-        # OrderHistory 생성
-        if orders:
-            total_session_amount = sum(o.get("total_amount", 0) for o in orders)
-            history = {
-                "id": str(uuid.uuid4()),
-                "store_id": store_id,
-                "table_number": table_number,
-                "session_id": session_id,
-                "orders": orders,
-                "total_session_amount": total_session_amount,
-                "session_started_at": active["started_at"],
-                "session_ended_at": now_str,
-                "archived_at": now_str,
-            }
-            await self._ds.append("order_history", store_id, history)
-
-            # 현재 주문 삭제
-            for order in orders:
-                try:
-                    await self._ds.delete("orders", store_id, order["id"])
-                except Exception:
-                    pass  # best-effort 삭제
-
-        # 세션 종료 처리
-        all_sessions = await self._ds.read("sessions", store_id)
-        for s in all_sessions:
-            if s.get("id") == session_id:
-                s["status"] = "ended"
-                s["ended_at"] = now_str
-                break
-        await self._ds.write("sessions", store_id, all_sessions)
+        session_id, orders = await self._close_session(store_id, table_number, now_str)
 
         order_count = len(orders)
         total = sum(o.get("total_amount", 0) for o in orders) if orders else 0
@@ -171,21 +168,109 @@ class TableService:
             session_id, order_count, total,
         )
 
+    async def _close_session(
+        self, store_id: str, table_number: int, ended_at: str, session_id: str | None = None,
+    ) -> tuple[str, list[dict]]:
+        """활성 세션을 ended_at 시각으로 종료하고 주문을 이력으로 이동.
+
+        session_id가 있으면 그 세션만 대상으로 합니다. (세션 id, 이동한 주문) 반환.
+        """
+        history_entity = self._ds.partition_for("order_history", {"session_ended_at": ended_at})
+        async with self._ds.transaction(
+            store_id, (history_entity, "orders", "sessions"),
+        ) as tx:
+            sessions = await tx.find_by(
+                "sessions", ("table_number", "status"), (table_number, "active"),
+            )
+            if session_id is not None:
+                sessions = [s for s in sessions if s["id"] == session_id]
+            active = sessions[0] if sessions else None
+            if not active:
+                raise ValidationError("No active session for this table")
+
+            session_id = active["id"]
+            orders = await tx.find_by("orders", "session_id", session_id)
+
+            # OrderHistory 생성
+            if orders:
+                total_session_amount = sum(o.get("total_amount", 0) for o in orders)
+                history = {
+                    "id": str(uuid.uuid4()),
+                    "store_id": store_id,
+                    "table_number": table_number,
+                    "session_id": session_id,
+                    "orders": orders,
+                    "total_session_amount": total_session_amount,
+                    "session_started_at": active["started_at"],
+                    "session_ended_at": ended_at,
+                    "archived_at": ended_at,
+                }
+                await tx.append(history_entity, history)
+
+                # 현재 주문 삭제
+                await tx.delete_many("orders", [o["id"] for o in orders])
+
+            # 세션 종료 처리
+            await tx.update("sessions", session_id, {"status": "ended", "ended_at": ended_at})
+        self._order_service.summaries.orders_removed(store_id, orders)
+        return session_id, orders
+
+    async def archive_sessions(self, store_id: str, grace_seconds: float = 0.0) -> int:
+        """종료 후 grace_seconds가 지난 세션을 월별 보관 파일로 이동.
+
+        만료 후 grace_seconds가 지난 활성 세션은 먼저 end_session과 같은
+        경로로 만료 시각에 종료해 주문을 이력으로 옮긴 뒤 함께 보관합니다.
+        sessions.json에는 진행 중인 세션만 남아 세션 조회 비용이 누적
+        세션 수가 아닌 테이블 수에 비례합니다. 보관과 삭제는 한
+        트랜잭션으로 처리합니다. 이동한 세션 수를 반환합니다.
+        """
+        now = datetime.now(timezone.utc)
+        now_str = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+        cutoff = (now - timedelta(seconds=grace_seconds)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        expired = [
+            s for s in await self._ds.find_by("sessions", store_id, "status", "active")
+            if s.get("expires_at", "") <= cutoff
+        ]
+        for session in expired:
+            try:
+                _, orders = await self._close_session(
+                    store_id, session["table_number"], session["expires_at"], session["id"],
+                )
+            except ValidationError:
+                continue  # 그 사이 직접 종료됨
+            logger.info(
+                "session_expired: id=%s, orders=%d", session["id"], len(orders),
+            )
+
+        archive_entity = self._ds.partition_for("session_archive", {"archived_at": now_str})
+        async with self._ds.transaction(store_id, (archive_entity, "sessions")) as tx:
+            stale = [
+                s for s in await tx.read("sessions")
+                if s.get("status") == "ended" and (s.get("ended_at") or "") <= cutoff
+            ]
+            for session in stale:
+                await tx.append(archive_entity, {**session, "archived_at": now_str})
+            if stale:
+                await tx.delete_many("sessions", [s["id"] for s in stale])
+        if stale:
+            logger.info("sessions_archived: store=%s, count=%d", store_id, len(stale))
+        return len(stale)
+
     async def get_order_history(
         self,
         store_id: str,
         table_number: int,
         date_from: str | None = None,
         date_to: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[dict]:
-        """과거 주문 이력 조회."""
-        history = await self._ds.read("order_history", store_id)
-        filtered = [h for h in history if h.get("table_number") == table_number]
-
-        if date_from:
-            filtered = [h for h in filtered if h.get("session_ended_at", "") >= date_from]
-        if date_to:
-            filtered = [h for h in filtered if h.get("session_ended_at", "") <= date_to]
-
-        filtered.sort(key=lambda h: h.get("session_ended_at", ""), reverse=True)
-        return filtered
+        """과거 주문 이력 조회 (최신순, 조회 기간에 해당하는 월 파티션만 읽음)."""
+        return await self._ds.query(
+            "order_history", store_id,
+            where={"table_number": table_number},
+            order_by="-session_ended_at",
+            limit=limit, offset=offset,
+            start=date_from or None, end=date_to or None,
+        )
@@ -67,3 +67,55 @@ async def client() -> AsyncClient:
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
+
+
+@pytest.fixture
+async def seeded_client(seeded_datastore: DataStore) -> AsyncClient:
+    """시드된 임시 DataStore를 쓰도록 서비스 의존성을 바꾼 HTTP 클라이언트."""
+    from backend import dependencies
+    from backend.services.auth_service import AuthService
+    from backend.services.event_bus import EventBus
+    from backend.services.idempotency import IdempotencyStore
+    from backend.services.menu_service import MenuService
+    from backend.services.order_service import OrderService
+    from backend.services.order_summary import OrderSummaryTracker
+    from backend.services.table_service import TableService
+
+    ds = seeded_datastore
+    event_bus = EventBus()
+    summaries = OrderSummaryTracker(datastore=ds)
+    idempotency = IdempotencyStore(datastore=ds)
+
+    def order_service() -> OrderService:
+        return OrderService(
+            datastore=ds, event_bus=event_bus,
+            menu_service=MenuService(datastore=ds), summaries=summaries,
+        )
+
+    overrides = {
+        dependencies.get_auth_service: lambda: AuthService(datastore=ds),
+        dependencies.get_menu_service: lambda: MenuService(datastore=ds),
+        dependencies.get_order_service: order_service,
+        dependencies.get_table_service: lambda: TableService(
+            datastore=ds, order_service=order_service(),
+        ),
+        dependencies.get_idempotency_store: lambda: idempotency,
+    }
+    app.dependency_overrides.update(overrides)
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            yield ac
+    finally:
+        for dependency in overrides:
+            app.dependency_overrides.pop(dependency, None)
+
+
+@pytest.fixture
+async def admin_headers(seeded_client: AsyncClient) -> dict:
+    """seeded_client용 관리자 Authorization 헤더."""
+    resp = await seeded_client.post(
+        "/api/stores/store001/admin/login",
+        json={"username": "admin", "password": "admin1234"},
+    )
+    return {"Authorization": f"Bearer {resp.json()['token']}"}
@@ -150,3 +150,72 @@ async def test_delete_menu(client: AsyncClient) -> None:
     """DELETE /admin/menus/{id} → 204."""
     resp = await client.delete(f"{BASE}/menus/mock-menu-001")
     assert resp.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_dashboard_since(seeded_client: AsyncClient, admin_headers: dict) -> None:
+    """GET /admin/dashboard?since= → 이후 바뀐 테이블만."""
+    for number in (1, 2):
+        resp = await seeded_client.post(
+            f"{BASE}/tables", json={"table_number": number, "password": "1234"},
+            headers=admin_headers,
+        )
+        assert resp.status_code == 201
+
+    resp = await seeded_client.get(f"{BASE}/dashboard", headers=admin_headers)
+    assert resp.status_code == 200
+    snapshot = resp.json()
+    assert snapshot["full"] is True
+    assert [t["table_number"] for t in snapshot["tables"]] == [1, 2]
+
+    resp = await seeded_client.get(
+        f"{BASE}/dashboard", params={"since": snapshot["version"]}, headers=admin_headers,
+    )
+    assert resp.json() == {"version": snapshot["version"], "full": False, "tables": []}
+
+    await seeded_client.post(f"{BASE}/tables/2/session/start", headers=admin_headers)
+    resp = await seeded_client.get(
+        f"{BASE}/dashboard", params={"since": snapshot["version"]}, headers=admin_headers,
+    )
+    delta = resp.json()
+    assert delta["full"] is False
+    assert [t["table_number"] for t in delta["tables"]] == [2]
+    assert delta["tables"][0]["current_session"] is not None
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_order_status(seeded_client: AsyncClient, admin_headers: dict) -> None:
+    """PATCH /admin/orders/status → 주문별 결과, 101개 이상은 422."""
+    await seeded_client.post(
+        f"{BASE}/tables", json={"table_number": 1, "password": "1234"}, headers=admin_headers,
+    )
+    session = (await seeded_client.post(
+        f"{BASE}/tables/1/session/start", headers=admin_headers,
+    )).json()
+    menu_id = (await seeded_client.get(f"/api/stores/{STORE_ID}/menus")).json()[0]["id"]
+    order = (await seeded_client.post(
+        f"/api/stores/{STORE_ID}/tables/1/orders",
+        json={"session_id": session["id"], "items": [{"menu_id": menu_id, "quantity": 1}]},
+    )).json()
+
+    resp = await seeded_client.patch(
+        f"{BASE}/orders/status",
+        json={"order_ids": [order["id"], "missing"], "status": "preparing"},
+        headers=admin_headers,
+    )
+    assert resp.status_code == 200
+    results = resp.json()
+    assert [(r["order_id"], r["ok"]) for r in results] == [(order["id"], True), ("missing", False)]
+    assert results[0]["order"]["status"] == "preparing"
+
+    resp = await seeded_client.patch(
+        f"{BASE}/orders/status",
+        json={"order_ids": [f"o{i}" for i in range(101)], "status": "preparing"},
+        headers=admin_headers,
+    )
+    assert resp.status_code == 422
+    resp = await seeded_client.patch(
+        f"{BASE}/orders/status", json={"order_ids": [], "status": "preparing"},
+        headers=admin_headers,
+    )
+    assert resp.status_code == 422
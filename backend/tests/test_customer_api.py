@@ -82,3 +82,31 @@ async def test_get_order(client: AsyncClient) -> None:
     assert data["id"] == "mock-order-001"
     assert "items" in data
     assert "total_amount" in data
+
+
+@pytest.mark.asyncio
+async def test_create_order_idempotency_key(seeded_client: AsyncClient, admin_headers: dict) -> None:
+    """POST /tables/{n}/orders + Idempotency-Key → 재시도는 같은 주문, 다른 본문은 400."""
+    await seeded_client.post(
+        f"{BASE}/admin/tables", json={"table_number": 1, "password": "1234"}, headers=admin_headers,
+    )
+    session = (await seeded_client.post(
+        f"{BASE}/admin/tables/1/session/start", headers=admin_headers,
+    )).json()
+    menu_id = (await seeded_client.get(f"{BASE}/menus")).json()[0]["id"]
+    body = {"session_id": session["id"], "items": [{"menu_id": menu_id, "quantity": 1}]}
+    headers = {"Idempotency-Key": "retry-1"}
+
+    first = await seeded_client.post(f"{BASE}/tables/1/orders", json=body, headers=headers)
+    assert first.status_code == 201
+    assert "Idempotent-Replayed" not in first.headers
+    again = await seeded_client.post(f"{BASE}/tables/1/orders", json=body, headers=headers)
+    assert again.status_code == 201
+    assert again.headers["Idempotent-Replayed"] == "true"
+    assert again.json()["id"] == first.json()["id"]
+    orders = (await seeded_client.get(f"{BASE}/sessions/{session['id']}/orders")).json()
+    assert len(orders) == 1
+
+    body["items"][0]["quantity"] = 2
+    resp = await seeded_client.post(f"{BASE}/tables/1/orders", json=body, headers=headers)
+    assert resp.status_code == 400
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
 import pytest
 
 from backend.data.datastore import DataStore
-from backend.exceptions import NotFoundError
+from backend.exceptions import NotFoundError, PreconditionFailedError
 
 
 class TestRead:
@@ -114,3 +115,242 @@ class TestDelete:
         await datastore.write("menus", "s1", [{"id": "1"}])
         with pytest.raises(NotFoundError):
             await datastore.delete("menus", "s1", "missing")
+
+
+class TestFindBy:
+    @pytest.fixture(params=[False, True], ids=["nocache", "cache"])
+    def ds(self, tmp_path, request) -> DataStore:
+        return DataStore(base_path=str(tmp_path / "data"), cache_enabled=request.param)
+
+    async def test_find_by_indexed_field(self, ds: DataStore):
+        await ds.append("orders", "s1", {"id": "1", "session_id": "a", "table_number": 1})
+        await ds.append("orders", "s1", {"id": "2", "session_id": "b", "table_number": 2})
+        await ds.append("orders", "s1", {"id": "3", "session_id": "a", "table_number": 1})
+        result = await ds.find_by("orders", "s1", "session_id", "a")
+        assert [r["id"] for r in result] == ["1", "3"]
+
+    async def test_find_by_composite_index(self, ds: DataStore):
+        await ds.write("sessions", "s1", [
+            {"id": "x", "table_number": 1, "status": "ended"},
+            {"id": "y", "table_number": 1, "status": "active"},
+        ])
+        result = await ds.find_by("sessions", "s1", ("table_number", "status"), (1, "active"))
+        assert [r["id"] for r in result] == ["y"]
+
+    async def test_index_follows_update_and_delete(self, ds: DataStore):
+        await ds.append("orders", "s1", {"id": "1", "session_id": "a", "table_number": 1})
+        await ds.append("orders", "s1", {"id": "2", "session_id": "a", "table_number": 1})
+        assert len(await ds.find_by("orders", "s1", "table_number", 1)) == 2
+
+        await ds.update("orders", "s1", "1", {"table_number": 5})
+        await ds.delete("orders", "s1", "2")
+
+        assert await ds.find_by("orders", "s1", "table_number", 1) == []
+        moved = await ds.find_by("orders", "s1", "table_number", 5)
+        assert [r["id"] for r in moved] == ["1"]
+        assert await ds.find_by_id("orders", "s1", "2") is None
+
+    async def test_find_by_ids(self, ds: DataStore):
+        await ds.write("menus", "s1", [{"id": str(i), "n": i} for i in range(5)])
+        found = await ds.find_by_ids("menus", "s1", ["3", "9", "1"])
+        assert found == {"3": {"id": "3", "n": 3}, "1": {"id": "1", "n": 1}}
+        found["3"]["n"] = -1
+        assert (await ds.find_by_id("menus", "s1", "3"))["n"] == 3
+
+    async def test_find_by_unindexed_field_scans(self, ds: DataStore):
+        await ds.write("menus", "s1", [{"id": "1", "category": "A"}, {"id": "2", "category": "B"}])
+        result = await ds.find_by("menus", "s1", "category", "B")
+        assert [r["id"] for r in result] == ["2"]
+
+
+class TestUpdateIf:
+    @pytest.fixture(params=[False, True], ids=["nocache", "cache"])
+    async def ds(self, tmp_path, request) -> DataStore:
+        ds = DataStore(base_path=str(tmp_path / "data"), cache_enabled=request.param)
+        await ds.write("orders", "s1", [{"id": "1", "status": "pending"}])
+        return ds
+
+    async def test_applies_when_expected(self, ds: DataStore):
+        before, after = await ds.update_if("orders", "s1", "1", {"status": "pending"}, {"status": "done"})
+        assert before["status"] == "pending"
+        assert after["status"] == "done"
+        assert (await ds.find_by_id("orders", "s1", "1"))["status"] == "done"
+
+    async def test_rejects_with_current_state(self, ds: DataStore):
+        with pytest.raises(PreconditionFailedError) as exc:
+            await ds.update_if("orders", "s1", "1", lambda r: r["status"] == "done", {"status": "x"})
+        assert exc.value.current["status"] == "pending"
+        with pytest.raises(NotFoundError):
+            await ds.update_if("orders", "s1", "missing", {}, {"status": "x"})
+
+    async def test_concurrent_compare_and_set(self, ds: DataStore):
+        results = await asyncio.gather(*(
+            ds.update_if("orders", "s1", "1", {"status": "pending"}, {"status": f"by-{i}"})
+            for i in range(5)
+        ), return_exceptions=True)
+        assert sum(isinstance(r, PreconditionFailedError) for r in results) == 4
+
+    async def test_update_many_if(self, ds: DataStore):
+        await ds.append("orders", "s1", {"id": "2", "status": "done"})
+        results = await ds.update_many_if(
+            "orders", "s1", {"1": {"status": "done"}, "2": {"status": "x"}, "3": {}},
+            expected={"status": "pending"},
+        )
+        assert results["1"][1]["status"] == "done"
+        assert results["2"] == ({"id": "2", "status": "done"}, None)
+        assert results["3"] == (None, None)
+
+
+class TestQuery:
+    @pytest.fixture(params=[False, True], ids=["nocache", "cache"])
+    async def ds(self, tmp_path, request) -> DataStore:
+        ds = DataStore(base_path=str(tmp_path / "data"), cache_enabled=request.param)
+        await ds.write("orders", "s1", [
+            {"id": "1", "table_number": 1, "status": "pending", "total": 300},
+            {"id": "2", "table_number": 2, "status": "pending", "total": 100},
+            {"id": "3", "table_number": 1, "status": "completed", "total": 200},
+            {"id": "4", "table_number": 1, "status": "pending"},
+        ])
+        return ds
+
+    async def test_where_uses_index_and_filters_rest(self, ds: DataStore):
+        result = await ds.query("orders", "s1", where={"table_number": 1, "status": "pending"})
+        assert [r["id"] for r in result] == ["1", "4"]
+
+    async def test_order_and_page(self, ds: DataStore):
+        ids = lambda rs: [r["id"] for r in rs]  # noqa: E731
+        assert ids(await ds.query("orders", "s1", order_by="total")) == ["2", "3", "1", "4"]
+        assert ids(await ds.query("orders", "s1", order_by="-total", limit=2)) == ["1", "3"]
+        assert ids(await ds.query("orders", "s1", order_by="-total", offset=2)) == ["2", "4"]
+        assert ids(await ds.query(
+            "orders", "s1", order_by=["status", "-total"], limit=3,
+        )) == ["3", "1", "2"]
+
+    async def test_results_are_copies(self, ds: DataStore):
+        (found,) = await ds.query("orders", "s1", where={"id": "2"})
+        found["status"] = "x"
+        assert (await ds.find_by_id("orders", "s1", "2"))["status"] == "pending"
+
+    async def test_range_on_unpartitioned_entity(self, ds: DataStore):
+        with pytest.raises(ValueError):
+            await ds.query("orders", "s1", start="2026-01-01")
+
+
+class TestBulk:
+    @pytest.fixture(params=[False, True], ids=["nocache", "cache"])
+    def ds(self, tmp_path, request) -> DataStore:
+        return DataStore(
+            base_path=str(tmp_path / "data"),
+            cache_enabled=request.param,
+            journal_entities=["orders"],
+        )
+
+    async def test_delete_many_reports_per_id(self, ds: DataStore):
+        await ds.write("orders", "s1", [{"id": "1"}, {"id": "2"}, {"id": "3"}])
+        result = await ds.delete_many("orders", "s1", ["1", "3", "missing"])
+        assert result == {"1": True, "3": True, "missing": False}
+        assert await ds.read("orders", "s1") == [{"id": "2"}]
+
+    async def test_delete_many_is_one_write(self, ds: DataStore):
+        await ds.write("menus", "s1", [{"id": str(i)} for i in range(10)])
+        writes = []
+        original = ds._atomic_write
+
+        async def counting(path, data):
+            writes.append(path)
+            await original(path, data)
+
+        ds._atomic_write = counting
+        await ds.delete_many("menus", "s1", [str(i) for i in range(5)])
+        assert len(writes) == 1
+
+    async def test_noop_bulk_skips_write(self, ds: DataStore):
+        await ds.write("menus", "s1", [{"id": "1"}])
+        path = ds._get_file_path("menus", "s1")
+        before = path.stat().st_mtime_ns
+        assert await ds.delete_many("menus", "s1", ["missing"]) == {"missing": False}
+        assert await ds.delete_where("menus", "s1", lambda r: False) == []
+        assert path.stat().st_mtime_ns == before
+
+    async def test_update_many(self, ds: DataStore):
+        await ds.write("orders", "s1", [
+            {"id": "1", "status": "pending", "table_number": 1},
+            {"id": "2", "status": "pending", "table_number": 1},
+        ])
+        result = await ds.update_many("orders", "s1", {
+            "1": {"status": "preparing"}, "missing": {"status": "x"},
+        })
+        assert result["1"]["status"] == "preparing"
+        assert result["missing"] is None
+        assert (await ds.find_by_id("orders", "s1", "2"))["status"] == "pending"
+
+    async def test_where_variants_keep_indexes(self, ds: DataStore):
+        await ds.write("orders", "s1", [
+            {"id": "1", "table_number": 1, "status": "pending"},
+            {"id": "2", "table_number": 2, "status": "pending"},
+            {"id": "3", "table_number": 1, "status": "completed"},
+        ])
+        updated = await ds.update_where(
+            "orders", "s1", lambda r: r["status"] == "pending", {"table_number": 9},
+        )
+        assert [r["id"] for r in updated] == ["1", "2"]
+        deleted = await ds.delete_where("orders", "s1", lambda r: r["table_number"] == 9)
+        assert deleted == ["1", "2"]
+        assert await ds.find_by("orders", "s1", "table_number", 9) == []
+        assert [r["id"] for r in await ds.find_by("orders", "s1", "table_number", 1)] == ["3"]
+
+
+class TestIter:
+    @pytest.fixture(params=[False, True], ids=["nocache", "cache"])
+    def ds(self, tmp_path, request) -> DataStore:
+        return DataStore(
+            base_path=str(tmp_path / "data"), cache_enabled=request.param,
+            journal_entities=["orders", "order_history"], io_inline_threshold=0,
+        )
+
+    async def test_iter_matches_read_with_journal(self, ds: DataStore):
+        await ds.write("orders", "s1", [{"id": str(i), "n": i} for i in range(600)])
+        await ds.update("orders", "s1", "3", {"n": -1})
+        await ds.delete("orders", "s1", "4")
+        await ds.append("orders", "s1", {"id": "new"})
+        streamed = [r async for r in ds.iter("orders", "s1")]
+        assert streamed == await ds.read("orders", "s1")
+        assert len(streamed) == 600
+
+    async def test_iter_partition_range(self, ds: DataStore):
+        for day in ("2026-08-31", "2026-09-15", "2026-10-01"):
+            await ds.append("order_history", "s1", {"id": day, "session_ended_at": f"{day}T00:00:00Z"})
+        ids = [r["id"] async for r in ds.iter("order_history", "s1", "2026-09-01", "2026-10-31")]
+        assert ids == ["2026-09-15", "2026-10-01"]
+
+    async def test_iter_sees_snapshot_at_open(self, ds: DataStore):
+        await ds.write("menus", "s1", [{"id": str(i)} for i in range(3)])
+        stream = ds.iter("menus", "s1")
+        first = await stream.__anext__()
+        await ds.write("menus", "s1", [])
+        rest = [r async for r in stream]
+        assert [first["id"]] + [r["id"] for r in rest] == ["0", "1", "2"]
+
+
+class TestSequence:
+    async def test_concurrent_allocation_is_unique(self, tmp_path):
+        base = str(tmp_path / "data")
+        ds = DataStore(base_path=base, cache_enabled=True, journal_entities=["sequences"])
+        values = await asyncio.gather(*(ds.next_sequence("s1", "order:20261018") for _ in range(50)))
+        assert sorted(values) == list(range(1, 51))
+        assert await ds.next_sequence("s1", "order:20261019") == 1
+
+        reopened = DataStore(base_path=base, journal_entities=["sequences"])
+        assert await reopened.next_sequence("s1", "order:20261018") == 51
+
+    async def test_seed_only_for_new_counter(self, datastore: DataStore):
+        calls = 0
+
+        async def seed() -> int:
+            nonlocal calls
+            calls += 1
+            return 7
+
+        assert await datastore.next_sequence("s1", "n", seed=seed) == 8
+        assert await datastore.next_sequence("s1", "n", seed=seed) == 9
+        assert calls == 1
@@ -0,0 +1,99 @@
+"""DataStore resident cache tests."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from backend.data.datastore import DataStore
+
+
+@pytest.fixture
+def cached_ds(tmp_path) -> DataStore:
+    return DataStore(base_path=str(tmp_path / "data"), cache_enabled=True)
+
+
+class TestCache:
+    async def test_read_populates_cache(self, cached_ds: DataStore):
+        await cached_ds.write("menus", "s1", [{"id": "1"}])
+        await cached_ds.read("menus", "s1")
+        assert len(cached_ds._cache) == 1
+
+    async def test_cached_read_skips_file_parse(self, cached_ds: DataStore, monkeypatch):
+        await cached_ds.write("menus", "s1", [{"id": "1"}])
+        await cached_ds.read("menus", "s1")
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("file should not be re-read")
+
+        monkeypatch.setattr(cached_ds, "_read_file", fail)
+        result = await cached_ds.read("menus", "s1")
+        assert result == [{"id": "1"}]
+
+    async def test_write_through_on_mutations(self, cached_ds: DataStore):
+        await cached_ds.append("orders", "s1", {"id": "1", "status": "pending"})
+        await cached_ds.append("orders", "s1", {"id": "2", "status": "pending"})
+        await cached_ds.update("orders", "s1", "1", {"status": "preparing"})
+        await cached_ds.delete("orders", "s1", "2")
+
+        result = await cached_ds.read("orders", "s1")
+        assert [r["id"] for r in result] == ["1"]
+        assert result[0]["status"] == "preparing"
+
+        on_disk = json.loads(
+            cached_ds._get_file_path("orders", "s1").read_text(encoding="utf-8")
+        )
+        assert on_disk == result
+
+    async def test_external_change_invalidates(self, cached_ds: DataStore):
+        await cached_ds.write("menus", "s1", [{"id": "1"}])
+        await cached_ds.read("menus", "s1")
+
+        file_path = cached_ds._get_file_path("menus", "s1")
+        file_path.write_text(json.dumps([{"id": "1"}, {"id": "2"}]), encoding="utf-8")
+        st = file_path.stat()
+        os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        result = await cached_ds.read("menus", "s1")
+        assert len(result) == 2
+
+    async def test_signature_follows_writes(self, cached_ds: DataStore):
+        assert await cached_ds.signature("orders", "s1") is None
+        await cached_ds.append("orders", "s1", {"id": "1"})
+        first = await cached_ds.signature("orders", "s1")
+        assert first is not None
+        assert cached_ds.written_signature("orders", "s1") == (None, first)
+        await cached_ds.update("orders", "s1", "1", {"status": "done"})
+        second = await cached_ds.signature("orders", "s1")
+        assert second != first
+        assert cached_ds.written_signature("orders", "s1") == (first, second)
+
+    async def test_returned_records_are_copies(self, cached_ds: DataStore):
+        await cached_ds.write("menus", "s1", [{"id": "1", "name": "A"}])
+        result = await cached_ds.read("menus", "s1")
+        result[0]["name"] = "mutated"
+        result.append({"id": "2"})
+
+        found = await cached_ds.find_by_id("menus", "s1", "1")
+        found["name"] = "mutated again"
+
+        assert await cached_ds.read("menus", "s1") == [{"id": "1", "name": "A"}]
+
+    async def test_index_lookup_keeps_file_order_after_update(self, cached_ds: DataStore):
+        for i in range(3):
+            await cached_ds.append("orders", "s1", {"id": f"o{i}", "session_id": "S", "table_number": 1})
+        assert [r["id"] for r in await cached_ds.find_by("orders", "s1", "session_id", "S")] == [
+            "o0", "o1", "o2",
+        ]
+        await cached_ds.update("orders", "s1", "o0", {"status": "preparing"})
+        assert [r["id"] for r in await cached_ds.find_by("orders", "s1", "session_id", "S")] == [
+            "o0", "o1", "o2",
+        ]
+        # 인덱스 필드가 바뀌면 파일 순서로 다시 구성
+        await cached_ds.update("orders", "s1", "o0", {"table_number": 2})
+        await cached_ds.update("orders", "s1", "o0", {"table_number": 1})
+        assert [r["id"] for r in await cached_ds.find_by("orders", "s1", "table_number", 1)] == [
+            "o0", "o1", "o2",
+        ]
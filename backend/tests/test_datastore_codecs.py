@@ -0,0 +1,125 @@
+"""Snapshot codec tests."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from backend.data import codecs
+from backend.data.convert import convert
+from backend.data.datastore import DataStore
+
+RECORDS = [
+    {"id": "1", "name": "김치찌개", "price": 9000, "tags": ["매운맛"], "meta": {"a": None}},
+    {"id": "2", "name": "된장찌개", "price": 8500.5, "is_available": False},
+]
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("name", sorted(codecs.CODECS))
+    def test_round_trip_and_detect(self, name: str):
+        codec = codecs.get_codec(name)
+        encoded = codec.encode(RECORDS)
+        assert codecs.decode(encoded) == RECORDS
+        assert codecs.decode(codec.encode([])) == []
+
+    def test_compact_is_smaller_than_pretty(self):
+        pretty = codecs.get_codec("json").encode(RECORDS)
+        compact = codecs.get_codec("json-compact").encode(RECORDS)
+        assert len(compact) < len(pretty)
+        assert json.loads(compact) == RECORDS
+
+    @pytest.mark.parametrize("name", sorted(codecs.CODECS))
+    def test_iter_decode_small_chunks(self, name: str):
+        encoded = codecs.get_codec(name).encode(RECORDS * 20)
+        assert list(codecs.iter_decode(io.BytesIO(encoded), chunk_size=7)) == RECORDS * 20
+        assert list(codecs.iter_decode(io.BytesIO(b""))) == []
+
+    def test_iter_decode_truncated_json_raises(self):
+        encoded = codecs.get_codec("json").encode(RECORDS)
+        with pytest.raises(ValueError):
+            list(codecs.iter_decode(io.BytesIO(encoded[:-5]), chunk_size=16))
+
+    def test_truncated_binary_raises(self):
+        encoded = codecs.get_codec("binary").encode(RECORDS)
+        with pytest.raises(ValueError):
+            codecs.decode(encoded[:-3])
+
+    def test_binary_is_portable_json(self):
+        from backend.models.enums import OrderStatus
+
+        encoded = codecs.get_codec("binary").encode([{"id": "1", "status": OrderStatus.PENDING}])
+        assert codecs.decode(encoded) == [{"id": "1", "status": "pending"}]
+        assert b'{"id":"1","status":"pending"}' in encoded
+
+    def test_binary_rejects_unknown_header(self):
+        with pytest.raises(ValueError):
+            codecs.get_codec("binary").decode(b"TOREC\x09" + b"\x00" * 8)
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            codecs.get_codec("xml")
+
+
+class TestDataStoreCodecs:
+    async def test_entity_codec_used_for_snapshot(self, tmp_path):
+        ds = DataStore(
+            base_path=str(tmp_path / "data"),
+            codec="json-compact",
+            entity_codecs={"menus": "binary"},
+        )
+        await ds.write("menus", "s1", RECORDS)
+        await ds.write("tables", "s1", RECORDS)
+        assert ds._get_file_path("menus", "s1").read_bytes().startswith(codecs.BINARY_MAGIC)
+        assert b"\n" not in ds._get_file_path("tables", "s1").read_bytes()
+        assert await ds.read("menus", "s1") == RECORDS
+
+    async def test_switching_codec_reads_old_files(self, tmp_path):
+        base = str(tmp_path / "data")
+        await DataStore(base_path=base).write("orders", "s1", RECORDS)
+        ds = DataStore(base_path=base, codec="ndjson")
+        assert await ds.read("orders", "s1") == RECORDS
+        await ds.append("orders", "s1", {"id": "3"})
+        content = ds._get_file_path("orders", "s1").read_bytes()
+        assert content.startswith(b"{")
+        assert len(await ds.read("orders", "s1")) == 3
+
+    async def test_binary_orders_through_order_service(self, tmp_path):
+        from backend.services.event_bus import EventBus
+        from backend.services.menu_service import MenuService
+        from backend.services.order_service import OrderService
+
+        ds = DataStore(base_path=str(tmp_path / "data"), entity_codecs={"orders": "binary"})
+        await ds.write("menus", "s1", [{"id": "m1", "name": "A", "price": 1000, "is_available": True}])
+        service = OrderService(ds, EventBus(), MenuService(ds))
+        order = await service.create_order("s1", 1, "S", [{"menu_id": "m1", "quantity": 1}])
+        assert ds._get_file_path("orders", "s1").read_bytes().startswith(codecs.BINARY_MAGIC)
+        assert (await ds.find_by_id("orders", "s1", order["id"]))["status"] == "pending"
+
+    async def test_corrupted_snapshot_reads_empty(self, tmp_path):
+        ds = DataStore(base_path=str(tmp_path / "data"), codec="binary")
+        await ds.write("menus", "s1", RECORDS)
+        path = ds._get_file_path("menus", "s1")
+        path.write_bytes(path.read_bytes()[:-2])
+        assert await ds.read("menus", "s1") == []
+
+
+async def test_offline_convert(tmp_path):
+    base = tmp_path / "data"
+    ds = DataStore(base_path=str(base))
+    await ds.write("stores", "", [{"id": "s1"}])
+    await ds.write("menus", "s1", RECORDS)
+    await ds.append("order_history", "s1", {"id": "h", "session_ended_at": "2026-10-01T00:00:00Z"})
+
+    results = convert(str(base), "binary")
+    assert set(results) == {"stores.json", "s1/menus.json", "s1/order_history/2026-10.json"}
+    assert all(after < before for before, after in results.values())
+
+    reopened = DataStore(base_path=str(base))
+    assert await reopened.read("menus", "s1") == RECORDS
+    assert [r["id"] for r in await reopened.read("order_history", "s1")] == ["h"]
+
+    only_menus = convert(str(base), "json", {"menus"})
+    assert set(only_menus) == {"s1/menus.json"}
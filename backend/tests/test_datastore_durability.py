@@ -0,0 +1,139 @@
+"""DataStore fsync policy, checkpoint and startup recovery tests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from backend.data import durability
+from backend.data.datastore import DataStore
+
+
+@pytest.fixture
+def synced(monkeypatch) -> list[tuple[set, set]]:
+    calls: list[tuple[set, set]] = []
+    original = durability.sync_paths
+
+    def recording(files, directories=()):
+        files, directories = set(files), set(directories)
+        calls.append((files, directories))
+        original(files, directories)
+
+    monkeypatch.setattr(durability, "sync_paths", recording)
+    return calls
+
+
+def _ds(tmp_path, **kwargs) -> DataStore:
+    return DataStore(
+        base_path=str(tmp_path / "data"), journal_entities=["orders", "sessions"], **kwargs,
+    )
+
+
+class TestFsyncPolicy:
+    def test_unknown_policy_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            _ds(tmp_path, fsync="sometimes")
+
+    async def test_os_policy_never_syncs(self, tmp_path, synced):
+        ds = _ds(tmp_path)
+        await ds.append("orders", "s1", {"id": "1"})
+        await ds.write("menus", "s1", [{"id": "m"}])
+        assert synced == []
+
+    async def test_always_syncs_each_append(self, tmp_path, synced):
+        ds = _ds(tmp_path, fsync="always")
+        await ds.append("orders", "s1", {"id": "1"})
+        await ds.append("orders", "s1", {"id": "2"})
+        journal_path = ds._get_journal_path("orders", "s1")
+        assert [files for files, _ in synced] == [{journal_path}, {journal_path}]
+        # 새 저널 파일은 디렉토리 엔트리도 동기화
+        assert synced[0][1] == {journal_path.parent}
+        assert synced[1][1] == set()
+
+    async def test_always_syncs_snapshot_before_replace(self, tmp_path, synced):
+        ds = _ds(tmp_path, fsync="always")
+        await ds.write("menus", "s1", [{"id": "m"}])
+        tmp_path_synced = synced[0][0].pop()
+        assert tmp_path_synced.name.endswith(".tmp")
+        assert synced[1][1] == {ds._get_file_path("menus", "s1").parent}
+
+    async def test_batch_groups_concurrent_appends(self, tmp_path, synced):
+        ds = _ds(tmp_path, fsync="batch", fsync_interval=0.02)
+        await asyncio.gather(
+            ds.append("orders", "s1", {"id": "1"}),
+            ds.append("sessions", "s1", {"id": "x"}),
+            ds.append("orders", "s2", {"id": "2"}),
+        )
+        assert len(synced) == 1
+        assert synced[0][0] == {
+            ds._get_journal_path("orders", "s1"),
+            ds._get_journal_path("sessions", "s1"),
+            ds._get_journal_path("orders", "s2"),
+        }
+
+    async def test_batch_wait_does_not_block_reads(self, tmp_path, synced, monkeypatch):
+        threads: list[str] = []
+        recording = durability.sync_paths
+
+        def on_thread(files, directories=()):
+            threads.append(threading.current_thread().name)
+            recording(files, directories)
+
+        monkeypatch.setattr(durability, "sync_paths", on_thread)
+        ds = _ds(tmp_path, fsync="batch", fsync_interval=0.5)
+        writer = asyncio.create_task(ds.append("orders", "s1", {"id": "1"}))
+        await asyncio.sleep(0.02)
+        # fsync 대기 중에도 Lock은 풀려 있어 읽기가 바로 끝남
+        assert [r["id"] for r in await asyncio.wait_for(ds.read("orders", "s1"), 0.1)] == ["1"]
+        assert not writer.done()
+        await ds._batcher.flush()
+        await writer
+        assert len(synced) == 1
+        # fsync는 전용 I/O 풀에서 실행
+        assert threads[0].startswith("datastore-io")
+        await ds.close()
+
+
+class TestCheckpoint:
+    async def test_start_recovers_leftover_journals(self, tmp_path):
+        first = _ds(tmp_path)
+        await first.write("orders", "s1", [{"id": "1", "status": "pending"}])
+        await first.update("orders", "s1", "1", {"status": "completed"})
+        journal_path = first._get_journal_path("orders", "s1")
+        assert journal_path.exists()
+
+        second = _ds(tmp_path)
+        await second.start()
+        try:
+            assert not journal_path.exists()
+            snapshot = json.loads(
+                second._get_file_path("orders", "s1").read_text(encoding="utf-8"))
+            assert snapshot[0]["status"] == "completed"
+        finally:
+            await second.close()
+
+    async def test_background_checkpoint(self, tmp_path):
+        ds = _ds(tmp_path, checkpoint_interval=0.01)
+        await ds.start()
+        try:
+            await ds.append("orders", "s1", {"id": "1"})
+            journal_path = ds._get_journal_path("orders", "s1")
+            for _ in range(50):
+                if not journal_path.exists():
+                    break
+                await asyncio.sleep(0.01)
+            assert not journal_path.exists()
+            assert await ds.read("orders", "s1") == [{"id": "1"}]
+        finally:
+            await ds.close()
+
+    async def test_close_flushes_and_checkpoints(self, tmp_path):
+        ds = _ds(tmp_path, fsync="batch", fsync_interval=10)
+        append = asyncio.create_task(ds.append("orders", "s1", {"id": "1"}))
+        await asyncio.sleep(0.01)
+        await ds.close()
+        await append
+        assert not ds._get_journal_path("orders", "s1").exists()
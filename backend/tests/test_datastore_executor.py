@@ -0,0 +1,89 @@
+"""DataStore I/O executor tests."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from backend.data.datastore import DataStore
+from backend.data.executor import IOExecutor
+
+
+class TestIOExecutor:
+    async def test_small_work_runs_inline(self):
+        io = IOExecutor(inline_threshold=100)
+        thread = await io.run(threading.current_thread, size=10)
+        assert thread is threading.current_thread()
+        assert io.metrics()["inline_tasks"] == 1
+        assert io.metrics()["offloaded_tasks"] == 0
+
+    async def test_large_work_is_offloaded(self):
+        io = IOExecutor(inline_threshold=100)
+        thread = await io.run(threading.current_thread, size=1000)
+        assert thread.name.startswith("datastore-io")
+        blocking = await io.run(threading.current_thread)
+        assert blocking.name.startswith("datastore-io")
+        assert io.metrics()["offloaded_tasks"] == 2
+
+    async def test_loop_stays_responsive(self):
+        io = IOExecutor(max_workers=2, inline_threshold=0)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await asyncio.gather(*(io.run(time.sleep, 0.05, size=1) for _ in range(4)))
+        task.cancel()
+        assert ticks >= 5
+        metrics = io.metrics()
+        assert metrics["max_queue_depth"] == 4
+        assert metrics["queue_depth"] == 0
+        assert metrics["queue_wait_seconds"] > 0
+
+
+class TestDataStoreOffload:
+    async def test_large_files_use_pool(self, tmp_path):
+        ds = DataStore(base_path=str(tmp_path / "data"), io_inline_threshold=1024)
+        big = [{"id": str(i), "description": "x" * 100} for i in range(100)]
+        await ds.write("menus", "s1", big)
+        await ds.write("menus", "s1", big)  # 기존 파일 크기로 인코딩 비용 추정
+        before = ds.io_metrics()["offloaded_tasks"]
+        assert await ds.read("menus", "s1") == big
+        assert ds.io_metrics()["offloaded_tasks"] == before + 1
+
+    async def test_small_files_stay_inline(self, tmp_path):
+        ds = DataStore(base_path=str(tmp_path / "data"))
+        await ds.write("menus", "s1", [{"id": "1"}])
+        assert await ds.read("menus", "s1") == [{"id": "1"}]
+        assert ds.io_metrics()["offloaded_tasks"] == 0
+
+    async def test_close_shuts_down_pool(self, tmp_path):
+        ds = DataStore(base_path=str(tmp_path / "data"), io_inline_threshold=0)
+        await ds.write("menus", "s1", [{"id": "1"}])
+        threads = list(ds._io._pool._threads)
+        assert threads
+        await ds.close()
+        assert not any(t.is_alive() for t in threads)
+
+    async def test_transaction_commit_applies_files_on_pool(self, tmp_path, monkeypatch):
+        ds = DataStore(base_path=str(tmp_path / "data"), journal_entities=["orders"])
+        threads: list[str] = []
+        original = ds._roll_forward
+
+        def recording(marker: dict) -> None:
+            threads.append(threading.current_thread().name)
+            original(marker)
+
+        monkeypatch.setattr(ds, "_roll_forward", recording)
+        await ds.write("sessions", "s1", [{"id": "S"}])
+        async with ds.transaction("s1", ["orders", "sessions"]) as tx:
+            await tx.append("orders", {"id": "o1"})
+            await tx.update("sessions", "S", {"status": "ended"})
+        assert [o["id"] for o in await ds.read("orders", "s1")] == ["o1"]
+        assert threads and threads[0].startswith("datastore-io")
+        await ds.close()
@@ -0,0 +1,109 @@
+"""DataStore journal mode tests."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from backend.data import journal
+from backend.data.datastore import DataStore
+from backend.exceptions import NotFoundError
+
+
+@pytest.fixture(params=[False, True], ids=["nocache", "cache"])
+def journal_ds(tmp_path, request) -> DataStore:
+    return DataStore(
+        base_path=str(tmp_path / "data"),
+        cache_enabled=request.param,
+        journal_entities=["orders"],
+        journal_compact_threshold=5,
+    )
+
+
+class TestJournal:
+    async def test_append_writes_single_line(self, journal_ds: DataStore):
+        await journal_ds.write("orders", "s1", [{"id": str(i)} for i in range(3)])
+        snapshot = journal_ds._get_file_path("orders", "s1")
+        before = snapshot.read_text(encoding="utf-8")
+
+        await journal_ds.append("orders", "s1", {"id": "new"})
+
+        assert snapshot.read_text(encoding="utf-8") == before
+        lines = journal_ds._get_journal_path("orders", "s1").read_text(
+            encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0]) == {"op": "append", "record": {"id": "new"}}
+
+    async def test_read_replays_journal(self, journal_ds: DataStore):
+        await journal_ds.append("orders", "s1", {"id": "1", "status": "pending"})
+        await journal_ds.append("orders", "s1", {"id": "2", "status": "pending"})
+        await journal_ds.update("orders", "s1", "1", {"status": "completed"})
+        await journal_ds.delete("orders", "s1", "2")
+
+        fresh = DataStore(base_path=str(journal_ds._base_path), journal_entities=["orders"])
+        result = await fresh.read("orders", "s1")
+        assert [r["id"] for r in result] == ["1"]
+        assert result[0]["status"] == "completed"
+
+    async def test_update_missing_raises(self, journal_ds: DataStore):
+        with pytest.raises(NotFoundError):
+            await journal_ds.update("orders", "s1", "missing", {"status": "x"})
+
+    async def test_compaction_at_threshold(self, journal_ds: DataStore):
+        for i in range(5):
+            await journal_ds.append("orders", "s1", {"id": str(i)})
+
+        assert not journal_ds._get_journal_path("orders", "s1").exists()
+        snapshot = json.loads(
+            journal_ds._get_file_path("orders", "s1").read_text(encoding="utf-8")
+        )
+        assert len(snapshot) == 5
+
+    async def test_manual_compact(self, journal_ds: DataStore):
+        await journal_ds.append("orders", "s1", {"id": "1"})
+        await journal_ds.compact("orders", "s1")
+        assert not journal_ds._get_journal_path("orders", "s1").exists()
+        assert len(await journal_ds.read("orders", "s1")) == 1
+
+    async def test_truncated_last_line_is_skipped(self, journal_ds: DataStore):
+        await journal_ds.append("orders", "s1", {"id": "1"})
+        with open(journal_ds._get_journal_path("orders", "s1"), "a", encoding="utf-8") as f:
+            f.write('{"op": "append", "rec')
+        result = await journal_ds.read("orders", "s1")
+        assert [r["id"] for r in result] == ["1"]
+
+
+class TestReplay:
+    def test_replay_is_idempotent(self):
+        entries = [
+            journal.append_entry({"id": "1", "v": 1}),
+            journal.update_entry("1", {"v": 2}),
+            journal.append_entry({"id": "2"}),
+            journal.delete_entry("2"),
+        ]
+        once = journal.replay([], [dict(e) for e in entries])
+        twice = journal.replay([dict(r) for r in once], entries)
+        assert once == twice == [{"id": "1", "v": 2}]
+
+    def test_replay_stream_matches_replay(self):
+        import copy
+        import random
+
+        rng = random.Random(7)
+        for _ in range(200):
+            snapshot = [{"id": str(i), "v": 0} for i in range(rng.randint(0, 5))]
+            snapshot.append({"note": "no id"})
+            entries = []
+            for _ in range(rng.randint(0, 8)):
+                key = str(rng.randint(0, 7))
+                op = rng.choice(["append", "update", "delete"])
+                if op == "append":
+                    entries.append(journal.append_entry({"id": key, "v": rng.randint(1, 9)}))
+                elif op == "update":
+                    entries.append(journal.update_entry(key, {"v": rng.randint(1, 9)}))
+                else:
+                    entries.append(journal.delete_entry(key))
+            expected = journal.replay(copy.deepcopy(snapshot), copy.deepcopy(entries))
+            streamed = list(journal.replay_stream(iter(copy.deepcopy(snapshot)), copy.deepcopy(entries)))
+            assert streamed == expected
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import multiprocessing
 
 import pytest
 
 from backend.data.datastore import DataStore
-from backend.exceptions import ConcurrencyError
+from backend.data.filelock import FileLock
+from backend.data.rwlock import RWLock
+from backend.exceptions import ConcurrencyError, NotFoundError
 
 
 class TestConcurrency:
@@ -68,3 +71,181 @@ class TestLockTimeout:
                 await ds.read("menus", "s1")
         finally:
             lock.release()
+
+
+class TestGroupCommit:
+    async def test_concurrent_appends_share_one_write(self, datastore: DataStore, monkeypatch):
+        """동시 append가 배치로 묶여 쓰기 횟수가 줄어드는지 검증."""
+        writes = 0
+        original = datastore._atomic_write
+
+        async def counting_write(file_path, data):
+            nonlocal writes
+            writes += 1
+            await original(file_path, data)
+
+        monkeypatch.setattr(datastore, "_atomic_write", counting_write)
+        await asyncio.gather(*(
+            datastore.append("orders", "s1", {"id": str(i)}) for i in range(20)
+        ))
+
+        assert len(await datastore.read("orders", "s1")) == 20
+        assert writes < 20
+
+    async def test_failed_mutation_does_not_affect_batch(self, datastore: DataStore):
+        """배치 내 한 변경의 실패는 해당 호출자에게만 전달."""
+        await datastore.write("orders", "s1", [{"id": "1", "status": "pending"}])
+        results = await asyncio.gather(
+            datastore.update("orders", "s1", "1", {"status": "preparing"}),
+            datastore.update("orders", "s1", "missing", {"status": "preparing"}),
+            datastore.append("orders", "s1", {"id": "2"}),
+            return_exceptions=True,
+        )
+        assert results[0]["status"] == "preparing"
+        assert isinstance(results[1], NotFoundError)
+        assert results[2] is None
+        assert len(await datastore.read("orders", "s1")) == 2
+
+    async def test_timed_out_mutation_is_not_applied(self, tmp_path):
+        """Lock 타임아웃으로 실패한 변경은 이후 배치에 적용되지 않음."""
+        ds = DataStore(base_path=str(tmp_path / "data"), lock_timeout=0.05)
+        lock = ds._get_lock("orders", "s1")
+        await lock.acquire()
+        try:
+            with pytest.raises(ConcurrencyError):
+                await ds.append("orders", "s1", {"id": "late"})
+        finally:
+            lock.release()
+
+        await ds.append("orders", "s1", {"id": "ok"})
+        assert [r["id"] for r in await ds.read("orders", "s1")] == ["ok"]
+
+
+class TestRWLock:
+    async def test_readers_share_lock(self):
+        lock = RWLock()
+        await lock.acquire_read()
+        await asyncio.wait_for(lock.acquire_read(), timeout=0.1)
+        assert lock.readers == 2
+        lock.release_read()
+        lock.release_read()
+
+    async def test_writer_excludes_readers(self):
+        lock = RWLock()
+        await lock.acquire_write()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(lock.acquire_read(), timeout=0.05)
+        lock.release_write()
+        await asyncio.wait_for(lock.acquire_read(), timeout=0.1)
+
+    async def test_waiting_writer_blocks_new_readers(self):
+        """writer preference: 대기 중인 writer 뒤로 새 reader가 줄을 섬."""
+        lock = RWLock()
+        order: list[str] = []
+        await lock.acquire_read()
+
+        async def writer():
+            await lock.acquire_write()
+            order.append("writer")
+            lock.release_write()
+
+        async def reader():
+            await lock.acquire_read()
+            order.append("reader")
+            lock.release_read()
+
+        w = asyncio.create_task(writer())
+        await asyncio.sleep(0)
+        r = asyncio.create_task(reader())
+        await asyncio.sleep(0)
+        assert order == []
+
+        lock.release_read()
+        await asyncio.gather(w, r)
+        assert order == ["writer", "reader"]
+
+    async def test_timed_out_writer_unblocks_readers(self):
+        lock = RWLock()
+        await lock.acquire_read()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(lock.acquire_write(), timeout=0.05)
+        await asyncio.wait_for(lock.acquire_read(), timeout=0.1)
+        assert lock.readers == 2
+
+    async def test_concurrent_datastore_reads_do_not_block(self, tmp_path):
+        """읽기 Lock을 보유한 상태에서도 다른 읽기는 진행."""
+        ds = DataStore(base_path=str(tmp_path / "data"), lock_timeout=0.1)
+        await ds.write("menus", "s1", [{"id": "1"}])
+        lock = ds._get_lock("menus", "s1")
+        await lock.acquire_read()
+        try:
+            assert len(await ds.read("menus", "s1")) == 1
+            with pytest.raises(ConcurrencyError):
+                await ds.append("menus", "s1", {"id": "2"})
+        finally:
+            lock.release_read()
+
+
+def _append_from_process(base_path: str, worker: int, count: int) -> None:
+    async def run() -> None:
+        ds = DataStore(
+            base_path=base_path, cache_enabled=True,
+            journal_entities=["orders"], journal_compact_threshold=7,
+            process_locks=True, lock_timeout=30.0,
+        )
+        for i in range(count):
+            await ds.append("orders", "s1", {"id": f"{worker}-{i}"})
+
+    asyncio.run(run())
+
+
+class TestProcessLocks:
+    async def test_held_file_lock_times_out(self, tmp_path):
+        """다른 프로세스(별도 fd)가 flock을 보유하면 ConcurrencyError."""
+        ds = DataStore(base_path=str(tmp_path / "data"), lock_timeout=0.1, process_locks=True)
+        fd = await FileLock(ds._get_lock_file_path("menus", "s1")).acquire(True, 1.0)
+        try:
+            with pytest.raises(ConcurrencyError):
+                await ds.read("menus", "s1")
+        finally:
+            FileLock.release(fd)
+        assert await ds.read("menus", "s1") == []
+
+    async def test_shared_file_locks_coexist(self, tmp_path):
+        ds = DataStore(base_path=str(tmp_path / "data"), lock_timeout=0.1, process_locks=True)
+        fd = await FileLock(ds._get_lock_file_path("menus", "s1")).acquire(False, 1.0)
+        try:
+            assert await ds.read("menus", "s1") == []
+        finally:
+            FileLock.release(fd)
+
+    async def test_reading_missing_store_creates_no_files(self, tmp_path):
+        base = tmp_path / "data"
+        ds = DataStore(base_path=str(base), process_locks=True)
+        before = sorted(base.rglob("*"))
+        for entity in ("menus", "orders", "order_history"):
+            assert await ds.read(entity, "no-such-store") == []
+        assert await ds.find_by_id("tables", "no-such-store", "1") is None
+        assert sorted(base.rglob("*")) == before
+
+        await ds.append("menus", "s1", {"id": "1"})
+        assert ds._get_lock_file_path("menus", "s1").parent == base / ".locks"
+        assert not list((base / "s1").glob(".*.lock"))
+
+    def test_multi_process_appends_are_not_lost(self, tmp_path):
+        base_path = str(tmp_path / "data")
+        ctx = multiprocessing.get_context("spawn")
+        procs = [
+            ctx.Process(target=_append_from_process, args=(base_path, w, 15))
+            for w in range(3)
+        ]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(timeout=60)
+            assert p.exitcode == 0
+
+        result = asyncio.run(
+            DataStore(base_path=base_path, journal_entities=["orders"]).read("orders", "s1")
+        )
+        assert len(result) == 45
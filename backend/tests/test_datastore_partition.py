@@ -0,0 +1,122 @@
+"""DataStore month-partitioned entity tests."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from backend.data.datastore import DataStore
+from backend.data.sqlite_store import SqliteDataStore
+
+
+def _history(id: str, ended_at: str | None, table_number: int = 1) -> dict:
+    record = {"id": id, "table_number": table_number}
+    if ended_at is not None:
+        record["session_ended_at"] = ended_at
+    return record
+
+
+@pytest.fixture(params=[False, True], ids=["nocache", "cache"])
+def ds(tmp_path, request) -> DataStore:
+    return DataStore(
+        base_path=str(tmp_path / "data"),
+        cache_enabled=request.param,
+        journal_entities=["order_history"],
+    )
+
+
+class TestPartitionedStorage:
+    async def test_append_routes_to_month_file(self, ds: DataStore):
+        await ds.append("order_history", "s1", _history("a", "2026-09-30T23:00:00Z"))
+        await ds.append("order_history", "s1", _history("b", "2026-10-01T01:00:00Z"))
+        await ds.append("order_history", "s1", _history("c", None))
+
+        assert ds._partition_keys("order_history", "s1") == ["2026-09", "2026-10"]
+        assert [r["id"] for r in await ds.read("order_history", "s1")] == ["c", "a", "b"]
+
+    async def test_read_range_prunes_partitions(self, ds: DataStore):
+        await ds.append("order_history", "s1", _history("a", "2026-08-15T00:00:00Z"))
+        await ds.append("order_history", "s1", _history("b", "2026-10-02T00:00:00Z"))
+        await ds.read("order_history", "s1")  # 최초 1회 레거시 파일 확인
+        loaded = []
+        original = ds._load
+
+        async def tracking(entity, store_id):
+            loaded.append(entity)
+            return await original(entity, store_id)
+
+        ds._load = tracking
+        result = await ds.read_range("order_history", "s1", "2026-10-01", "2026-10-31")
+        assert [r["id"] for r in result] == ["b"]
+        assert loaded == ["order_history/2026-10"]
+
+    async def test_read_range_bounds_are_inclusive(self, ds: DataStore):
+        await ds.append("order_history", "s1", _history("a", "2026-10-01T00:00:00Z"))
+        await ds.append("order_history", "s1", _history("b", "2026-10-05T00:00:00Z"))
+        result = await ds.read_range("order_history", "s1", "2026-10-01T00:00:00Z", None)
+        assert [r["id"] for r in result] == ["a", "b"]
+        result = await ds.read_range("order_history", "s1", None, "2026-10-01T00:00:00Z")
+        assert [r["id"] for r in result] == ["a"]
+
+    async def test_update_and_delete_find_partition(self, ds: DataStore):
+        await ds.append("order_history", "s1", _history("a", "2026-09-01T00:00:00Z"))
+        await ds.append("order_history", "s1", _history("b", "2026-10-01T00:00:00Z"))
+        updated = await ds.update("order_history", "s1", "a", {"note": "x"})
+        assert updated["note"] == "x"
+        await ds.delete("order_history", "s1", "b")
+        assert await ds.delete_many("order_history", "s1", ["a", "zz"]) == {
+            "a": True, "zz": False,
+        }
+        assert await ds.read("order_history", "s1") == []
+
+    async def test_write_replaces_all_partitions(self, ds: DataStore):
+        await ds.append("order_history", "s1", _history("a", "2026-09-01T00:00:00Z"))
+        await ds.write("order_history", "s1", [_history("b", "2026-10-01T00:00:00Z")])
+        assert [r["id"] for r in await ds.read("order_history", "s1")] == ["b"]
+        await ds.write("order_history", "s1", [])
+        assert await ds.read("order_history", "s1") == []
+
+    async def test_legacy_file_is_split_on_first_access(self, tmp_path):
+        base = tmp_path / "data"
+        (base / "s1").mkdir(parents=True)
+        legacy = [
+            _history("a", "2026-09-01T00:00:00Z"),
+            _history("b", "2026-10-01T00:00:00Z"),
+            _history("c", None),
+        ]
+        (base / "s1" / "order_history.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+        ds = DataStore(base_path=str(base))
+        result = await ds.read_range("order_history", "s1", "2026-10-01", None)
+        assert [r["id"] for r in result] == ["b"]
+        remaining = json.loads((base / "s1" / "order_history.json").read_text(encoding="utf-8"))
+        assert [r["id"] for r in remaining] == ["c"]
+        assert (base / "s1" / "order_history" / "2026-09.json").exists()
+
+    async def test_transaction_on_partition(self, ds: DataStore):
+        record = _history("a", "2026-10-18T09:00:00Z")
+        name = ds.partition_for("order_history", record)
+        assert name == "order_history/2026-10"
+        async with ds.transaction("s1", [name]) as tx:
+            await tx.append(name, record)
+        assert await ds.read_range("order_history", "s1", "2026-10-18", None) == [record]
+
+    async def test_read_range_rejects_unpartitioned(self, ds: DataStore):
+        with pytest.raises(ValueError):
+            await ds.read_range("orders", "s1")
+
+
+async def test_sqlite_read_range(tmp_path):
+    ds = SqliteDataStore(db_path=str(tmp_path / "test.sqlite3"))
+    try:
+        await ds.write("order_history", "s1", [
+            _history("a", "2026-09-01T00:00:00Z"),
+            _history("b", "2026-10-01T00:00:00Z"),
+            _history("c", None),
+        ])
+        result = await ds.read_range("order_history", "s1", "2026-10-01", None)
+        assert [r["id"] for r in result] == ["b"]
+        assert len(await ds.read_range("order_history", "s1")) == 3
+    finally:
+        await ds.close()
@@ -0,0 +1,37 @@
+"""Query helper (filter/sort/page) tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.data import query
+
+RECORDS = [
+    {"id": "a", "n": 3, "g": "x"},
+    {"id": "b", "n": None, "g": "y"},
+    {"id": "c", "n": 1, "g": "x"},
+    {"id": "d", "n": 3, "g": "y"},
+]
+
+
+def _ids(records: list[dict]) -> list[str]:
+    return [r["id"] for r in records]
+
+
+@pytest.mark.parametrize("limit", [None, 2, 10])
+def test_top_k_matches_full_sort(limit):
+    full = query.page(RECORDS, "-n")
+    assert _ids(query.page(RECORDS, "-n", limit=limit)) == _ids(full[:limit])
+    assert _ids(full) == ["a", "d", "c", "b"]  # 안정 정렬, None은 마지막
+
+
+def test_mixed_directions_and_offset():
+    assert _ids(query.page(RECORDS, ["g", "-n"])) == ["a", "c", "d", "b"]
+    assert _ids(query.page(RECORDS, "n", limit=2, offset=1)) == ["a", "d"]
+
+
+def test_matches_and_invalid_page():
+    assert query.matches({"g": "x", "n": 1}, {"g": "x"})
+    assert not query.matches({"g": "x"}, {"g": "x", "n": 1})
+    with pytest.raises(ValueError):
+        query.page(RECORDS, limit=-1)
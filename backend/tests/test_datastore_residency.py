@@ -0,0 +1,89 @@
+"""DataStore per-store residency and eviction tests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from backend.data.datastore import DataStore
+from backend.data.residency import StoreResidency
+
+
+class TestStoreResidency:
+    def test_lru_eviction_by_count(self):
+        evicted: list[str] = []
+        residency = StoreResidency(max_stores=2, on_evict=evicted.append)
+        residency.touch("a")
+        residency.touch("b")
+        residency.touch("a")
+        residency.touch("c")
+        assert evicted == ["b"]
+        assert "a" in residency and "c" in residency
+        assert residency.stats() == {"resident_stores": 2, "evictions": 1}
+
+    def test_idle_eviction_skips_busy(self):
+        residency = StoreResidency(idle_seconds=10)
+        residency.touch("a")
+        busy = residency.touch("b")
+        busy.pins += 1
+        assert residency.evict_idle(now=time.monotonic() + 11) == ["a"]
+        busy.pins -= 1
+        assert residency.evict_idle(now=time.monotonic() + 11) == ["b"]
+        assert len(residency) == 0
+
+    def test_memory_budget(self):
+        sizes = {"a": 60, "b": 60}
+        evicted: list[str] = []
+        residency = StoreResidency(
+            memory_budget=100, size_of=lambda s: sizes.get(s, 0), on_evict=evicted.append,
+        )
+        residency.touch("a")
+        residency.touch("b")
+        assert evicted == ["a"]
+        assert "b" in residency
+        sizes["b"] = 200  # 단독 초과 + 자기 자신은 제외되지 않음
+        assert residency.enforce() == ["b"]
+
+
+class TestDataStoreResidency:
+    async def test_evicted_store_reloads_from_disk(self, tmp_path):
+        ds = DataStore(base_path=str(tmp_path / "data"), cache_enabled=True, max_resident_stores=1)
+        await ds.write("menus", "s1", [{"id": "1"}])
+        assert await ds.find_by_id("menus", "s1", "1") == {"id": "1"}
+        await ds.write("menus", "s2", [{"id": "2"}])
+        stats = ds.residency_stats()
+        assert stats["resident_stores"] == 1
+        assert stats["evictions"] == 1
+        assert stats["cached_entities"] == 1  # s1 캐시도 함께 제거
+        assert await ds.find_by_id("menus", "s1", "1") == {"id": "1"}
+
+    async def test_concurrent_writes_survive_eviction_pressure(self, tmp_path):
+        ds = DataStore(base_path=str(tmp_path / "data"), cache_enabled=True, max_resident_stores=1)
+        await asyncio.gather(*(
+            ds.append("orders", f"s{i % 3}", {"id": str(i)}) for i in range(30)
+        ))
+        counts = [len(await ds.read("orders", f"s{i}")) for i in range(3)]
+        assert counts == [10, 10, 10]
+
+    async def test_idle_sweep(self, tmp_path):
+        ds = DataStore(
+            base_path=str(tmp_path / "data"), cache_enabled=True, store_idle_seconds=0.02,
+        )
+        await ds.start()
+        try:
+            await ds.write("menus", "s1", [{"id": "1"}])
+            await asyncio.sleep(0.1)
+            assert ds.residency_stats()["resident_stores"] == 0
+            assert await ds.read("menus", "s1") == [{"id": "1"}]
+        finally:
+            await ds.close()
+
+    async def test_pending_journal_survives_eviction(self, tmp_path):
+        ds = DataStore(
+            base_path=str(tmp_path / "data"), cache_enabled=True,
+            journal_entities=["orders"], max_resident_stores=1,
+        )
+        await ds.append("orders", "s1", {"id": "1"})
+        await ds.append("orders", "s2", {"id": "2"})
+        assert await ds.checkpoint() == 2
+        assert await ds.read("orders", "s1") == [{"id": "1"}]
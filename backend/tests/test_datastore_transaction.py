@@ -0,0 +1,105 @@
+"""DataStore multi-entity transaction tests."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from backend.data.datastore import DataStore
+from backend.exceptions import NotFoundError
+
+
+@pytest.fixture(params=[False, True], ids=["nocache", "cache"])
+def tx_ds(tmp_path, request) -> DataStore:
+    return DataStore(
+        base_path=str(tmp_path / "data"),
+        cache_enabled=request.param,
+        journal_entities=["orders"],
+    )
+
+
+class TestTransaction:
+    async def test_commits_all_entities(self, tx_ds: DataStore):
+        await tx_ds.write("orders", "s1", [{"id": "o1"}, {"id": "o2"}])
+        await tx_ds.write("sessions", "s1", [{"id": "x", "status": "active"}])
+
+        async with tx_ds.transaction("s1", ["orders", "sessions", "order_history"]) as tx:
+            await tx.append("order_history", {"id": "h1"})
+            await tx.delete("orders", "o1")
+            updated = await tx.update("sessions", "x", {"status": "ended"})
+            assert updated["status"] == "ended"
+            assert [r["id"] for r in await tx.read("orders")] == ["o2"]
+
+        assert await tx_ds.read("order_history", "s1") == [{"id": "h1"}]
+        assert await tx_ds.read("orders", "s1") == [{"id": "o2"}]
+        assert (await tx_ds.find_by_id("sessions", "s1", "x"))["status"] == "ended"
+
+    async def test_exception_discards_changes(self, tx_ds: DataStore):
+        await tx_ds.write("orders", "s1", [{"id": "o1"}])
+        await tx_ds.write("sessions", "s1", [{"id": "x", "status": "active"}])
+
+        with pytest.raises(NotFoundError):
+            async with tx_ds.transaction("s1", ["orders", "sessions"]) as tx:
+                await tx.delete("orders", "o1")
+                await tx.update("sessions", "missing", {"status": "ended"})
+
+        assert await tx_ds.read("orders", "s1") == [{"id": "o1"}]
+        assert await tx_ds.read("sessions", "s1") == [{"id": "x", "status": "active"}]
+
+    async def test_undeclared_entity_rejected(self, tx_ds: DataStore):
+        with pytest.raises(ValueError):
+            async with tx_ds.transaction("s1", ["orders"]) as tx:
+                await tx.read("sessions")
+
+    async def test_journaled_entity_appends_entries(self, tx_ds: DataStore):
+        await tx_ds.write("orders", "s1", [{"id": "o1"}])
+        async with tx_ds.transaction("s1", ["orders"]) as tx:
+            await tx.append("orders", {"id": "o2"})
+        lines = tx_ds._get_journal_path("orders", "s1").read_text(
+            encoding="utf-8").splitlines()
+        assert [json.loads(line)["op"] for line in lines] == ["append"]
+        assert [r["id"] for r in await tx_ds.read("orders", "s1")] == ["o1", "o2"]
+
+    async def test_no_marker_left_behind(self, tx_ds: DataStore):
+        async with tx_ds.transaction("s1", ["orders", "sessions"]) as tx:
+            await tx.append("sessions", {"id": "x"})
+        base = tx_ds._base_path
+        assert not list(base.glob(".commit-*"))
+        assert not list(base.glob("**/*.txn-*.tmp"))
+
+
+class TestRecovery:
+    async def test_rolls_forward_committed_marker(self, tmp_path):
+        base = tmp_path / "data"
+        ds = DataStore(base_path=str(base), journal_entities=["orders"])
+        await ds.write("orders", "s1", [{"id": "o1"}])
+        await ds.write("sessions", "s1", [{"id": "x", "status": "active"}])
+
+        # 마커 기록 직후 크래시한 상태를 재현
+        tmp = base / "s1" / "sessions.json.txn-abc.tmp"
+        tmp.write_text(json.dumps([{"id": "x", "status": "ended"}]), encoding="utf-8")
+        marker = {
+            "snapshots": [{"tmp": "s1/sessions.json.txn-abc.tmp",
+                           "path": "s1/sessions.json", "journal": None}],
+            "journals": [{"path": "s1/orders.journal.jsonl",
+                          "entries": [{"op": "delete", "id": "o1"}]}],
+        }
+        (base / ".commit-abc.json").write_text(json.dumps(marker), encoding="utf-8")
+
+        recovered = DataStore(base_path=str(base), journal_entities=["orders"])
+        assert await recovered.read("sessions", "s1") == [{"id": "x", "status": "ended"}]
+        assert await recovered.read("orders", "s1") == []
+        assert not (base / ".commit-abc.json").exists()
+        assert not tmp.exists()
+
+    async def test_discards_uncommitted_tmp(self, tmp_path):
+        base = tmp_path / "data"
+        ds = DataStore(base_path=str(base))
+        await ds.write("sessions", "s1", [{"id": "x", "status": "active"}])
+        tmp = base / "s1" / "sessions.json.txn-abc.tmp"
+        tmp.write_text("[]", encoding="utf-8")
+
+        recovered = DataStore(base_path=str(base))
+        assert await recovered.read("sessions", "s1") == [{"id": "x", "status": "active"}]
+        assert not tmp.exists()
@@ -0,0 +1,64 @@
+"""Startup cache warm-up tests."""
+
+from __future__ import annotations
+
+import asyncio
+
+from backend.data.datastore import DataStore
+from backend.data.warmup import CacheWarmer
+
+
+async def _stores(tmp_path, count: int) -> DataStore:
+    ds = DataStore(base_path=str(tmp_path / "data"), cache_enabled=True)
+    await ds.write("stores", "", [{"id": f"s{i}"} for i in range(count)])
+    for i in range(count):
+        await ds.write("menus", f"s{i}", [{"id": "m1"}])
+    return ds
+
+
+class _TrackingStore:
+    """동시 read 수를 기록하는 DataStore 래퍼."""
+
+    def __init__(self, inner: DataStore) -> None:
+        self._inner = inner
+        self.active = 0
+        self.peak = 0
+        self.reads: list[tuple[str, str]] = []
+
+    async def read(self, entity: str, store_id: str) -> list[dict]:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.005)
+            self.reads.append((entity, store_id))
+            return await self._inner.read(entity, store_id)
+        finally:
+            self.active -= 1
+
+
+class TestCacheWarmer:
+    async def test_warms_all_stores_with_bounded_parallelism(self, tmp_path):
+        ds = _TrackingStore(await _stores(tmp_path, 5))
+        durations = await CacheWarmer(ds, entities=["menus", "tables"], concurrency=2).run()
+        assert set(durations) == {f"s{i}" for i in range(5)}
+        assert ds.peak == 2
+        assert ("tables", "s4") in ds.reads
+
+    async def test_configured_stores_only(self, tmp_path):
+        await _stores(tmp_path, 3)
+        ds = DataStore(base_path=str(tmp_path / "data"), cache_enabled=True)
+        durations = await CacheWarmer(ds, stores=["s1"]).run()
+        assert list(durations) == ["s1"]
+        assert ds.residency_stats()["resident_stores"] == 1
+
+    async def test_failed_store_does_not_abort(self, tmp_path):
+        ds = await _stores(tmp_path, 2)
+
+        class Flaky(_TrackingStore):
+            async def read(self, entity: str, store_id: str) -> list[dict]:
+                if store_id == "s0":
+                    raise OSError("disk")
+                return await super().read(entity, store_id)
+
+        durations = await CacheWarmer(Flaky(ds), entities=["menus"]).run()
+        assert list(durations) == ["s1"]
@@ -0,0 +1,145 @@
+"""IdempotencyStore tests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from backend.exceptions import ConcurrencyError, ValidationError
+from backend.services.idempotency import IdempotencyStore
+
+
+class Counter:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"id": f"order-{self.calls}"}
+
+
+class TestIdempotencyStore:
+    async def test_replay_returns_original(self):
+        store = IdempotencyStore()
+        fn = Counter()
+        first, replayed = await store.run("k1", "fp", fn)
+        assert (first, replayed) == ({"id": "order-1"}, False)
+        again, replayed = await store.run("k1", "fp", fn)
+        assert (again, replayed) == ({"id": "order-1"}, True)
+        assert fn.calls == 1
+        assert store.stats() == {"keys": 1, "hits": 1, "misses": 1}
+
+    async def test_concurrent_duplicates_run_once(self):
+        store = IdempotencyStore()
+        fn = Counter(delay=0.01)
+        results = await asyncio.gather(*(store.run("k1", "fp", fn) for _ in range(5)))
+        assert fn.calls == 1
+        assert {r["id"] for r, _ in results} == {"order-1"}
+        assert [replayed for _, replayed in results].count(False) == 1
+
+    async def test_scopes_are_independent(self):
+        store = IdempotencyStore()
+        fn = Counter()
+        await store.run("k1", "fp", fn, scope="s1:1")
+        await store.run("k1", "other", fn, scope="s1:2")
+        assert fn.calls == 2
+
+    async def test_different_request_same_key_rejected(self):
+        store = IdempotencyStore()
+        await store.run("k1", "fp", Counter())
+        with pytest.raises(ValidationError):
+            await store.run("k1", "changed", Counter())
+
+    async def test_failure_is_not_stored(self):
+        store = IdempotencyStore()
+
+        async def boom() -> dict:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await store.run("k1", "fp", boom)
+        result, replayed = await store.run("k1", "fp", Counter())
+        assert (result, replayed) == ({"id": "order-1"}, False)
+
+    async def test_ttl_and_max_entries(self, monkeypatch):
+        store = IdempotencyStore(ttl_seconds=10, max_entries=2)
+        fn = Counter()
+        for key in ("a", "b", "c"):
+            await store.run(key, "fp", fn)
+        assert len(store) == 2
+        _, replayed = await store.run("a", "fp", fn)
+        assert not replayed  # 가장 오래된 키는 한도 초과로 축출됨
+
+        now = time.monotonic()
+        monkeypatch.setattr("backend.services.idempotency.time.monotonic", lambda: now + 11)
+        _, replayed = await store.run("b", "fp", fn)
+        assert not replayed
+        assert len(store) == 1
+
+    async def test_purge_stops_at_first_live_entry(self, monkeypatch):
+        store = IdempotencyStore(ttl_seconds=10)
+        now = time.monotonic()
+        clock = [now]
+        monkeypatch.setattr("backend.services.idempotency.time.monotonic", lambda: clock[0])
+        fn = Counter()
+        await store.run("a", "fp", fn)
+        clock[0] = now + 5
+        await store.run("b", "fp", fn)
+        await store.run("a", "fp", fn)  # 재사용해도 만료 순서는 그대로
+        clock[0] = now + 11
+        await store.run("c", "fp", fn)
+        assert len(store) == 2
+        _, replayed = await store.run("b", "fp", fn)
+        assert replayed
+
+    async def test_invalid_key(self):
+        with pytest.raises(ValidationError):
+            await IdempotencyStore().run("x" * 256, "fp", Counter())
+
+
+class TestPersistedIdempotency:
+    async def test_replay_across_workers(self, datastore):
+        first_worker = IdempotencyStore(datastore=datastore)
+        second_worker = IdempotencyStore(datastore=datastore)
+        fn = Counter()
+        first, replayed = await first_worker.run("k1", "fp", fn, store_id="s1", scope="s1:1")
+        assert not replayed
+        again, replayed = await second_worker.run("k1", "fp", fn, store_id="s1", scope="s1:1")
+        assert (again, replayed) == (first, True)
+        assert fn.calls == 1
+        with pytest.raises(ValidationError):
+            await second_worker.run("k1", "changed", fn, store_id="s1", scope="s1:1")
+
+    async def test_in_flight_on_other_worker_conflicts(self, datastore):
+        first_worker = IdempotencyStore(datastore=datastore)
+        second_worker = IdempotencyStore(datastore=datastore)
+        slow = asyncio.create_task(
+            first_worker.run("k1", "fp", Counter(delay=0.05), store_id="s1"),
+        )
+        await asyncio.sleep(0.01)
+        with pytest.raises(ConcurrencyError):
+            await second_worker.run("k1", "fp", Counter(), store_id="s1")
+        await slow
+
+    async def test_failure_releases_key(self, datastore):
+        async def boom() -> dict:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await IdempotencyStore(datastore=datastore).run("k1", "fp", boom, store_id="s1")
+        assert await datastore.read("idempotency_keys", "s1") == []
+        _, replayed = await IdempotencyStore(datastore=datastore).run(
+            "k1", "fp", Counter(), store_id="s1",
+        )
+        assert not replayed
+
+    async def test_purge_expired(self, datastore):
+        store = IdempotencyStore(datastore=datastore, ttl_seconds=0)
+        await store.run("old", "fp", Counter(), store_id="s1")
+        await IdempotencyStore(datastore=datastore).run("live", "fp", Counter(), store_id="s1")
+        assert await store.purge_expired("s1") == 1
+        assert [r["id"] for r in await datastore.read("idempotency_keys", "s1")] == [":live"]
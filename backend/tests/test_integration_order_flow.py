@@ -169,6 +169,25 @@ async def test_order_number_sequential(env):
     assert o2["order_number"].endswith("-00002")
 
 
+@pytest.mark.asyncio
+async def test_order_number_survives_session_end(env):
+    """세션 종료로 주문이 이력으로 옮겨져도 순번이 다시 시작되지 않는다."""
+    order_svc = env["order"]
+    table_svc = env["table"]
+
+    await table_svc.create_table("store001", 1, "pw1234")
+    session = await table_svc.start_session("store001", 1)
+    menu_id = (await env["menu"].get_menus("store001"))[0]["id"]
+
+    o1 = await order_svc.create_order("store001", 1, session["id"], [{"menu_id": menu_id, "quantity": 1}])
+    await table_svc.end_session("store001", 1)
+    session = await table_svc.start_session("store001", 1)
+    o2 = await order_svc.create_order("store001", 1, session["id"], [{"menu_id": menu_id, "quantity": 1}])
+
+    assert o1["order_number"] != o2["order_number"]
+    assert o2["order_number"].endswith("-00002")
+
+
 @pytest.mark.asyncio
 async def test_delete_order_publishes_event(env):
     """주문 삭제 시 order_deleted 이벤트가 발행된다."""
@@ -62,6 +62,13 @@ async def test_get_menus_by_category(seeded_menu_svc):
     assert menus[0]["name"] == "콜라"
 
 
+@pytest.mark.asyncio
+async def test_get_menus_by_ids(seeded_menu_svc):
+    menus = await seeded_menu_svc.get_menus_by_ids("store001", ["menu-002", "missing", "menu-002"])
+    assert list(menus) == ["menu-002"]
+    assert menus["menu-002"]["name"] == "콜라"
+
+
 @pytest.mark.asyncio
 async def test_get_menu(seeded_menu_svc):
     menu = await seeded_menu_svc.get_menu("store001", "menu-001")
@@ -1,5 +1,7 @@
 """OrderService unit tests."""
 
+import asyncio
+
 import pytest
 
 from backend.data.datastore import DataStore
@@ -119,6 +121,130 @@ async def test_update_order_status_invalid_transition(seeded_services):
         await order_svc.update_order_status("store001", order["id"], "pending")
 
 
+@pytest.mark.asyncio
+async def test_update_order_status_race(seeded_services):
+    """동시에 같은 전이를 요청하면 하나만 성공."""
+    order_svc = seeded_services["order"]
+    order = await order_svc.create_order("store001", 1, "s1", [
+        {"menu_id": "menu-001", "quantity": 1},
+    ])
+    results = await asyncio.gather(
+        order_svc.update_order_status("store001", order["id"], "completed"),
+        order_svc.update_order_status("store001", order["id"], "completed"),
+        return_exceptions=True,
+    )
+    assert sum(isinstance(r, ValidationError) for r in results) == 1
+
+
+@pytest.mark.asyncio
+async def test_update_order_status_not_found(seeded_services):
+    with pytest.raises(NotFoundError):
+        await seeded_services["order"].update_order_status("store001", "missing", "preparing")
+
+
+@pytest.mark.asyncio
+async def test_table_summaries_follow_changes(seeded_services):
+    ds = seeded_services["ds"]
+    order_svc = seeded_services["order"]
+    first = await order_svc.create_order("store001", 1, "s1", [{"menu_id": "menu-001", "quantity": 1}])
+    # 첫 조회 시 저장된 주문으로 구성, 이후에는 변경분만 반영
+    assert await order_svc.get_table_summaries("store001") == [{
+        "table_number": 1, "order_count": 1, "status_counts": {"pending": 1},
+        "total_amount": 9000, "last_order_at": first["created_at"],
+    }]
+
+    read_calls = 0
+    original = ds.read
+
+    async def counting_read(*args, **kwargs):
+        nonlocal read_calls
+        read_calls += 1
+        return await original(*args, **kwargs)
+
+    ds.read = counting_read
+    second = await order_svc.create_order("store001", 1, "s1", [{"menu_id": "menu-002", "quantity": 2}])
+    await order_svc.get_table_summaries("store001")
+    third = await order_svc.create_order("store001", 2, "s2", [{"menu_id": "menu-001", "quantity": 2}])
+    await order_svc.get_table_summaries("store001")
+    await order_svc.update_order_status("store001", first["id"], "preparing")
+    await order_svc.get_table_summaries("store001")
+    await order_svc.update_orders_status("store001", [third["id"]], "completed")
+    await order_svc.delete_order("store001", second["id"])
+
+    summaries = await order_svc.get_table_summaries("store001")
+    assert read_calls == 0
+    assert [(s["table_number"], s["order_count"], s["status_counts"], s["total_amount"]) for s in summaries] == [
+        (1, 1, {"preparing": 1}, 9000),
+        (2, 1, {"completed": 1}, 18000),
+    ]
+    assert summaries[0]["last_order_at"] == first["created_at"]
+
+
+@pytest.mark.asyncio
+async def test_table_summaries_see_other_process_writes(seeded_services, tmp_path):
+    order_svc = seeded_services["order"]
+    await order_svc.create_order("store001", 1, "s1", [{"menu_id": "menu-001", "quantity": 1}])
+    assert len(await order_svc.get_table_summaries("store001")) == 1
+
+    # 같은 파일을 쓰는 다른 워커 프로세스의 DataStore
+    other = DataStore(base_path=str(tmp_path / "data"))
+    await other.append("orders", "store001", {
+        "id": "o-other", "store_id": "store001", "table_number": 5, "session_id": "s5",
+        "status": "pending", "total_amount": 4000, "created_at": "2026-02-09T00:00:00Z",
+    })
+    summaries = await order_svc.get_table_summaries("store001")
+    assert [(s["table_number"], s["total_amount"]) for s in summaries] == [(1, 9000), (5, 4000)]
+
+    # 다른 워커의 쓰기 뒤에 온 이 프로세스의 변경은 재구성 후 반영
+    await other.append("orders", "store001", {
+        "id": "o-other-2", "store_id": "store001", "table_number": 6, "session_id": "s6",
+        "status": "pending", "total_amount": 1000, "created_at": "2026-02-09T00:00:01Z",
+    })
+    await order_svc.create_order("store001", 1, "s1", [{"menu_id": "menu-002", "quantity": 1}])
+    summaries = await order_svc.get_table_summaries("store001")
+    assert [(s["table_number"], s["total_amount"]) for s in summaries] == [
+        (1, 11000), (5, 4000), (6, 1000),
+    ]
+    await other.close()
+
+
+@pytest.mark.asyncio
+async def test_update_orders_status_bulk(seeded_services):
+    order_svc = seeded_services["order"]
+    queue = seeded_services["eb"]
+    orders = [
+        await order_svc.create_order("store001", 1, "s1", [{"menu_id": "menu-001", "quantity": 1}])
+        for _ in range(3)
+    ]
+    await order_svc.update_order_status("store001", orders[2]["id"], "completed")
+
+    events = []
+    original = queue.publish
+
+    async def capture(event: dict) -> None:
+        events.append(event)
+        await original(event)
+
+    queue.publish = capture
+    ids = [orders[0]["id"], "missing", orders[1]["id"], orders[2]["id"]]
+    results = await order_svc.update_orders_status("store001", ids, "completed")
+
+    assert [r["order_id"] for r in results] == ids
+    assert [r["ok"] for r in results] == [True, False, True, False]
+    assert "not found" in results[1]["error"]
+    assert "Cannot transition" in results[3]["error"]
+    assert len(events) == 1
+    assert events[0]["type"] == "orders_status_changed"
+    assert [c["order_id"] for c in events[0]["orders"]] == [orders[0]["id"], orders[1]["id"]]
+    assert events[0]["orders"][0]["old_status"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_update_orders_status_invalid_status(seeded_services):
+    with pytest.raises(ValidationError):
+        await seeded_services["order"].update_orders_status("store001", ["x"], "eaten")
+
+
 @pytest.mark.asyncio
 async def test_delete_order(seeded_services):
     order_svc = seeded_services["order"]
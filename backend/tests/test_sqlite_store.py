@@ -0,0 +1,309 @@
+"""SqliteDataStore tests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from backend.data.datastore import DataStore
+from backend.data.migrate_sqlite import migrate
+from backend.data.sqlite_store import SqliteDataStore
+from backend.exceptions import ConcurrencyError, NotFoundError, PreconditionFailedError
+from backend.services.event_bus import EventBus
+from backend.services.menu_service import MenuService
+from backend.services.order_service import OrderService
+
+
+@pytest.fixture
+async def sqlite_ds(tmp_path):
+    ds = SqliteDataStore(db_path=str(tmp_path / "data" / "test.sqlite3"))
+    yield ds
+    await ds.close()
+
+
+class TestCrud:
+    async def test_read_empty(self, sqlite_ds: SqliteDataStore):
+        assert await sqlite_ds.read("menus", "s1") == []
+
+    async def test_write_and_read_preserve_order(self, sqlite_ds: SqliteDataStore):
+        records = [{"id": "b", "name": "B"}, {"id": "a", "name": "A"}]
+        await sqlite_ds.write("menus", "s1", records)
+        assert await sqlite_ds.read("menus", "s1") == records
+
+    async def test_write_overwrites(self, sqlite_ds: SqliteDataStore):
+        await sqlite_ds.write("menus", "s1", [{"id": "1"}])
+        await sqlite_ds.write("menus", "s1", [{"id": "2"}])
+        assert await sqlite_ds.read("menus", "s1") == [{"id": "2"}]
+
+    async def test_stores_are_isolated(self, sqlite_ds: SqliteDataStore):
+        await sqlite_ds.append("menus", "s1", {"id": "1"})
+        await sqlite_ds.append("menus", "s2", {"id": "2"})
+        assert await sqlite_ds.read("menus", "s1") == [{"id": "1"}]
+
+    async def test_update_keeps_position(self, sqlite_ds: SqliteDataStore):
+        await sqlite_ds.write("orders", "s1", [
+            {"id": "1", "status": "pending"}, {"id": "2", "status": "pending"},
+        ])
+        updated = await sqlite_ds.update("orders", "s1", "1", {"status": "completed"})
+        assert updated["status"] == "completed"
+        assert "updated_at" in updated
+        result = await sqlite_ds.read("orders", "s1")
+        assert [r["id"] for r in result] == ["1", "2"]
+        assert result[0]["status"] == "completed"
+
+    async def test_update_missing_raises(self, sqlite_ds: SqliteDataStore):
+        with pytest.raises(NotFoundError):
+            await sqlite_ds.update("orders", "s1", "missing", {})
+
+    async def test_delete(self, sqlite_ds: SqliteDataStore):
+        await sqlite_ds.write("orders", "s1", [{"id": "1"}, {"id": "2"}])
+        await sqlite_ds.delete("orders", "s1", "1")
+        assert await sqlite_ds.read("orders", "s1") == [{"id": "2"}]
+        with pytest.raises(NotFoundError):
+            await sqlite_ds.delete("orders", "s1", "1")
+
+    async def test_find_by_indexed_and_unindexed(self, sqlite_ds: SqliteDataStore):
+        await sqlite_ds.write("sessions", "s1", [
+            {"id": "x", "table_number": 1, "status": "ended", "note": "a"},
+            {"id": "y", "table_number": 1, "status": "active", "note": "b"},
+        ])
+        active = await sqlite_ds.find_by(
+            "sessions", "s1", ("table_number", "status"), (1, "active"),
+        )
+        assert [r["id"] for r in active] == ["y"]
+        assert (await sqlite_ds.find_by_id("sessions", "s1", "x"))["note"] == "a"
+        assert [r["id"] for r in await sqlite_ds.find_by("sessions", "s1", "note", "b")] == ["y"]
+
+
+async def test_order_service_on_sqlite(sqlite_ds: SqliteDataStore):
+    await sqlite_ds.append("menus", "store001", {
+        "id": "m1", "store_id": "store001", "name": "김치찌개",
+        "price": 9000, "category": "메인", "is_available": True,
+    })
+    order_svc = OrderService(
+        datastore=sqlite_ds, event_bus=EventBus(), menu_service=MenuService(datastore=sqlite_ds),
+    )
+    order = await order_svc.create_order("store001", 1, "s1", [{"menu_id": "m1", "quantity": 2}])
+    assert order["total_amount"] == 18000
+    orders = await order_svc.get_orders_by_session("store001", "s1")
+    assert [o["id"] for o in orders] == [order["id"]]
+
+
+async def test_migrate_json_directory(tmp_path):
+    data_dir = tmp_path / "data"
+    source = DataStore(base_path=str(data_dir), journal_entities=["orders"])
+    await source.write("stores", "", [{"id": "store001"}])
+    await source.write("menus", "store001", [{"id": "m1"}, {"id": "m2"}])
+    await source.append("orders", "store001", {"id": "o1", "status": "pending"})
+    await source.update("orders", "store001", "o1", {"status": "completed"})
+
+    await source.append("order_history", "store001", {"id": "h1", "session_ended_at": "2026-10-01T00:00:00Z"})
+    await source.close()
+    # 파티션 전 기존 형식의 이력 파일 (원본은 그대로 두어야 함)
+    legacy = data_dir / "store001" / "order_history.json"
+    legacy.write_text(json.dumps([{"id": "h0", "session_ended_at": "2026-09-01T00:00:00Z"}]))
+    before = sorted(str(p) for p in data_dir.rglob("*"))
+
+    db_path = str(tmp_path / "migrated.sqlite3")
+    counts = await migrate(str(data_dir), db_path)
+    assert counts[("menus", "store001")] == 2
+    assert counts[("order_history", "store001")] == 2
+    assert sorted(str(p) for p in data_dir.rglob("*")) == before
+
+    target = SqliteDataStore(db_path=db_path)
+    try:
+        assert await target.read("stores", "") == [{"id": "store001"}]
+        orders = await target.read("orders", "store001")
+        assert orders[0]["status"] == "completed"
+    finally:
+        await target.close()
+
+
+async def test_transaction_commits_atomically(sqlite_ds: SqliteDataStore):
+    await sqlite_ds.write("orders", "s1", [{"id": "o1"}, {"id": "o2"}])
+    await sqlite_ds.write("sessions", "s1", [{"id": "x", "status": "active"}])
+
+    with pytest.raises(NotFoundError):
+        async with sqlite_ds.transaction("s1", ["orders", "sessions"]) as tx:
+            await tx.delete("orders", "o1")
+            await tx.update("sessions", "missing", {})
+    assert len(await sqlite_ds.read("orders", "s1")) == 2
+
+    async with sqlite_ds.transaction("s1", ["orders", "sessions"]) as tx:
+        await tx.delete("orders", "o1")
+        await tx.update("sessions", "x", {"status": "ended"})
+    assert await sqlite_ds.read("orders", "s1") == [{"id": "o2"}]
+    assert (await sqlite_ds.find_by_id("sessions", "s1", "x"))["status"] == "ended"
+
+
+async def test_bulk_operations(sqlite_ds: SqliteDataStore):
+    await sqlite_ds.write("orders", "s1", [
+        {"id": "1", "status": "pending"}, {"id": "2", "status": "pending"}, {"id": "3"},
+    ])
+    assert await sqlite_ds.delete_many("orders", "s1", ["3", "x"]) == {"3": True, "x": False}
+    updated = await sqlite_ds.update_many("orders", "s1", {"1": {"status": "completed"}})
+    assert updated["1"]["status"] == "completed"
+    assert await sqlite_ds.delete_where(
+        "orders", "s1", lambda r: r["status"] == "completed",
+    ) == ["1"]
+    changed = await sqlite_ds.update_where("orders", "s1", lambda r: True, {"status": "done"})
+    assert [r["id"] for r in changed] == ["2"]
+    assert await sqlite_ds.read("orders", "s1") == [changed[0]]
+
+
+async def test_query_pushdown(sqlite_ds: SqliteDataStore):
+    await sqlite_ds.write("menus", "s1", [
+        {"id": "1", "category": "A", "sort_order": 2},
+        {"id": "2", "category": "B", "sort_order": 1},
+        {"id": "3", "category": "A"},
+        {"id": "4", "category": "A", "sort_order": 1},
+    ])
+    result = await sqlite_ds.query("menus", "s1", where={"category": "A"}, order_by="sort_order")
+    assert [r["id"] for r in result] == ["4", "1", "3"]
+    page = await sqlite_ds.query("menus", "s1", order_by="-sort_order", limit=2, offset=1)
+    assert [r["id"] for r in page] == ["2", "4"]
+
+    await sqlite_ds.append("order_history", "s1", {"id": "h1", "table_number": 1,
+                                                   "session_ended_at": "2026-09-30T10:00:00Z"})
+    await sqlite_ds.append("order_history", "s1", {"id": "h2", "table_number": 1,
+                                                   "session_ended_at": "2026-10-02T10:00:00Z"})
+    history = await sqlite_ds.query(
+        "order_history", "s1", where={"table_number": 1}, start="2026-10-01",
+    )
+    assert [h["id"] for h in history] == ["h2"]
+
+
+async def test_next_sequence(sqlite_ds: SqliteDataStore):
+    values = await asyncio.gather(*(sqlite_ds.next_sequence("s1", "n") for _ in range(10)))
+    assert sorted(values) == list(range(1, 11))
+
+    async def seed() -> int:
+        return 100
+
+    assert await sqlite_ds.next_sequence("s1", "other", seed=seed) == 101
+
+
+async def test_find_by_ids(sqlite_ds: SqliteDataStore):
+    await sqlite_ds.write("menus", "s1", [{"id": str(i)} for i in range(600)])
+    found = await sqlite_ds.find_by_ids("menus", "s1", [str(i) for i in range(0, 700, 2)])
+    assert len(found) == 300
+    assert found["598"] == {"id": "598"}
+
+
+async def test_update_if(sqlite_ds: SqliteDataStore):
+    await sqlite_ds.write("orders", "s1", [{"id": "1", "status": "pending"}])
+    before, after = await sqlite_ds.update_if("orders", "s1", "1", {"status": "pending"}, {"status": "done"})
+    assert (before["status"], after["status"]) == ("pending", "done")
+    with pytest.raises(PreconditionFailedError):
+        await sqlite_ds.update_if("orders", "s1", "1", {"status": "pending"}, {"status": "x"})
+    assert (await sqlite_ds.find_by_id("orders", "s1", "1"))["status"] == "done"
+
+
+async def test_update_many_if(sqlite_ds: SqliteDataStore):
+    await sqlite_ds.write("orders", "s1", [{"id": "1", "status": "pending"}, {"id": "2", "status": "done"}])
+    results = await sqlite_ds.update_many_if(
+        "orders", "s1", {"1": {"status": "done"}, "2": {"status": "done"}, "3": {}},
+        expected={"status": "pending"},
+    )
+    assert results["1"][1]["status"] == "done"
+    assert results["2"] == ({"id": "2", "status": "done"}, None)
+    assert results["3"] == (None, None)
+
+
+async def test_iter_and_compat_methods(sqlite_ds: SqliteDataStore):
+    records = [{"id": str(i), "session_ended_at": f"2026-10-{i % 28 + 1:02d}T00:00:00Z"} for i in range(600)]
+    await sqlite_ds.write("order_history", "s1", records)
+    assert [r async for r in sqlite_ds.iter("order_history", "s1")] == records
+    ranged = [r["id"] async for r in sqlite_ds.iter(
+        "order_history", "s1", start="2026-10-02", end="2026-10-02T23:59:59Z",
+    )]
+    assert ranged == [str(i) for i in range(600) if i % 28 == 1]
+    with pytest.raises(ValueError):
+        [r async for r in sqlite_ds.iter("menus", "s1", start="2026-10-01")]
+
+    assert await sqlite_ds.checkpoint() == 0
+    assert sqlite_ds.evict_idle_stores() == []
+    assert sqlite_ds.residency_stats()["resident_stores"] == 0
+
+
+async def test_transaction_blocks_other_connection(tmp_path):
+    """트랜잭션 본문이 끝날 때까지 다른 워커의 쓰기는 대기하다 시간 초과."""
+    db_path = str(tmp_path / "shared.sqlite3")
+    worker_a = SqliteDataStore(db_path=db_path)
+    worker_b = SqliteDataStore(db_path=db_path, lock_timeout=0.1)
+    try:
+        await worker_a.write("orders", "s1", [{"id": "o1", "session_id": "S"}])
+        async with worker_a.transaction("s1", ["orders"]) as tx:
+            orders = await tx.find_by("orders", "session_id", "S")
+            with pytest.raises(ConcurrencyError):
+                await worker_b.append("orders", "s1", {"id": "o2", "session_id": "S"})
+            for order in orders:
+                await tx.delete("orders", order["id"])
+        assert await worker_b.read("orders", "s1") == []
+    finally:
+        await worker_a.close()
+        await worker_b.close()
+
+
+async def test_concurrent_append_does_not_abort_transaction(sqlite_ds: SqliteDataStore):
+    """같은 프로세스의 무관한 쓰기는 트랜잭션 커밋 후 반영되고 충돌하지 않음."""
+    await sqlite_ds.write("orders", "s1", [
+        {"id": "o1", "session_id": "S"}, {"id": "o2", "session_id": "T"},
+    ])
+    appended = asyncio.Event()
+
+    async def other_table_orders() -> None:
+        await sqlite_ds.append("orders", "s1", {"id": "o3", "session_id": "T"})
+        appended.set()
+
+    async with sqlite_ds.transaction("s1", ["orders"]) as tx:
+        orders = await tx.find_by("orders", "session_id", "S")
+        task = asyncio.create_task(other_table_orders())
+        await asyncio.sleep(0.01)
+        assert not appended.is_set()
+        for order in orders:
+            await tx.delete("orders", order["id"])
+    await task
+    assert [o["id"] for o in await sqlite_ds.read("orders", "s1")] == ["o2", "o3"]
+
+
+async def test_signature_tracks_other_connections(tmp_path):
+    db_path = str(tmp_path / "shared.sqlite3")
+    worker_a = SqliteDataStore(db_path=db_path)
+    worker_b = SqliteDataStore(db_path=db_path)
+    try:
+        before = await worker_a.signature("orders", "s1")
+        assert await worker_a.signature("orders", "s1") == before
+        await worker_b.append("orders", "s1", {"id": "o1"})
+        after = await worker_a.signature("orders", "s1")
+        assert after != before
+        await worker_a.append("orders", "s1", {"id": "o2"})
+        assert await worker_a.signature("orders", "s1") != after
+    finally:
+        await worker_a.close()
+        await worker_b.close()
+
+
+async def test_written_signature_chains_own_writes(tmp_path):
+    db_path = str(tmp_path / "shared.sqlite3")
+    worker_a = SqliteDataStore(db_path=db_path)
+    worker_b = SqliteDataStore(db_path=db_path)
+    try:
+        await worker_a.append("orders", "s1", {"id": "o1"})
+        _, after = worker_a.written_signature("orders", "s1")
+        assert await worker_a.signature("orders", "s1") == after
+        # 이 커넥션의 다른 엔티티 쓰기는 orders 시그니처와 무관
+        await worker_a.append("menus", "s1", {"id": "m1"})
+        assert await worker_a.signature("orders", "s1") == after
+        await worker_a.append("orders", "s1", {"id": "o2"})
+        assert worker_a.written_signature("orders", "s1")[0] == after
+        # 다른 워커의 커밋이 끼면 다음 쓰기의 직전 시그니처가 달라짐
+        _, after = worker_a.written_signature("orders", "s1")
+        await worker_b.append("orders", "s1", {"id": "o3"})
+        await worker_a.append("orders", "s1", {"id": "o4"})
+        assert worker_a.written_signature("orders", "s1")[0] != after
+    finally:
+        await worker_a.close()
+        await worker_b.close()
@@ -1,12 +1,16 @@
 """TableService unit tests."""
 
+import asyncio
+
 import pytest
 
 from backend.data.datastore import DataStore
 from backend.exceptions import DuplicateError, NotFoundError, ValidationError
 from backend.services.event_bus import EventBus
+from backend.services.idempotency import IdempotencyStore
 from backend.services.menu_service import MenuService
 from backend.services.order_service import OrderService
+from backend.services.session_compactor import SessionCompactor
 from backend.services.table_service import TableService
 
 
@@ -88,8 +92,12 @@ async def test_end_session(services):
         {"menu_id": "m1", "quantity": 2},
     ])
 
+    summaries = await services["order"].get_table_summaries("store001")
+    assert [(s["table_number"], s["total_amount"]) for s in summaries] == [(1, 18000)]
+
     # 세션 종료
     await services["table"].end_session("store001", 1)
+    assert await services["order"].get_table_summaries("store001") == []
 
     # 주문이 이력으로 이동했는지 확인
     orders = await services["order"].get_orders_by_session("store001", session["id"])
@@ -100,6 +108,53 @@ async def test_end_session(services):
     assert history[0]["total_session_amount"] == 18000
 
 
+@pytest.mark.asyncio
+async def test_get_dashboard(services):
+    ds = services["ds"]
+    table_svc = services["table"]
+    for n in (1, 2, 3):
+        await table_svc.create_table("store001", n, "1234")
+    session = await table_svc.start_session("store001", 1)
+    await ds.append("menus", "store001", {
+        "id": "m1", "store_id": "store001", "name": "김치찌개",
+        "price": 9000, "category": "메인", "is_available": True,
+    })
+    await services["order"].create_order("store001", 1, session["id"], [
+        {"menu_id": "m1", "quantity": 2},
+    ])
+
+    snapshot = await table_svc.get_dashboard("store001")
+    assert snapshot["full"] is True
+    assert [t["table_number"] for t in snapshot["tables"]] == [1, 2, 3]
+    first = snapshot["tables"][0]
+    assert first["current_session"]["session_id"] == session["id"]
+    assert len(first["orders"]) == 1
+    assert first["total_amount"] == 18000
+
+    unchanged = await table_svc.get_dashboard("store001", since=snapshot["version"])
+    assert unchanged == {"version": snapshot["version"], "full": False, "tables": []}
+
+    await table_svc.start_session("store001", 2)
+    delta = await table_svc.get_dashboard("store001", since=snapshot["version"])
+    assert delta["full"] is False
+    assert [t["table_number"] for t in delta["tables"]] == [2]
+    assert delta["version"] != snapshot["version"]
+
+    stale = await table_svc.get_dashboard("store001", since="unknown-version")
+    assert stale["full"] is True and len(stale["tables"]) == 3
+
+    # 다른 워커도 같은 데이터에서 같은 버전을 만듦
+    other_order = OrderService(datastore=ds, event_bus=EventBus(), menu_service=services["menu"])
+    other = TableService(datastore=ds, order_service=other_order)
+    assert await other.get_dashboard("store001", since=delta["version"]) == {
+        "version": delta["version"], "full": False, "tables": [],
+    }
+    await table_svc.end_session("store001", 1)
+    changed = await other.get_dashboard("store001", since=delta["version"])
+    assert changed["full"] is False
+    assert [t["table_number"] for t in changed["tables"]] == [1]
+
+
 @pytest.mark.asyncio
 async def test_end_session_no_active(services):
     await services["table"].create_table("store001", 1, "1234")
@@ -111,3 +166,78 @@ async def test_end_session_no_active(services):
 async def test_get_order_history_empty(services):
     history = await services["table"].get_order_history("store001", 1)
     assert history == []
+
+
+@pytest.mark.asyncio
+async def test_archive_sessions(services):
+    ds = services["ds"]
+    await ds.write("stores", "", [{"id": "store001"}])
+    await ds.write("sessions", "store001", [
+        {"id": "T01-20260101000000", "table_number": 1, "status": "ended",
+         "started_at": "2026-01-01T00:00:00Z", "expires_at": "2026-01-01T16:00:00Z",
+         "ended_at": "2026-01-01T02:00:00Z"},
+        {"id": "T02-20260101000000", "table_number": 2, "status": "active",
+         "started_at": "2026-01-01T00:00:00Z", "expires_at": "2026-01-01T16:00:00Z"},
+    ])
+    await services["table"].create_table("store001", 3, "1234")
+    live = await services["table"].start_session("store001", 3)
+
+    await ds.write("orders", "store001", [
+        {"id": "o-expired", "store_id": "store001", "table_number": 2,
+         "session_id": "T02-20260101000000", "status": "pending",
+         "total_amount": 9000, "created_at": "2026-01-01T01:00:00Z"},
+    ])
+
+    compactor = SessionCompactor(ds, services["table"], grace_seconds=60)
+    assert await compactor.run_once() == 2
+    assert [s["id"] for s in await ds.read("sessions", "store001")] == [live["id"]]
+    archived = await ds.read("session_archive", "store001")
+    assert {s["id"] for s in archived} == {"T01-20260101000000", "T02-20260101000000"}
+    assert all("archived_at" in s for s in archived)
+    expired = next(s for s in archived if s["id"] == "T02-20260101000000")
+    assert expired["status"] == "ended"
+    assert expired["ended_at"] == "2026-01-01T16:00:00Z"
+    # 만료된 활성 세션의 주문은 이력으로 이동
+    assert await ds.read("orders", "store001") == []
+    history = await services["table"].get_order_history("store001", 2)
+    assert [o["id"] for h in history for o in h["orders"]] == ["o-expired"]
+    assert await compactor.run_once() == 0
+
+
+@pytest.mark.asyncio
+async def test_compactor_purges_idempotency_keys(services):
+    ds = services["ds"]
+    await ds.write("stores", "", [{"id": "store001"}])
+    await ds.write("idempotency_keys", "store001", [
+        {"id": "store001:1:old", "fingerprint": "fp", "response": {},
+         "expires_at": "2026-01-01T00:00:00Z"},
+        {"id": "store001:1:live", "fingerprint": "fp", "response": {},
+         "expires_at": "2999-01-01T00:00:00Z"},
+    ])
+    compactor = SessionCompactor(
+        ds, services["table"], idempotency=IdempotencyStore(datastore=ds),
+    )
+    await compactor.run_once()
+    assert [r["id"] for r in await ds.read("idempotency_keys", "store001")] == ["store001:1:live"]
+
+
+@pytest.mark.asyncio
+async def test_compactor_loop_survives_errors(services, monkeypatch):
+    compactor = SessionCompactor(services["ds"], services["table"], interval=0.01)
+    calls = 0
+
+    async def flaky() -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise OSError("stores unreadable")
+        return 0
+
+    monkeypatch.setattr(compactor, "run_once", flaky)
+    compactor.start()
+    for _ in range(100):
+        if calls >= 2:
+            break
+        await asyncio.sleep(0.01)
+    await compactor.stop()
+    assert calls >= 2